@@ -1,8 +1,11 @@
+import atexit
+import functools
+import inspect
 import os
 import time
 from typing import Dict, Optional, Union
 
-from pymongo import MongoClient
+from pymongo import MongoClient, ReturnDocument, UpdateOne
 from pymongo.collection import Collection
 from pymongo.errors import ConfigurationError
 from pymongo.server_api import ServerApi
@@ -13,6 +16,42 @@ _users_collection: Optional[Collection] = None
 # Lazily-initialized collections that share the same Mongo client
 _giveaways_collection: Optional[Collection] = None
 _jump_state_collection: Optional[Collection] = None
+_roulette_escrow_collection: Optional[Collection] = None
+_roulette_escrow_owners_collection: Optional[Collection] = None
+
+# Per-user balance cache: user_id -> (balance, expires_at). update_user_balance writes
+# through; every other balance writer is wrapped with _evicts_cached_balance.
+# The cache is per process and several instances can run, so a cached balance may be stale:
+# use it for display and pre-checks only, and write balances with $inc (atomic_deduct_balance,
+# increment_user_balance, refund_balance) rather than writing back a value derived from it.
+BALANCE_CACHE_TTL = 30.0
+_balance_cache: Dict[int, tuple] = {}
+# user_id -> write generation, bumped on every balance write. get_user_balance only caches
+# what it read if no write landed meanwhile (a read racing a write can't re-cache the old value).
+_balance_cache_gen: Dict[int, int] = {}
+
+
+def _bump_balance_gen(user_id: int) -> None:
+    _balance_cache_gen[user_id] = _balance_cache_gen.get(user_id, 0) + 1
+
+
+def _evicts_cached_balance(func):
+    """Decorator for functions that change balance in Mongo directly: drop the cached
+    balance of the affected user(s) (first argument: an id, or a list/dict keyed by ids) afterwards."""
+    target_param = next(iter(inspect.signature(func).parameters))
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            return func(*args, **kwargs)
+        finally:
+            target = args[0] if args else kwargs.get(target_param)
+            for uid in (target if isinstance(target, (list, tuple, set, dict)) else (target,)):
+                if uid is not None:
+                    _bump_balance_gen(int(uid))
+                    _balance_cache.pop(int(uid), None)
+
+    return wrapper
 
 
 def _get_environment() -> str:
@@ -60,7 +99,7 @@ def _get_users_collection() -> Collection:
     _client = MongoClient(
         mongo_uri,
         server_api=ServerApi("1"),
-        maxPoolSize=10,  # Maximum connections in the pool
+        maxPoolSize=20,  # Maximum connections in the pool (sized for the asyncio.to_thread worker pool)
         minPoolSize=2,   # Keep minimum connections ready for faster response
         maxIdleTimeMS=300000,  # Close idle connections after 5 minutes (was 45s — too aggressive)
         connectTimeoutMS=5000,  # Fail fast if can't connect (5 seconds)
@@ -69,23 +108,27 @@ def _get_users_collection() -> Collection:
         retryWrites=True,  # Automatically retry write operations
         retryReads=True  # Automatically retry read operations
     )
+    atexit.register(_client.close)
     _users_collection = _client[db_name]["users"]
     return _users_collection
 
 
-def _get_giveaways_collection() -> Collection:
-    """Return the MongoDB collection used to store reaction-based giveaways."""
-    global _client, _giveaways_collection
-
-    # Ensure the Mongo client is initialized via the users collection helper
+def get_client() -> MongoClient:
+    """Return the process-wide MongoClient, creating it on first use."""
     if _client is None:
         _get_users_collection()
+    return _client
+
+
+def _get_giveaways_collection() -> Collection:
+    """Return the MongoDB collection used to store reaction-based giveaways."""
+    global _giveaways_collection
 
     if _giveaways_collection is not None:
         return _giveaways_collection
 
     db_name = os.getenv("MONGODB_DB_NAME", "slashgather")
-    _giveaways_collection = _client[db_name]["giveaways"]
+    _giveaways_collection = get_client()[db_name]["giveaways"]
     return _giveaways_collection
 
 
@@ -234,6 +277,7 @@ def increment_gather_stats(userid: int, category: str, item: str) -> None:
     )
 
 
+@_evicts_cached_balance
 def perform_gather_update(user_id: int, balance_increment: float, item_name: str, 
                           ripeness_name: str, category: str, apply_cooldown: bool = True,
                           increment_command_count: bool = False) -> bool:
@@ -254,25 +298,6 @@ def perform_gather_update(user_id: int, balance_increment: float, item_name: str
     users = _get_users_collection()
     _ensure_user_document(user_id)
     
-    # Get current total_items and bloom_cycle_plants for Tree Ring and sync logic
-    doc = users.find_one(
-        {"_id": int(user_id)},
-        {"gather_stats.total_items": 1, "bloom_cycle_plants": 1}
-    )
-    current_total = 0
-    current_bloom_cycle = 0
-    if doc:
-        if doc.get("gather_stats"):
-            current_total = int(doc.get("gather_stats", {}).get("total_items", 0))
-        current_bloom_cycle = int(doc.get("bloom_cycle_plants", 0))
-    
-    # Check if this gather will cross the tree-ring milestone (100 plants, or 50 with Future Gadget 204)
-    new_total = current_total + 1
-    interval = get_tree_ring_interval(user_id)
-    should_award_tree_ring = (new_total % interval == 0) and new_total > 0
-    
-    new_bloom_cycle = current_bloom_cycle + 1
-    
     # Almanac: record (item, ripeness) for /almanac completion
     almanac_key = _almanac_key(item_name, ripeness_name)
     update_ops = {
@@ -284,17 +309,13 @@ def perform_gather_update(user_id: int, balance_increment: float, item_name: str
             f"gather_stats.categories.{category}": 1,
             f"gather_stats.items.{item_name}": 1,
             "total_forage_count": 1,  # Keep in sync with gather_stats.total_items for backwards compatibility
+            "bloom_cycle_plants": 1,
         },
         "$set": {
-            "bloom_cycle_plants": new_bloom_cycle,
             f"almanac_entries.{almanac_key}": 1,
         }
     }
     
-    # Award Tree Ring if milestone reached
-    if should_award_tree_ring:
-        update_ops["$inc"]["tree_rings"] = 1
-    
     # Optionally include gather command count in the same write
     if increment_command_count:
         update_ops["$inc"]["gather_command_count"] = 1
@@ -305,16 +326,26 @@ def perform_gather_update(user_id: int, balance_increment: float, item_name: str
             update_ops["$set"] = {}
         update_ops["$set"]["last_gather_time"] = float(time.time())
     
-    users.update_one(
+    # Apply the gather and read back what the tree-ring check needs in the same round trip
+    doc = users.find_one_and_update(
         {"_id": int(user_id)},
         update_ops,
+        projection=_TREE_RING_PROJECTION,
         upsert=True,
+        return_document=ReturnDocument.AFTER,
     )
     
+    # Award Tree Ring if this gather crossed the milestone (100 plants, or 50 with Future Gadget 204)
+    new_total = int(((doc or {}).get("gather_stats") or {}).get("total_items", 0))
+    should_award_tree_ring = (new_total % _tree_ring_interval_from_doc(doc) == 0) and new_total > 0
+    if should_award_tree_ring:
+        users.update_one({"_id": int(user_id)}, {"$inc": {"tree_rings": 1}})
+    
     # Return whether a Tree Ring was awarded
     return should_award_tree_ring
 
 
+@_evicts_cached_balance
 def perform_batch_gather_update(user_id: int, results: list, apply_cooldown: bool = False,
                                 increment_command_count: bool = False) -> int:
     """
@@ -327,17 +358,6 @@ def perform_batch_gather_update(user_id: int, results: list, apply_cooldown: boo
     users = _get_users_collection()
     _ensure_user_document(user_id)
 
-    doc = users.find_one(
-        {"_id": int(user_id)},
-        {"gather_stats.total_items": 1, "bloom_cycle_plants": 1}
-    )
-    current_total = 0
-    current_bloom_cycle = 0
-    if doc:
-        if doc.get("gather_stats"):
-            current_total = int(doc.get("gather_stats", {}).get("total_items", 0))
-        current_bloom_cycle = int(doc.get("bloom_cycle_plants", 0))
-
     n = len(results)
     total_balance = sum(float(r["value"]) for r in results)
     items_inc = {}
@@ -358,35 +378,38 @@ def perform_batch_gather_update(user_id: int, results: list, apply_cooldown: boo
         rn = r.get("ripeness", "Normal")
         almanac_set[_almanac_key(name, rn)] = 1
 
-    interval = get_tree_ring_interval(user_id)
-    tree_rings = sum(1 for i in range(n) if ((current_total + 1 + i) % interval == 0) and (current_total + 1 + i) > 0)
-    new_bloom_cycle = current_bloom_cycle + n
-
     almanac_set_ops = {f"almanac_entries.{k}": 1 for k in almanac_set}
     update_ops = {
         "$inc": {
             "balance": total_balance,
             "gather_stats.total_items": n,
             "total_forage_count": n,
+            "bloom_cycle_plants": n,
             **items_inc,
             **ripeness_inc,
             **categories_inc,
             **gather_items_inc,
         },
-        "$set": {"bloom_cycle_plants": new_bloom_cycle, **almanac_set_ops},
+        "$set": almanac_set_ops,
     }
-    if tree_rings > 0:
-        update_ops["$inc"]["tree_rings"] = tree_rings
     if increment_command_count:
         update_ops["$inc"]["gather_command_count"] = n
     if apply_cooldown:
         update_ops["$set"]["last_gather_time"] = float(time.time())
 
-    users.update_one(
+    doc = users.find_one_and_update(
         {"_id": int(user_id)},
         update_ops,
+        projection=_TREE_RING_PROJECTION,
         upsert=True,
+        return_document=ReturnDocument.AFTER,
     )
+    new_total = int(((doc or {}).get("gather_stats") or {}).get("total_items", 0))
+    current_total = new_total - n
+    interval = _tree_ring_interval_from_doc(doc)
+    tree_rings = sum(1 for i in range(n) if ((current_total + 1 + i) % interval == 0) and (current_total + 1 + i) > 0)
+    if tree_rings > 0:
+        users.update_one({"_id": int(user_id)}, {"$inc": {"tree_rings": tree_rings}})
     return tree_rings
 
 
@@ -400,29 +423,44 @@ def init_database() -> None:
     """Initialise MongoDB indexes and verify connectivity."""
     users = _get_users_collection()
 
-    # Ensure common indexes exist
+    # Ensure common indexes exist. Per-user reads/writes (cooldowns, balance, inventory) key on
+    # _id == user_id and use the built-in _id index; these cover the non-_id filters.
     users.create_index("last_gather_time")
     users.create_index("total_forage_count")
+    users.create_index("premium_tier")
 
-    # Ensure events indexes exist
+    # Ensure events indexes exist (active/expired lookups filter on end_time alone, clear_event on event_id)
     events = _get_events_collection()
     events.create_index([("event_type", 1), ("end_time", 1)])
+    events.create_index("end_time")
+    events.create_index("event_id")
+
+    # Unresolved giveaways are reloaded on startup
+    _get_giveaways_collection().create_index("resolved")
 
     # Trigger a ping to verify connectivity
     users.database.client.admin.command("ping")
 
 
 def get_user_balance(user_id: int) -> float:
+    cached = _balance_cache.get(int(user_id))
+    if cached is not None and cached[1] > time.time():
+        return cached[0]
+
     users = _get_users_collection()
     _ensure_user_document(user_id)
 
+    gen = _balance_cache_gen.get(int(user_id), 0)
     doc = users.find_one({"_id": int(user_id)}, {"balance": 1})
     if not doc:
         return _get_default_balance()
     try:
-        return float(doc.get("balance", _get_default_balance()))
+        balance = float(doc.get("balance", _get_default_balance()))
     except (TypeError, ValueError):
         return _get_default_balance()
+    if _balance_cache_gen.get(int(user_id), 0) == gen:
+        _balance_cache[int(user_id)] = (balance, time.time() + BALANCE_CACHE_TTL)
+    return balance
 
 
 def update_user_balance(user_id: int, new_balance: float) -> None:
@@ -432,6 +470,27 @@ def update_user_balance(user_id: int, new_balance: float) -> None:
         {"$set": {"balance": float(new_balance)}},
         upsert=True,
     )
+    # Write-through: the value just written is the freshest balance we know of
+    _bump_balance_gen(int(user_id))
+    _balance_cache[int(user_id)] = (float(new_balance), time.time() + BALANCE_CACHE_TTL)
+
+
+def increment_user_balance(user_id: int, delta: float) -> float:
+    """Add *delta* (may be negative) to the user's balance with a single ``$inc`` and
+    return the new balance read back from the same write – no read-modify-write race."""
+    users = _get_users_collection()
+    _ensure_user_document(user_id)
+    doc = users.find_one_and_update(
+        {"_id": int(user_id)},
+        {"$inc": {"balance": round(float(delta), 2)}},
+        projection={"balance": 1},
+        upsert=True,
+        return_document=ReturnDocument.AFTER,
+    )
+    new_balance = round(float((doc or {}).get("balance", 0.0)), 2)
+    _bump_balance_gen(int(user_id))
+    _balance_cache[int(user_id)] = (new_balance, time.time() + BALANCE_CACHE_TTL)
+    return new_balance
 
 
 def get_user_beta_tester(user_id: int) -> bool:
@@ -656,6 +715,23 @@ def update_user_last_harvest_time(user_id: int, timestamp: float) -> None:
     )
 
 
+def claim_cooldown(user_id: int, field: str, seen_timestamp: float) -> bool:
+    """Atomically start a cooldown: set *field* (e.g. "last_gather_time") to now, but only if it
+    still holds *seen_timestamp* — the value the cooldown check passed on.
+
+    A compare-and-set on the user document, so of two concurrent commands that both passed the
+    check (in this process or another instance) exactly one gets True. A missing field counts as 0.
+    """
+    users = _get_users_collection()
+    seen = float(seen_timestamp or 0.0)
+    expected = {"$in": [seen, None]} if seen == 0 else seen
+    result = users.update_one(
+        {"_id": int(user_id), field: expected},
+        {"$set": {field: float(time.time())}},
+    )
+    return result.modified_count == 1
+
+
 def get_user_last_roulette_elimination_time(user_id: int) -> float:
     """Get user's last Russian Roulette elimination time."""
     users = _get_users_collection()
@@ -1031,11 +1107,6 @@ def add_gardener(user_id: int, gardener_id: int, price: float) -> bool:
     users = _get_users_collection()
     _ensure_user_document(user_id)
     
-    # Check if user has enough balance
-    current_balance = get_user_balance(user_id)
-    if current_balance < price:
-        return False
-    
     # Check if gardener slot is already taken
     existing_gardeners = get_user_gardeners(user_id)
     if any(g.get("id") == gardener_id for g in existing_gardeners):
@@ -1045,9 +1116,10 @@ def add_gardener(user_id: int, gardener_id: int, price: float) -> bool:
     if len(existing_gardeners) >= 5:
         return False
     
-    # Deduct money
-    new_balance = current_balance - price
-    update_user_balance(user_id, new_balance)
+    # Deduct money only if affordable
+    success, _ = atomic_deduct_balance(user_id, price)
+    if not success:
+        return False
     
     # Add gardener
     new_gardener = {
@@ -1126,16 +1198,14 @@ def update_virtual_gardener_stats(user_id: int, gardener_key: Union[str, int], m
 def set_gardener_has_tool(user_id: int, gardener_id: int, tool_price: float) -> bool:
     """Give a gardener their tool (deduct balance and set has_tool). Returns True if successful."""
     users = _get_users_collection()
-    current_balance = get_user_balance(user_id)
-    if current_balance < tool_price:
-        return False
     existing = get_user_gardeners(user_id)
     if not any(g.get("id") == gardener_id for g in existing):
         return False
     if any(g.get("id") == gardener_id and g.get("has_tool") for g in existing):
         return False  # already has tool
-    new_balance = current_balance - tool_price
-    update_user_balance(user_id, new_balance)
+    success, _ = atomic_deduct_balance(user_id, tool_price)
+    if not success:
+        return False
     users.update_one(
         {"_id": int(user_id), "gardeners.id": int(gardener_id)},
         {"$set": {"gardeners.$.has_tool": True}},
@@ -1191,15 +1261,11 @@ def add_gpu(user_id: int, gpu_name: str, price: float) -> bool:
     if gpu_name in existing_gpus:
         return False
     
-    # Check if user has enough balance
-    current_balance = get_user_balance(user_id)
-    if current_balance < price:
+    # Deduct money only if affordable
+    success, _ = atomic_deduct_balance(user_id, price)
+    if not success:
         return False
     
-    # Deduct money
-    new_balance = current_balance - price
-    update_user_balance(user_id, new_balance)
-    
     # Add GPU (only one of each type allowed)
     users.update_one(
         {"_id": int(user_id)},
@@ -1253,6 +1319,23 @@ def update_user_stock_holdings(user_id: int, symbol: str, amount: int) -> None:
     )
 
 
+def sell_user_stock_holdings(user_id: int, symbol: str, amount: int) -> Optional[int]:
+    """Remove *amount* shares only if the user holds that many, in one conditional ``$inc``.
+
+    Returns the shares left afterwards, or None if the user didn't hold enough.
+    """
+    users = _get_users_collection()
+    doc = users.find_one_and_update(
+        {"_id": int(user_id), f"stock_holdings.{symbol}": {"$gte": int(amount)}},
+        {"$inc": {f"stock_holdings.{symbol}": -int(amount)}},
+        projection={f"stock_holdings.{symbol}": 1},
+        return_document=ReturnDocument.AFTER,
+    )
+    if doc is None:
+        return None
+    return int((doc.get("stock_holdings") or {}).get(symbol, 0))
+
+
 # Bloom system functions
 def get_user_tree_rings(user_id: int) -> int:
     """Get user's Tree Rings."""
@@ -1341,13 +1424,24 @@ def has_shop_item(user_id: int, item_id: str) -> bool:
     return inv.get(item_id, 0) >= 1
 
 
+# Fields _tree_ring_interval_from_doc reads; gather updates project these on their find_one_and_update
+_TREE_RING_PROJECTION = {"gather_stats.total_items": 1, "shop_inventory.time_machine": 1, "premium_tier": 1}
+
+
+def _tree_ring_interval_from_doc(doc: Optional[Dict]) -> int:
+    """Tree-ring interval from a user document projected with _TREE_RING_PROJECTION."""
+    doc = doc or {}
+    time_machines = (doc.get("shop_inventory") or {}).get("time_machine", 0)
+    base = 50 if isinstance(time_machines, (int, float)) and time_machines >= 1 else 100
+    tier = int(doc.get("premium_tier", 0) or 0)
+    return max(1, base - PREMIUM_TREE_RING_REDUCTION.get(tier, 0))
+
+
 def get_tree_ring_interval(user_id: int) -> int:
     """Return plants needed per tree ring: 50 or 100 (Future Gadget 204) minus premium reduction (Seed 5, Sprout 8, Sapling 15, Evergreen 25)."""
-    inv = get_user_shop_inventory(user_id)
-    base = 50 if inv.get("time_machine", 0) >= 1 else 100
-    tier = get_user_premium_tier(user_id)
-    reduction = PREMIUM_TREE_RING_REDUCTION.get(tier, 0)
-    return max(1, base - reduction)
+    users = _get_users_collection()
+    _ensure_user_document(user_id)
+    return _tree_ring_interval_from_doc(users.find_one({"_id": int(user_id)}, _TREE_RING_PROJECTION))
 
 
 def get_user_daily_shop_purchases(user_id: int) -> tuple:
@@ -1514,6 +1608,7 @@ def set_user_bloom_count(user_id: int, bloom_count: int) -> None:
     )
 
 
+@_evicts_cached_balance
 def perform_bloom(user_id: int) -> None:
     """Reset user's progress while keeping lifetime plants (gather_stats.total_items, total_forage_count),
     Tree Rings, achievements, and incrementing bloom_count.
@@ -1589,12 +1684,8 @@ _EVENTS_CACHE_TTL: float = 30.0  # 30 seconds cache TTL
 
 def _get_events_collection() -> Collection:
     """Return the MongoDB collection used to store events."""
-    global _client
-    if _client is None:
-        _get_users_collection()  # Initialize client if needed
-    
     db_name = os.getenv("MONGODB_DB_NAME", "slashgather")
-    return _client[db_name]["events"]
+    return get_client()[db_name]["events"]
 
 
 def get_active_events() -> list[Dict]:
@@ -1798,6 +1889,7 @@ def reset_user_cooldowns(user_id: int) -> None:
     )
 
 
+@_evicts_cached_balance
 def wipe_user_money(user_id: int) -> None:
     """Reset user's money to default balance, stock holdings, and crypto holdings, keeping all upgrades."""
     users = _get_users_collection()
@@ -1817,6 +1909,7 @@ def wipe_user_money(user_id: int) -> None:
     )
 
 
+@_evicts_cached_balance
 def wipe_guild_money(user_ids: list[int]) -> int:
     """Bulk reset money/stock/crypto for many users. Returns number of documents modified."""
     if not user_ids:
@@ -1899,6 +1992,7 @@ def wipe_guild_crypto(user_ids: list[int]) -> int:
     return result.modified_count
 
 
+@_evicts_cached_balance
 def wipe_user_all(user_id: int) -> None:
     """Reset user's money and all upgrades (basket, shoes, gloves, soil, harvest upgrades, gardeners, GPUs, plants, stocks, crypto).
     Also resets all achievement-related stats and cooldowns."""
@@ -2116,6 +2210,7 @@ def _wipe_all_set_payload() -> dict:
     }
 
 
+@_evicts_cached_balance
 def wipe_guild_all(user_ids: list[int]) -> int:
     """Bulk reset all data for many users. Returns number of documents modified."""
     if not user_ids:
@@ -2302,13 +2397,11 @@ def get_all_dayboosts(user_id: int) -> dict[str, int]:
 # Jump system functions (per-guild counter + per-user daily tracking)
 def _get_jump_state_collection() -> Collection:
     """Return the MongoDB collection used to store per-guild jump state."""
-    global _client, _jump_state_collection
-    if _client is None:
-        _get_users_collection()
+    global _jump_state_collection
     if _jump_state_collection is not None:
         return _jump_state_collection
     db_name = os.getenv("MONGODB_DB_NAME", "slashgather")
-    _jump_state_collection = _client[db_name]["jump_state"]
+    _jump_state_collection = get_client()[db_name]["jump_state"]
     return _jump_state_collection
 
 
@@ -2698,6 +2791,7 @@ def get_user_invite_stats(user_id: int) -> Dict:
     }
 
 
+@_evicts_cached_balance
 def increment_invite_joins(inviter_id: int, reward_amount: float) -> None:
     """Increment invite joins count and add reward for the inviter."""
     users = _get_users_collection()
@@ -3002,6 +3096,7 @@ def reset_user_areas(user_id: int) -> None:
 # Atomic balance operations (for /imbue safety)
 # ---------------------------------------------------------------------------
 
+@_evicts_cached_balance
 def atomic_deduct_balance(user_id: int, cost: float) -> tuple:
     """Atomically deduct *cost* from the user's balance **only** if they can
     afford it.  Uses ``findOneAndUpdate`` so the check-and-deduct is a single
@@ -3028,9 +3123,11 @@ def atomic_deduct_balance(user_id: int, cost: float) -> tuple:
     return True, round(float(result.get("balance", 0)), 2)
 
 
+@_evicts_cached_balance
 def refund_balance(user_id: int, amount: float) -> None:
     """Add *amount* back to the user's balance (used when an operation that
-    already deducted money fails afterwards)."""
+    already deducted money fails afterwards, and for roulette refunds and
+    payouts).  A single ``$inc`` – no read-modify-write race."""
     users = _get_users_collection()
     users.update_one(
         {"_id": int(user_id)},
@@ -3039,6 +3136,113 @@ def refund_balance(user_id: int, amount: float) -> None:
     )
 
 
+@_evicts_cached_balance
+def refund_balances(amounts: Dict[int, float]) -> None:
+    """Add ``amounts[user_id]`` to each user's balance in one ``bulk_write``
+    round-trip (roulette cancel/cleanup refunds for every player at once)."""
+    if not amounts:
+        return
+    users = _get_users_collection()
+    users.bulk_write(
+        [
+            UpdateOne({"_id": int(uid)}, {"$inc": {"balance": round(float(amount), 2)}}, upsert=True)
+            for uid, amount in amounts.items()
+        ],
+        ordered=False,
+    )
+
+
+# Roulette escrow: buy-ins held by in-flight /russian games, so a crashed instance's stakes can be refunded.
+# Several bot instances can run at once (Cloud Run scale-out, overlapping revisions during a rollout), so
+# every escrow doc is owned by the process that wrote it, and each process heartbeats its ownership.
+# Only docs whose owner stopped heartbeating are refunded, by whichever live instance claims them first.
+ROULETTE_ESCROW_OWNER = f"{os.getpid()}-{os.urandom(6).hex()}"
+ROULETTE_ESCROW_OWNER_TTL = 300.0  # seconds without a heartbeat before an owner's games count as dead
+
+
+def _get_roulette_escrow_collection() -> Collection:
+    """Return the MongoDB collection tracking buy-ins of running roulette games (one doc per game)."""
+    global _roulette_escrow_collection
+    if _roulette_escrow_collection is not None:
+        return _roulette_escrow_collection
+    db_name = os.getenv("MONGODB_DB_NAME", "slashgather")
+    _roulette_escrow_collection = get_client()[db_name]["roulette_escrow"]
+    return _roulette_escrow_collection
+
+
+def _get_roulette_escrow_owners_collection() -> Collection:
+    """Return the MongoDB collection holding one heartbeat doc per bot process that may own escrow."""
+    global _roulette_escrow_owners_collection
+    if _roulette_escrow_owners_collection is not None:
+        return _roulette_escrow_owners_collection
+    db_name = os.getenv("MONGODB_DB_NAME", "slashgather")
+    _roulette_escrow_owners_collection = get_client()[db_name]["roulette_escrow_owners"]
+    return _roulette_escrow_owners_collection
+
+
+def _roulette_escrow_id(game_id: str) -> str:
+    # Game ids come from a per-process counter, so two instances can reuse one; scope them by owner
+    return f"{ROULETTE_ESCROW_OWNER}:{game_id}"
+
+
+def heartbeat_roulette_escrow_owner() -> None:
+    """Mark this process as alive, so other instances leave the escrow it owns alone."""
+    _get_roulette_escrow_owners_collection().update_one(
+        {"_id": ROULETTE_ESCROW_OWNER},
+        {"$set": {"seen": float(time.time())}},
+        upsert=True,
+    )
+
+
+def add_roulette_escrow(game_id: str, user_id: int, amount: float) -> None:
+    """Record that *user_id* has *amount* riding on roulette game *game_id* (owned by this process)."""
+    _get_roulette_escrow_collection().update_one(
+        {"_id": _roulette_escrow_id(game_id)},
+        {"$set": {f"stakes.{int(user_id)}": round(float(amount), 2), "owner": ROULETTE_ESCROW_OWNER}},
+        upsert=True,
+    )
+
+
+def release_roulette_escrow(game_id: str, user_id: int) -> None:
+    """Drop a player's escrow entry once their stake is settled (eliminated or cashed out)."""
+    _get_roulette_escrow_collection().update_one(
+        {"_id": _roulette_escrow_id(game_id)},
+        {"$unset": {f"stakes.{int(user_id)}": ""}},
+    )
+
+
+def clear_roulette_escrow(game_id: str) -> None:
+    """Drop the escrow doc of a roulette game that has ended, been cancelled or been refunded."""
+    _get_roulette_escrow_collection().delete_one({"_id": _roulette_escrow_id(game_id)})
+
+
+def refund_orphaned_roulette_escrow() -> int:
+    """Refund the buy-ins of games whose owning process has stopped heartbeating.
+
+    Each orphaned doc is claimed with ``find_one_and_delete`` before its stakes are credited, so
+    two instances sweeping at once can't both refund it, and a crash after the claim can't pay it
+    twice. Docs without an owner (written before ownership existed) are left for manual review.
+    Returns the number of stakes refunded.
+    """
+    col = _get_roulette_escrow_collection()
+    owners = _get_roulette_escrow_owners_collection()
+    cutoff = time.time() - ROULETTE_ESCROW_OWNER_TTL
+    live = {doc["_id"] for doc in owners.find({"seen": {"$gte": cutoff}}, {"_id": 1})}
+    live.add(ROULETTE_ESCROW_OWNER)
+    amounts: Dict[int, float] = {}
+    count = 0
+    for doc in col.find({"owner": {"$exists": True, "$nin": list(live)}}, {"_id": 1, "owner": 1}):
+        claimed = col.find_one_and_delete({"_id": doc["_id"], "owner": doc["owner"]})
+        if not claimed:
+            continue  # another instance got it first
+        for uid, amount in (claimed.get("stakes") or {}).items():
+            amounts[int(uid)] = amounts.get(int(uid), 0.0) + float(amount)
+            count += 1
+    refund_balances(amounts)
+    owners.delete_many({"seen": {"$lt": cutoff}, "_id": {"$ne": ROULETTE_ESCROW_OWNER}})
+    return count
+
+
 # ---------------------------------------------------------------------------
 # Full-data single-query fetchers (gather / harvest optimisation)
 # ---------------------------------------------------------------------------
@@ -3430,14 +3634,13 @@ def _empty_user_dossier() -> Dict:
     }
 
 
+@_evicts_cached_balance
 def perform_harvest_batch_update(
     user_id: int,
     items_inc: Dict[str, int],
     ripeness_inc: Dict[str, int],
     balance_increment: float,
     num_items: int,
-    pre_total_items: int,
-    pre_bloom_cycle: int,
     set_cooldown: bool = False,
     increment_command_count: bool = False,
     almanac_pairs: list = None,
@@ -3445,7 +3648,9 @@ def perform_harvest_batch_update(
     """Perform **all** harvest-related writes in a single MongoDB operation.
 
     Replaces N×3 individual writes (``add_user_item``, ``add_ripeness_stat``,
-    ``increment_total_items_only`` per item) with **one** ``update_one``.
+    ``increment_total_items_only`` per item) with **one** ``find_one_and_update``,
+    which also returns the post-harvest total and tree-ring interval fields; a
+    follow-up ``$inc`` of ``tree_rings`` is only sent when a milestone was crossed.
 
     When *set_cooldown* is True the harvest cooldown is set in the same write.
     When *increment_command_count* is True the harvest_command_count is
@@ -3457,22 +3662,12 @@ def perform_harvest_batch_update(
     users = _get_users_collection()
     _ensure_user_document(user_id)
 
-    new_total = pre_total_items + num_items
-    interval = get_tree_ring_interval(user_id)
-    tree_rings_to_award = 0
-    for milestone in range(interval, new_total + 1, interval):
-        if pre_total_items < milestone <= new_total:
-            tree_rings_to_award += 1
-
-    new_bloom_cycle = pre_bloom_cycle + num_items
-
     inc_ops: Dict[str, float | int] = {
         "balance": float(balance_increment),
         "gather_stats.total_items": num_items,
         "total_forage_count": num_items,
+        "bloom_cycle_plants": num_items,
     }
-    if tree_rings_to_award > 0:
-        inc_ops["tree_rings"] = tree_rings_to_award
     if increment_command_count:
         inc_ops["harvest_command_count"] = 1
 
@@ -3482,22 +3677,35 @@ def perform_harvest_batch_update(
     for ripeness_name, count in ripeness_inc.items():
         inc_ops[f"ripeness_stats.{ripeness_name}"] = count
 
-    set_ops: Dict[str, object] = {"bloom_cycle_plants": new_bloom_cycle}
+    set_ops: Dict[str, object] = {}
     if set_cooldown:
         set_ops["last_harvest_time"] = float(time.time())
     if almanac_pairs:
         for (item_name, ripeness_name) in almanac_pairs:
             set_ops[f"almanac_entries.{_almanac_key(item_name, ripeness_name)}"] = 1
 
-    users.update_one(
+    update_ops: Dict[str, Dict] = {"$inc": inc_ops}
+    if set_ops:
+        update_ops["$set"] = set_ops
+
+    doc = users.find_one_and_update(
         {"_id": int(user_id)},
-        {
-            "$inc": inc_ops,
-            "$set": set_ops,
-        },
+        update_ops,
+        projection=_TREE_RING_PROJECTION,
         upsert=True,
+        return_document=ReturnDocument.AFTER,
     )
 
+    new_total = int(((doc or {}).get("gather_stats") or {}).get("total_items", 0))
+    pre_total_items = new_total - num_items
+    interval = _tree_ring_interval_from_doc(doc)
+    tree_rings_to_award = 0
+    for milestone in range(interval, new_total + 1, interval):
+        if pre_total_items < milestone <= new_total:
+            tree_rings_to_award += 1
+    if tree_rings_to_award > 0:
+        users.update_one({"_id": int(user_id)}, {"$inc": {"tree_rings": tree_rings_to_award}})
+
     return tree_rings_to_award
 
 
@@ -3505,6 +3713,7 @@ def perform_harvest_batch_update(
 # Steal: revert victim / apply to stealer (for gather and harvest)
 # ---------------------------------------------------------------------------
 
+@_evicts_cached_balance
 def steal_revert_gather(
     victim_id: int,
     value: float,
@@ -3563,6 +3772,7 @@ def steal_apply_gather(
     return result
 
 
+@_evicts_cached_balance
 def steal_revert_harvest(
     victim_id: int,
     items_inc: Dict[str, int],
@@ -3605,24 +3815,12 @@ def steal_apply_harvest(
 ) -> int:
     """Apply a stolen harvest to the stealer. Returns number of tree rings awarded."""
     users = _get_users_collection()
-    _ensure_user_document(stealer_id)
-    doc = users.find_one(
-        {"_id": int(stealer_id)},
-        {"gather_stats.total_items": 1, "bloom_cycle_plants": 1},
-    )
-    pre_total = 0
-    pre_bloom = 0
-    if doc:
-        pre_total = int(doc.get("gather_stats", {}).get("total_items", 0))
-        pre_bloom = int(doc.get("bloom_cycle_plants", 0))
     tree_rings = perform_harvest_batch_update(
         stealer_id,
         items_inc=items_inc,
         ripeness_inc=ripeness_inc,
         balance_increment=balance_increment,
         num_items=num_items,
-        pre_total_items=pre_total,
-        pre_bloom_cycle=pre_bloom,
         set_cooldown=False,
         increment_command_count=False,
     )
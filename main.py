@@ -3,6 +3,9 @@ from discord import app_commands
 from discord.ext import commands
 from discord.http import Route
 import logging
+from logging.handlers import QueueHandler, QueueListener
+import queue
+import atexit
 from collections import Counter
 from dotenv import load_dotenv
 import os
@@ -10,8 +13,8 @@ import random
 import time
 import asyncio
 from concurrent.futures import ThreadPoolExecutor
-import uuid
-import threading
+import itertools
+import bisect
 import datetime
 from zoneinfo import ZoneInfo
 import subprocess
@@ -25,6 +28,11 @@ import yfinance as yf
 warnings.filterwarnings("ignore", category=FutureWarning, message=".*Timestamp.utcnow.*")
 warnings.filterwarnings("ignore", category=DeprecationWarning, message=".*Timestamp.utcnow.*")
 
+# Embed colors as raw ints (same values as discord.Color.green()/red()/dark_red()); Embed accepts ints directly
+GREEN = 0x2ecc71
+RED = 0xe74c3c
+DARK_RED = 0x992d22
+
 
 def _now_est() -> datetime.datetime:
     """Current time in Eastern (America/New_York). DST-aware: EST in winter, EDT in summer."""
@@ -71,16 +79,25 @@ def _redact_mongo_uri(uri: str | None) -> str:
 environment = _resolve_environment()
 is_production = environment.lower() == 'production'
 
+# Game randomness (gather rolls, roulette, etc.) deliberately uses the module-level Mersenne Twister
+# in `random`, not `secrets`/SystemRandom: it's far cheaper per call and plenty for game mechanics.
+# RANDOM_SEED makes runs reproducible for local testing; leave it unset in production.
+_random_seed = os.getenv("RANDOM_SEED")
+if _random_seed:
+    random.seed(int(_random_seed) if _random_seed.lstrip("-").isdigit() else _random_seed)
+
 # Database helpers (MongoDB only)
 from database import (
     init_database,
     ping_database,
     get_user_balance,
     update_user_balance,
+    increment_user_balance,
     get_user_last_gather_time,
     update_user_last_gather_time,
     get_user_last_harvest_time,
     update_user_last_harvest_time,
+    claim_cooldown,
     get_user_last_roulette_elimination_time,
     update_user_last_roulette_elimination_time,
     increment_forage_count,
@@ -119,6 +136,7 @@ from database import (
     get_user_notification_channel,
     get_user_stock_holdings,
     update_user_stock_holdings,
+    sell_user_stock_holdings,
     get_active_events,
     get_active_events_cached,
     get_active_event_by_type,
@@ -217,6 +235,12 @@ from database import (
     reset_user_areas,
     atomic_deduct_balance,
     refund_balance,
+    refund_balances,
+    add_roulette_escrow,
+    release_roulette_escrow,
+    clear_roulette_escrow,
+    heartbeat_roulette_escrow_owner,
+    refund_orphaned_roulette_escrow,
     get_user_gather_full_data,
     get_user_harvest_full_data,
     get_user_dossier,
@@ -275,10 +299,24 @@ file_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(m
 file_handler.setFormatter(file_formatter)
 file_handler.setLevel(logging.DEBUG)  # Log everything to file
 
+# Warnings and errors (with tracebacks) also go to stderr for Cloud Run logs
+console_handler = logging.StreamHandler()
+console_handler.setFormatter(file_formatter)
+console_handler.setLevel(logging.WARNING)
+
+# Handlers run on a QueueListener thread so file/stderr writes never block the event loop
+_log_queue = queue.Queue(-1)
+_log_listener = QueueListener(_log_queue, file_handler, console_handler, respect_handler_level=True)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
 # Configure root logger
 root_logger = logging.getLogger()
 root_logger.setLevel(logging.INFO)  # Set root logger to INFO
-root_logger.addHandler(file_handler)
+root_logger.addHandler(QueueHandler(_log_queue))
+
+# Bot logger for command/task error reporting
+logger = logging.getLogger("slashgather")
 
 # Set discord.py logger to INFO to reduce terminal clutter (DEBUG is too verbose)
 discord_logger = logging.getLogger('discord')
@@ -292,7 +330,10 @@ intents = discord.Intents.default()
 intents.message_content = True
 intents.members = True
 intents.invites = True
-bot = commands.Bot(command_prefix='/', intents=intents)
+# Only user pings resolve by default; the few @here announcements opt in with MENTION_HERE
+MENTION_USER_ONLY = discord.AllowedMentions(users=True, roles=False, everyone=False, replied_user=False)
+MENTION_HERE = discord.AllowedMentions(users=True, roles=False, everyone=True, replied_user=False)
+bot = commands.Bot(command_prefix='/', intents=intents, allowed_mentions=MENTION_USER_ONLY)
 
 
 # ── Global error handler ────────────────────────────────────────────────────
@@ -426,7 +467,7 @@ async def safe_interaction_response(interaction: discord.Interaction,
     except discord.errors.NotFound:
         # Interaction expired
         print(f"Interaction expired for user {interaction.user.id if hasattr(interaction, 'user') else 'unknown'}")
-    except Exception as e:
+    except Exception:
         # Try to send error message
         try:
             if hasattr(interaction, 'response') and not interaction.response.is_done():
@@ -435,7 +476,7 @@ async def safe_interaction_response(interaction: discord.Interaction,
                 await interaction.followup.send(error_message, ephemeral=True)
         except:
             pass
-        print(f"Error in interaction response: {e}")
+        logger.exception("Error in interaction response")
     return None
 
 # Helper function to safely defer an interaction
@@ -836,6 +877,13 @@ ENCHANTMENT_RARITIES = [
     {"name": "CELESTIAL",  "weight": 0.1234},     # 0.1234%
     {"name": "SECRET",     "weight": 0.01666},    # 0.01666%
 ]
+# Rarity names and cumulative weights for roll_attunement, built once; the Commoner's Respite
+# variant zeroes COMMON (random.choices normalizes, so no renormalization is needed)
+ENCHANTMENT_RARITY_NAMES = tuple(r["name"] for r in ENCHANTMENT_RARITIES)
+ENCHANTMENT_RARITY_CUM_WEIGHTS = tuple(itertools.accumulate(r["weight"] for r in ENCHANTMENT_RARITIES))
+ENCHANTMENT_RARITY_CUM_WEIGHTS_NO_COMMON = tuple(itertools.accumulate(
+    0.0 if r["name"] == "COMMON" else r["weight"] for r in ENCHANTMENT_RARITIES
+))
 
 RARITY_COLORS = {
     "COMMON":     0x808080,  # gray
@@ -1179,18 +1227,15 @@ def roll_attunement(tool_type: str, user_id: int = None, exclude_enchant: dict =
     enchant_pool = HOE_ENCHANTMENTS if tool_type == "hoe" else TRACTOR_ENCHANTMENTS
     exclude_name = (exclude_enchant or {}).get("name")
 
+    # Exclude COMMON for Commoner's Respite (checked once, not per re-roll)
+    if user_id and has_shop_item(user_id, "commoners_respite"):
+        rarity_cum_weights = ENCHANTMENT_RARITY_CUM_WEIGHTS_NO_COMMON
+    else:
+        rarity_cum_weights = ENCHANTMENT_RARITY_CUM_WEIGHTS
+
     for _ in range(100):  # max attempts to avoid infinite loop
         # Pick rarity using weighted random
-        rarity_names = [r["name"] for r in ENCHANTMENT_RARITIES]
-        rarity_weights = [r["weight"] for r in ENCHANTMENT_RARITIES]
-        if user_id and has_shop_item(user_id, "commoners_respite"):
-            # Exclude COMMON: set its weight to 0 and renormalize
-            rarity_weights = [0.0 if name == "COMMON" else w for name, w in zip(rarity_names, rarity_weights)]
-            total = sum(rarity_weights)
-            if total <= 0:
-                total = 1.0
-            rarity_weights = [w / total for w in rarity_weights]
-        chosen_rarity = random.choices(rarity_names, weights=rarity_weights, k=1)[0]
+        chosen_rarity = random.choices(ENCHANTMENT_RARITY_NAMES, cum_weights=rarity_cum_weights, k=1)[0]
 
         # Pick random enchant from that rarity
         enchant = random.choice(enchant_pool[chosen_rarity])
@@ -1200,7 +1245,7 @@ def roll_attunement(tool_type: str, user_id: int = None, exclude_enchant: dict =
         return dict(enchant)
 
     # Fallback: return first enchant of a random rarity (should not happen in practice)
-    chosen_rarity = random.choice(rarity_names)
+    chosen_rarity = random.choice(ENCHANTMENT_RARITY_NAMES)
     enchant = random.choice(enchant_pool[chosen_rarity])
     return dict(enchant)
 
@@ -1394,6 +1439,37 @@ def set_harvest_cooldown(user_id):
     update_user_last_harvest_time(user_id, time.time())
 
     
+# guild id -> {role name: role}; built from guild.roles on first use, dropped on any role create/update/delete
+_role_cache: dict[int, dict[str, discord.Role]] = {}
+
+
+def _get_role(guild: discord.Guild, name: str) -> discord.Role | None:
+    """Role lookup by name via the per-guild cache (first match wins, like discord.utils.get)."""
+    roles_by_name = _role_cache.get(guild.id)
+    if roles_by_name is None:
+        roles_by_name = {}
+        for role in guild.roles:
+            roles_by_name.setdefault(role.name, role)
+        _role_cache[guild.id] = roles_by_name
+    return roles_by_name.get(name)
+
+
+# guild id -> text channel name -> channel id (invalidated in on_guild_channel_create/update/delete)
+_text_channel_cache: dict[int, dict[str, int]] = {}
+
+
+def _get_text_channel(guild: discord.Guild, name: str) -> discord.TextChannel | None:
+    """Text channel lookup by name via the per-guild cache (first match wins, like discord.utils.get)."""
+    ids_by_name = _text_channel_cache.get(guild.id)
+    if ids_by_name is None:
+        ids_by_name = {}
+        for channel in guild.text_channels:
+            ids_by_name.setdefault(channel.name, channel.id)
+        _text_channel_cache[guild.id] = ids_by_name
+    channel_id = ids_by_name.get(name)
+    return guild.get_channel(channel_id) if channel_id is not None else None
+
+
 async def assign_bloom_rank_role(member: discord.Member, guild: discord.Guild) -> tuple[str | None, str | None]:
     """Assign Bloom Rank role to user based on their bloom_count."""
     user_id = member.id
@@ -1423,7 +1499,7 @@ async def assign_bloom_rank_role(member: discord.Member, guild: discord.Guild) -
     
     # Remove the old bloom rank role if they had one
     if previous_role_name:
-        old_role = discord.utils.get(guild.roles, name=previous_role_name)
+        old_role = _get_role(guild, previous_role_name)
         if old_role:
             try:
                 await member.remove_roles(old_role)
@@ -1432,7 +1508,7 @@ async def assign_bloom_rank_role(member: discord.Member, guild: discord.Guild) -
     
     # Assign the new bloom rank role
     if target_role_name:
-        new_role = discord.utils.get(guild.roles, name=target_role_name)
+        new_role = _get_role(guild, target_role_name)
         if new_role:
             try:
                 await member.add_roles(new_role)
@@ -1466,37 +1542,15 @@ async def assign_gatherer_role(member: discord.Member, guild: discord.Guild, for
         member = await guild.fetch_member(user_id)
     except Exception:
         pass  # use passed-in member if fetch fails
-    planter_roles = ["PLANTER I", "PLANTER II", "PLANTER III", "PLANTER IV", "PLANTER V", "PLANTER VI", "PLANTER VII", "PLANTER VIII", "PLANTER IX", "PLANTER X"]
-
     # Find the user's current planter role
-    previous_role_name = next((role.name for role in member.roles if role.name in planter_roles), None)
+    previous_role_name = next((role.name for role in member.roles if role.name in PLANTER_ROLES), None)
 
     # Target role: forced (e.g. after bloom) or derived from bloom_cycle_plants
-    if force_planter_role and force_planter_role in planter_roles:
+    if force_planter_role and force_planter_role in PLANTER_ROLES:
         target_role_name = force_planter_role
     else:
         cycle_plants = get_user_bloom_cycle_plants(user_id)  # Use bloom cycle counter (resets per bloom)
-        target_role_name = None
-        if cycle_plants < 50:
-            target_role_name = "PLANTER I"
-        elif cycle_plants < 150:
-            target_role_name = "PLANTER II"
-        elif cycle_plants < 300:
-            target_role_name = "PLANTER III"
-        elif cycle_plants < 500:
-            target_role_name = "PLANTER IV"
-        elif cycle_plants < 1000:
-            target_role_name = "PLANTER V"
-        elif cycle_plants < 2000:
-            target_role_name = "PLANTER VI"
-        elif cycle_plants < 4000:
-            target_role_name = "PLANTER VII"
-        elif cycle_plants < 10000:
-            target_role_name = "PLANTER VIII"
-        elif cycle_plants < 15000:
-            target_role_name = "PLANTER IX"
-        else:  # 15000+
-            target_role_name = "PLANTER X"
+        target_role_name = PLANTER_TIERS[bisect.bisect_right(PLANTER_THRESHOLDS, cycle_plants)]
     # If the target role is the same as current role, no changes needed
     if target_role_name == previous_role_name:
         return previous_role_name, None
@@ -1504,7 +1558,7 @@ async def assign_gatherer_role(member: discord.Member, guild: discord.Guild, for
 
     # Remove the old planter role if they had one
     if previous_role_name:
-        old_role = discord.utils.get(guild.roles, name=previous_role_name)
+        old_role = _get_role(guild, previous_role_name)
         if old_role:
             try:
                 await member.remove_roles(old_role)
@@ -1513,7 +1567,7 @@ async def assign_gatherer_role(member: discord.Member, guild: discord.Guild, for
 
     # Assign the new planter role
     if target_role_name:
-        new_role = discord.utils.get(guild.roles, name=target_role_name)
+        new_role = _get_role(guild, target_role_name)
         if new_role:
             try:
                 await member.add_roles(new_role)
@@ -1845,6 +1899,7 @@ BEE_SWARM_LARVA_CHANCE = 0.40  # 40% chance for Larva after defeating Bee Swarm
 LARVA_TIMEOUT_SEC = 10.0
 
 PVE_WILD_ANIMALS_UNDERGROUND_JUNGLE_SINGLE = [a for a in PVE_WILD_ANIMALS_UNDERGROUND_JUNGLE if not a.get("is_swarm_bee")]
+PVE_JUNGLE_SINGLE_CUM_WEIGHTS = tuple(itertools.accumulate(a.get("spawn_weight", 1.0) for a in PVE_WILD_ANIMALS_UNDERGROUND_JUNGLE_SINGLE))
 BEE_ANIMAL = next(a for a in PVE_WILD_ANIMALS_UNDERGROUND_JUNGLE if a.get("is_swarm_bee"))
 
 # Tracks active PvE events per channel: channel_id -> PvE event data
@@ -2077,6 +2132,17 @@ PLANTER_RANK_ORDER = {
     "PLANTER V": 5, "PLANTER VI": 6, "PLANTER VII": 7, "PLANTER VIII": 8,
     "PLANTER IX": 9, "PLANTER X": 10
 }
+PLANTER_ROLES = frozenset(PLANTER_RANK_ORDER)
+# PLANTER I..X in order; PLANTER_TIERS[bisect_right(PLANTER_THRESHOLDS, plants)] is the tier for a plant count
+PLANTER_TIERS = tuple(sorted(PLANTER_RANK_ORDER, key=PLANTER_RANK_ORDER.get))
+PLANTER_THRESHOLDS = (50, 150, 300, 500, 1000, 2000, 4000, 10000, 15000)
+PLANTER_II_PLUS = PLANTER_ROLES - {"PLANTER I"}
+
+
+def planter_role_is_current(member, cycle_plants: int) -> bool:
+    """True if the member's cached roles already hold the PLANTER tier for cycle_plants (no API/DB call needed)."""
+    target = PLANTER_TIERS[bisect.bisect_right(PLANTER_THRESHOLDS, cycle_plants)]
+    return any(role.name == target for role in getattr(member, "roles", ()))
 
 
 def get_user_planter_level(member) -> int:
@@ -3354,26 +3420,8 @@ def get_planter_level_from_total_items(total_items: int) -> int:
     """
     if total_items == 0:
         return 0  # Unranked (no PLANTER role yet - new users/prestige)
-    elif total_items < 50:
-        return 1  # PLANTER I role -> achievement level 1 "Just Starting Out"
-    elif total_items < 150:
-        return 2  # PLANTER II role -> achievement level 2 "Wearing The Plants"
-    elif total_items < 300:
-        return 3  # PLANTER III role -> achievement level 3 "Planter Tree"
-    elif total_items < 500:
-        return 4  # PLANTER IV role -> achievement level 4
-    elif total_items < 1000:
-        return 5  # PLANTER V role -> achievement level 5
-    elif total_items < 2000:
-        return 6  # PLANTER VI role -> achievement level 6
-    elif total_items < 4000:
-        return 7  # PLANTER VII role -> achievement level 7
-    elif total_items < 10000:
-        return 8  # PLANTER VIII role -> achievement level 8
-    elif total_items < 15000:
-        return 9  # PLANTER IX role -> achievement level 9
-    else:
-        return 10  # PLANTER X role -> achievement level 10
+    # PLANTER I..X role -> achievement level 1..10
+    return bisect.bisect_right(PLANTER_THRESHOLDS, total_items) + 1
 
 
 def get_achievement_multiplier(user_id: int, full_data=None) -> float:
@@ -4043,40 +4091,10 @@ def _perform_gather_for_user_sync(user_id: int, apply_cooldown: bool = True,
         else:
             increment_jackpot_dodge()
 
-    # Choose a random item, with event modifications
-    items_to_choose = GATHERABLE_ITEMS.copy()
-    weights = None
-    
-    # Apply category-specific event effects (May Flowers, Fruit Festival, Vegetable Boom)
-    if hourly_event:
-        event_id = hourly_event.get("effects", {}).get("event_id", "")
-        if event_id == "may_flowers":
-            # Increase flower weights by 60%
-            weights = []
-            for item in GATHERABLE_ITEMS:
-                if item["category"] == "Flower":
-                    weights.append(1.6)  # 60% increase
-                else:
-                    weights.append(1.0)
-        elif event_id == "fruit_festival":
-            # Increase fruit weights by 50%
-            weights = []
-            for item in GATHERABLE_ITEMS:
-                if item["category"] == "Fruit":
-                    weights.append(1.5)  # 50% increase
-                else:
-                    weights.append(1.0)
-        elif event_id == "vegetable_boom":
-            # Increase vegetable weights by 50%
-            weights = []
-            for item in GATHERABLE_ITEMS:
-                if item["category"] == "Vegetable":
-                    weights.append(1.5)  # 50% increase
-                else:
-                    weights.append(1.0)
-    
-    if weights:
-        item = random.choices(GATHERABLE_ITEMS, weights=weights, k=1)[0]
+    # Choose a random item, with category-specific event effects (May Flowers, Fruit Festival, Vegetable Boom)
+    cum_weights = GATHER_EVENT_CUM_WEIGHTS.get(hourly_event.get("effects", {}).get("event_id", "")) if hourly_event else None
+    if cum_weights:
+        item = random.choices(GATHERABLE_ITEMS, cum_weights=cum_weights, k=1)[0]
     else:
         item = random.choice(GATHERABLE_ITEMS)
     
@@ -4103,38 +4121,25 @@ def _perform_gather_for_user_sync(user_id: int, apply_cooldown: bool = True,
         elif event_id == "vegetable_boom" and item["category"] == "Vegetable":
             base_value *= 2  # Double vegetable prices
     
-    if item["category"] == "Fruit":
-        ripeness_list = LEVEL_OF_RIPENESS_FRUITS
-    elif item["category"] == "Vegetable":
-        ripeness_list = LEVEL_OF_RIPENESS_VEGETABLES
-    elif item["category"] == "Flower":
-        ripeness_list = LEVEL_OF_RIPENESS_FLOWERS
-    else:
-        ripeness_list = []
+    ripeness_list = RIPENESS_BY_CATEGORY.get(item["category"])
 
     if ripeness_list:
-        # Use weighted random selection for the chance
-        weights = [r["chance"] for r in ripeness_list]
+        # Use weighted random selection for the chance (precomputed cumulative weights)
+        cum_weights = RIPENESS_CUM_WEIGHTS[item["category"]]
         
         # Apply Perfect Ripeness event (hourly) or Ripeness Rush event (daily)
         hourly_event_id = hourly_event.get("effects", {}).get("event_id", "") if hourly_event else ""
         daily_event_id = daily_event.get("effects", {}).get("event_id", "") if daily_event else ""
         if hourly_event_id == "perfect_ripeness":
             # Increase all ripeness multipliers by 50%
-            ripeness = random.choices(ripeness_list, weights=weights, k=1)[0]
+            ripeness = random.choices(ripeness_list, cum_weights=cum_weights, k=1)[0]
             ripeness_multiplier = ripeness["multiplier"] * 1.5
         elif daily_event_id == "ripeness_rush":
             # Double perfect ripeness chance
-            weights = []
-            for r in ripeness_list:
-                if "Perfect" in r["name"]:
-                    weights.append(r["chance"] * 2)
-                else:
-                    weights.append(r["chance"])
-            ripeness = random.choices(ripeness_list, weights=weights, k=1)[0]
+            ripeness = random.choices(ripeness_list, cum_weights=RIPENESS_RUSH_CUM_WEIGHTS[item["category"]], k=1)[0]
             ripeness_multiplier = ripeness["multiplier"]
         else:
-            ripeness = random.choices(ripeness_list, weights=weights, k=1)[0]
+            ripeness = random.choices(ripeness_list, cum_weights=cum_weights, k=1)[0]
             ripeness_multiplier = ripeness["multiplier"]
         
         final_value = base_value * ripeness_multiplier
@@ -4172,7 +4177,7 @@ def _perform_gather_for_user_sync(user_id: int, apply_cooldown: bool = True,
     gmo_chance = min(gmo_chance, 1.0)
     
     # See if the gathered item is a GMO
-    is_gmo = random.choices([True, False], weights=[gmo_chance, 1-gmo_chance], k=1)[0]
+    is_gmo = random.random() < gmo_chance
     if is_gmo:
         final_value *= 2
     
@@ -4208,7 +4213,7 @@ def _perform_gather_for_user_sync(user_id: int, apply_cooldown: bool = True,
     final_value *= basket_multiplier * value_multiplier
 
     # Apply seasonal month bonus
-    month_index = random.randint(0, 11)
+    month_index = random.randrange(len(MONTHS))
     month_name = MONTHS[month_index]
     seasonal_multiplier, seasonal_label = get_seasonal_multiplier(month_index, item["category"])
     final_value *= seasonal_multiplier
@@ -4290,7 +4295,9 @@ def _perform_gather_for_user_sync(user_id: int, apply_cooldown: bool = True,
     beta_tester_mult = get_beta_tester_money_multiplier(user_id)
     server_booster_mult = get_server_booster_money_multiplier(user_id)
     server_tag_mult = get_server_tag_money_multiplier(user_id)
-    premium_mult = get_premium_tier_money_multiplier(user_id)
+    # Tier itself is returned too, so the embed can label the premium line without another read on the event loop
+    premium_tier = get_user_premium_tier(user_id)
+    premium_mult = PREMIUM_MONEY_MULTIPLIERS.get(premium_tier, 1.0)
     nether_star_mult = get_nether_star_money_multiplier(user_id)
     black_shard_mult = get_black_shard_money_multiplier(user_id)
     shadow_crystal_mult = get_shadow_crystal_money_multiplier(user_id)
@@ -4355,6 +4362,7 @@ def _perform_gather_for_user_sync(user_id: int, apply_cooldown: bool = True,
         "ripeness": ripeness["name"],
         "is_gmo": is_gmo,
         "category": item["category"],
+        "num_items": 1,  # items this gather added to gather_stats / bloom_cycle_plants
         "new_balance": new_balance,
         "enchant_money_bonus": enchant_money_bonus,
         "is_critical_gather": is_critical_gather,
@@ -4366,6 +4374,7 @@ def _perform_gather_for_user_sync(user_id: int, apply_cooldown: bool = True,
         "extra_money_from_server_booster": extra_money_from_server_booster,
         "server_tag_multiplier": server_tag_mult,
         "extra_money_from_server_tag": extra_money_from_server_tag,
+        "premium_tier": premium_tier,
         "premium_tier_multiplier": premium_mult,
         "extra_money_from_premium": extra_money_from_premium,
         "nether_star_multiplier": nether_star_mult,
@@ -4471,6 +4480,16 @@ GATHERABLE_ITEMS = [
     {"category": "Vegetable","name": "Sweet Potato 🍠", "base_value": 13.13},
 ]
 
+GATHERABLE_CATEGORY_BY_NAME = {i["name"]: i["category"] for i in GATHERABLE_ITEMS}
+
+# Hourly category events (May Flowers, Fruit Festival, Vegetable Boom): event id -> cumulative item
+# weights for random.choices(GATHERABLE_ITEMS, cum_weights=...), built once instead of per gather
+_GATHER_EVENT_CATEGORY_BOOST = {"may_flowers": ("Flower", 1.6), "fruit_festival": ("Fruit", 1.5), "vegetable_boom": ("Vegetable", 1.5)}
+GATHER_EVENT_CUM_WEIGHTS = {
+    event_id: list(itertools.accumulate(boost if i["category"] == cat else 1.0 for i in GATHERABLE_ITEMS))
+    for event_id, (cat, boost) in _GATHER_EVENT_CATEGORY_BOOST.items()
+}
+
 # Almanac: undiscovered (plant, ripeness) shown as 3x this emoji (custom :HIDDEN:)
 ALMANAC_HIDDEN_EMOJI = "<:HIDDEN:1478915430390304788>"
 
@@ -4494,6 +4513,16 @@ def get_item_display_emoji(item_name: str) -> str:
         return item_name.split()[-1]
     return item_name[-1] if item_name else ""
 
+def _harvest_item_lines(items) -> list:
+    """One compact display line per harvested item: imbue emoji, item emoji, (RIPENESS), GMO tag."""
+    lines = []
+    for item in items:
+        rip_em = get_ripeness_imbue_emoji(item.get("ripeness", ""))
+        prefix = f"{rip_em} " if rip_em else ""
+        gmo = " GMO! ✨" if item["is_gmo"] else ""
+        lines.append(f"{prefix}{get_item_display_emoji(item['name'])} (**{item['ripeness'].upper()}**){gmo}")
+    return lines
+
 # Item descriptions for almanac
 ITEM_DESCRIPTIONS = {
     "Rose 🌹": "A classic symbol of love and passion!",
@@ -4603,6 +4632,24 @@ LEVEL_OF_RIPENESS_FLOWERS = [
     {"name": "Mikellion", "multiplier": 200, "chance": 0.000101},
 ]
 
+RIPENESS_BY_CATEGORY = {
+    "Fruit": LEVEL_OF_RIPENESS_FRUITS,
+    "Vegetable": LEVEL_OF_RIPENESS_VEGETABLES,
+    "Flower": LEVEL_OF_RIPENESS_FLOWERS,
+}
+
+
+def _ripeness_cum_weights(rlist, ripeness_rush=False):
+    """Cumulative ripeness weights for random.choices(cum_weights=...); Ripeness Rush doubles Perfect chances."""
+    return list(itertools.accumulate(
+        r["chance"] * 2 if ripeness_rush and "Perfect" in r["name"] else r["chance"] for r in rlist
+    ))
+
+
+# Built once at module load so gather/harvest rolls skip rebuilding weight lists per item
+RIPENESS_CUM_WEIGHTS = {cat: _ripeness_cum_weights(rl) for cat, rl in RIPENESS_BY_CATEGORY.items()}
+RIPENESS_RUSH_CUM_WEIGHTS = {cat: _ripeness_cum_weights(rl, ripeness_rush=True) for cat, rl in RIPENESS_BY_CATEGORY.items()}
+
 # Almanac key separator (must match database.ALMANAC_KEY_SEP when checking entries)
 _ALMANAC_KEY_SEP = "||"
 
@@ -4680,8 +4727,8 @@ async def check_almanac_achievements_async(user_id: int, channel_or_interaction,
             if _almanac_section_filled(almanac_entries, cat) and not has_hidden_achievement(user_id, hidden_key):
                 unlock_hidden_achievement(user_id, hidden_key)
                 await send_hidden_achievement_notification_dm(user_id, hidden_key)
-    except Exception as e:
-        print(f"Error in check_almanac_achievements_async: {e}")
+    except Exception:
+        logger.exception("Error in check_almanac_achievements_async")
 
 
 MONTHS = ["January", "February", "March", "April", "May", "June", "July", "August", "September", "October", "November", "December"]
@@ -4819,10 +4866,46 @@ DAILY_EVENTS = [
 active_roulette_games = {}
 user_active_games = {} # user id -> game id
 active_roulette_channel_games = {} # to map channel id to game id, so we can have one game per channel
+# A game's own channel_id/players are the reverse index into the two maps above; use
+# _untrack_roulette_game to drop a game from all three instead of scanning them
+# Roulette game IDs: in-process monotonic counter (seeded from startup time) rendered as hex
+_roulette_game_id_counter = itertools.count(int(time.time()))
+# Fire-and-forget roulette tasks; the loop only keeps weak references, so hold them here until they finish
+_roulette_tasks: set[asyncio.Task] = set()
+# channel id -> whether its name marks it as a Russian Roulette channel (invalidated in on_guild_channel_update)
+_is_roulette_channel: dict[int, bool] = {}
 ROULETTE_GAME_MAX_LIFETIME = 600  # 10 minutes max per game (prevents stale/stuck games)
+# Lookup tables for RouletteGame.calculate_total_multiplier (called several times per turn/embed):
+# [bullets][rounds] -> 1.2**bullets * 1.2**rounds, and [additional players] -> 1.4**n (max 6 players)
+ROULETTE_MULT_TABLE_ROUNDS = 128
+_ROULETTE_BULLET_ROUND_MULT = [[1.2 ** b * 1.2 ** r for r in range(ROULETTE_MULT_TABLE_ROUNDS)] for b in range(7)]
+_ROULETTE_PLAYER_MULT = [1.4 ** n for n in range(6)]
+# Per-bullet-count display stats for the /russian lobby embed: (base multiplier, death %, survival %)
+ROULETTE_STATS = {
+    b: (1.2 ** b, f"{(b / 6) * 100:.1f}%", f"{((6 - b) / 6) * 100:.1f}%")
+    for b in range(1, 6)
+}
+
+class _PlayerState:
+    """Per-player roulette state (RouletteGame.players values)."""
+    __slots__ = ("name", "alive", "rounds_survived", "current_stake", "cashed_out")
+
+    def __init__(self, name, current_stake):
+        self.name = name
+        self.alive = True
+        self.rounds_survived = 0
+        self.current_stake = current_stake
+        self.cashed_out = False
+
 
 class RouletteGame:
-    def __init__(self, game_id, host_id, host_name, bullets, bet_amount, max_players):
+    __slots__ = (
+        "game_id", "host_id", "host_name", "bullets", "initial_bullets", "bet_amount", "max_players",
+        "players", "pot", "round_number", "chamber_size", "turn_index", "player_order", "game_started",
+        "created_at", "channel_id", "_alive",
+    )
+
+    def __init__(self, game_id, host_id, host_name, bullets, bet_amount, max_players, channel_id=None):
         self.game_id = game_id
         self.host_id = host_id
         self.host_name = host_name
@@ -4830,7 +4913,7 @@ class RouletteGame:
         self.initial_bullets=bullets
         self.bet_amount = bet_amount
         self.max_players = max_players
-        self.players = {host_id: {"name": host_name, "alive": True, "rounds_survived": 0, "current_stake": bet_amount, "cashed_out": False}}
+        self.players = {host_id: _PlayerState(host_name, bet_amount)}
         self.pot = 0
         self.round_number = 0
         self.chamber_size = 6
@@ -4838,7 +4921,9 @@ class RouletteGame:
         self.player_order = [host_id]
         self.game_started = False
         self.created_at = time.time()
-        self.channel_id = None  # Set when game is created in /russian command
+        self.channel_id = channel_id  # Channel the game runs in; reverse index into active_roulette_channel_games
+        # Alive player ids as an insertion-ordered set (same order as self.players), kept in sync on join/out
+        self._alive = {host_id: None}
 
     #add player to game
     def add_player(self, player_id: int, player_name: str):
@@ -4847,14 +4932,9 @@ class RouletteGame:
         if player_id in self.players:
             return False
 
-        self.players[player_id] = {
-            "name": player_name,
-            "alive": True,
-            "rounds_survived": 0,
-            "current_stake": self.bet_amount,
-            "cashed_out": False
-        }
+        self.players[player_id] = _PlayerState(player_name, self.bet_amount)
         self.player_order.append(player_id)
+        self._alive[player_id] = None
         return True
 
     def is_full(self):
@@ -4862,14 +4942,16 @@ class RouletteGame:
 
     def get_alive_players(self):
         #return list of player ids that are alive
-        return [pid for pid, data in self.players.items() if data["alive"]]
+        return list(self._alive)
+
+    def alive_count(self):
+        return len(self._alive)
 
     #get current players turn
     def get_current_player(self):
-        alive = self.get_alive_players()
-        if not alive:
+        if not self._alive:
             return None
-        return alive[self.turn_index % len(alive)]
+        return list(self._alive)[self.turn_index % len(self._alive)]
 
     #move to next player
     def next_turn(self):
@@ -4877,34 +4959,42 @@ class RouletteGame:
 
     #calculate the total multiplier
     def calculate_total_multiplier(self, rounds_survived):
-        # Base multiplier from bullets (keep this as is for now, or remove if not needed)
-        bullet_multiplier = 1.2 ** self.initial_bullets
-        # 1.2x per round survived
-        round_multiplier = 1.2 ** rounds_survived
+        # Base multiplier from bullets (1.2x per bullet) times 1.2x per round survived
+        if rounds_survived < ROULETTE_MULT_TABLE_ROUNDS:
+            bullet_round_multiplier = _ROULETTE_BULLET_ROUND_MULT[self.initial_bullets][rounds_survived]
+        else:
+            bullet_round_multiplier = 1.2 ** self.initial_bullets * 1.2 ** rounds_survived
         # 1.4x per ADDITIONAL player (not counting yourself if solo)
         # If solo (max_players == 1), additional_players = 0
         # If 2 players, additional_players = 1, etc.
         additional_players = max(0, len(self.players) - 1)
-        player_multiplier = 1.4 ** additional_players
-        return bullet_multiplier * round_multiplier * player_multiplier
+        return bullet_round_multiplier * _ROULETTE_PLAYER_MULT[additional_players]
 
     #if a player loses, get them out and add their money to the pot
     def eliminate(self, player_id):
-        if player_id in self.players:
-            self.players[player_id]["alive"] = False
-            self.pot += self.players[player_id]["current_stake"]
-            # Set 30-minute cooldown on /gather and /harvest for eliminated player
-            update_user_last_roulette_elimination_time(player_id, time.time())
+        player = self.players.get(player_id)
+        if player is not None:
+            player.alive = False
+            self._alive.pop(player_id, None)
+            self.pot += player.current_stake
         #print the player out
-        # print(f"{self.players[player_id]['name']} has been eliminated!")
+        # print(f"{player.name} has been eliminated!")
+
+    #player takes their stake and leaves the game
+    def cash_out(self, player_id):
+        player = self.players[player_id]
+        player.alive = False
+        player.cashed_out = True
+        self._alive.pop(player_id, None)
 
     #when playersl live, increase their number of rounds
     def player_survived_round(self, player_id):
-        if (player_id in self.players and self.players[player_id]["alive"]):
-            self.players[player_id]["rounds_survived"] += 1
+        player = self.players.get(player_id)
+        if player is not None and player.alive:
+            player.rounds_survived += 1
             # update stack w/ new multiplier
-            multiplier = self.calculate_total_multiplier(self.players[player_id]["rounds_survived"])
-            self.players[player_id]["current_stake"] = normalize_money(self.bet_amount * multiplier)
+            multiplier = self.calculate_total_multiplier(player.rounds_survived)
+            player.current_stake = normalize_money(self.bet_amount * multiplier)
 
 
 
@@ -4915,33 +5005,25 @@ class RouletteGame:
 async def start_roulette_game(channel, game_id):
     try:
         if game_id not in active_roulette_games:
-            print(f"Warning: Game {game_id} not found in active_roulette_games")
+            logger.warning("Game %s not found in active_roulette_games", game_id)
             return
         
         game = active_roulette_games[game_id]
         
         # Check if game is already started (race condition protection)
         if game.game_started:
-            print(f"Warning: Game {game_id} is already started, ignoring duplicate start request")
+            logger.warning("Game %s is already started, ignoring duplicate start request", game_id)
             return
         
         # Validate that there are players in the game
         if len(game.players) == 0:
-            print(f"Error: Game {game_id} has no players, cannot start")
+            logger.error("Game %s has no players, cannot start", game_id)
             # Clean up the game
-            if game_id in active_roulette_games:
-                del active_roulette_games[game_id]
-            for ch_id, tracked_game_id in list(active_roulette_channel_games.items()):
-                if tracked_game_id == game_id:
-                    del active_roulette_channel_games[ch_id]
+            _untrack_roulette_game(game)
             for player_id in list(user_active_games.keys()):
                 if user_active_games[player_id] == game_id:
                     # Refund the player
-                    user_balance = get_user_balance(player_id)
-                    user_balance = normalize_money(user_balance)
-                    refund_amount = normalize_money(game.bet_amount)
-                    new_balance = normalize_money(user_balance + refund_amount)
-                    update_user_balance(player_id, new_balance)
+                    await asyncio.to_thread(refund_balance, player_id, normalize_money(game.bet_amount))
                     del user_active_games[player_id]
             await channel.send("❌ **Error**: Game could not start because there are no players. All bets have been refunded.")
             return
@@ -4957,314 +5039,300 @@ async def start_roulette_game(channel, game_id):
         if game.pot == 0:
             game.pot = normalize_money(game.bet_amount * len(game.players))
         
-        embed = discord.Embed(
-            title = "🎲 RUSSIAN ROULETTE 🎲",
-            description = f"**{game.host_name}**'s game has started!\n*The cylinder spins.. click.. click.. click.. click..*",
-            color = discord.Color.dark_red()
-        )
-        embed.add_field(name="🔫 Bullets Loaded", value=f"{game.bullets}/6", inline=True)
-        embed.add_field(name="💰 Total Pot", value=format_money(game.pot), inline=True)
-        embed.add_field(name="🎮 Players", value=f"{len(game.players)}/{game.max_players}", inline=True)
+        embed = _roulette_embed(_ROULETTE_START_EMBED, (
+            ("🔫 Bullets Loaded", f"{game.bullets}/6"),
+            ("💰 Total Pot", format_money(game.pot)),
+            ("🎮 Players", f"{len(game.players)}/{game.max_players}"),
+        ), description=f"**{game.host_name}**'s game has started!\n*The cylinder spins.. click.. click.. click.. click..*")
         await channel.send(embed=embed)
         await asyncio.sleep(2)
 
         #play round!!
         await play_roulette_round(channel, game_id)
-    except Exception as e:
-        print(f"Error starting roulette game {game_id}: {e}")
-        import traceback
-        traceback.print_exc()
+    except Exception:
+        logger.exception("Error starting roulette game %s", game_id)
         # Try to refund all players if game fails to start
         if game_id in active_roulette_games:
             game = active_roulette_games[game_id]
-            for player_id in game.players.keys():
-                try:
-                    user_balance = get_user_balance(player_id)
-                    user_balance = normalize_money(user_balance)
-                    refund_amount = normalize_money(game.bet_amount)
-                    new_balance = normalize_money(user_balance + refund_amount)
-                    update_user_balance(player_id, new_balance)
-                    if player_id in user_active_games:
-                        del user_active_games[player_id]
-                except Exception as refund_error:
-                    print(f"Error refunding player {player_id}: {refund_error}")
+            bet_amount = normalize_money(game.bet_amount)
+            refunds = {player_id: bet_amount for player_id in game.players}
+            try:
+                await _settle_roulette_escrow(game_id)
+                await asyncio.to_thread(refund_balances, refunds)
+            except Exception:
+                logger.exception("Error refunding players of game %s; unrefunded amounts: %s", game_id, refunds)
             # Clean up game
-            del active_roulette_games[game_id]
-            for ch_id, tracked_game_id in list(active_roulette_channel_games.items()):
-                if tracked_game_id == game_id:
-                    del active_roulette_channel_games[ch_id]
+            _untrack_roulette_game(game)
             try:
                 await channel.send("❌ **Error**: Game failed to start. All bets have been refunded.")
             except:
                 pass
 
-#play a round of russian roulette
-async def play_roulette_round(channel, game_id):
-    if game_id not in active_roulette_games:
-        return
-    game = active_roulette_games[game_id]
+# Static parts of the roulette embeds; _roulette_embed fills in the per-game/per-turn text and fields
+_ROULETTE_LOBBY_EMBED = {"title": "🎲 RUSSIAN ROULETTE 🎲", "color": RED}
+_ROULETTE_START_EMBED = {"title": "🎲 RUSSIAN ROULETTE 🎲", "color": DARK_RED}
+_ROULETTE_SPIN_EMBED = {"description": "*The cylinder re-spins...*\n\n🔄 🔄 🔄", "color": 0xe67e22}
+_ROULETTE_SHOT_EMBED = {"title": "💥 BANG! 💥", "color": DARK_RED}
+_ROULETTE_SURVIVE_EMBED = {"color": GREEN}
+_ROULETTE_PROMPT_EMBED = {"title": "⚠️ YOUR TURN ⚠️", "color": 0xf1c40f}
+_ROULETTE_VICTORY_FIELD = {
+    "name": "🏆 Victory Status",
+    "value": "You won the multiplayer round! Keep playing to increase your multiplier or cash out now!",
+    "inline": False,
+}
 
-    # Safety: abort if game exceeded max lifetime (prevents infinite loops)
-    if time.time() - game.created_at > ROULETTE_GAME_MAX_LIFETIME:
-        _force_cleanup_roulette_game(game_id, refund=True)
-        try:
-            embed = discord.Embed(
-                title="⏰ GAME TIMED OUT ⏰",
-                description="This Russian Roulette game has been automatically ended due to exceeding the time limit.\n\n**All remaining players have been refunded.**",
-                color=discord.Color.orange()
-            )
-            await channel.send(embed=embed)
-        except Exception:
-            pass
-        return
 
-    alive_players = game.get_alive_players()
+def _roulette_embed(template: dict, fields, **overrides) -> discord.Embed:
+    """Build a roulette embed from a template dict plus (name, value) inline field pairs via Embed.from_dict."""
+    return discord.Embed.from_dict({
+        **template,
+        **overrides,
+        "fields": [{"name": name, "value": value, "inline": True} for name, value in fields],
+    })
 
-    #check if  game should end, check if everyone died
-    if (len(alive_players) <= 0):
-        #game over
-        await end_roulette_game(channel, game_id)
-        return
 
-    if len(alive_players) == 1 and game.max_players > 1:
-        # one player left, player can choose to keep playing
-        winner_id = alive_players[0]
-        winner = game.players[winner_id]
+def _roulette_prompt_embed(game, player: _PlayerState, potential_winnings: float, is_first_turn: bool, last_standing: bool) -> discord.Embed:
+    """The "YOUR TURN" prompt shown with RouletteContinueView."""
+    if is_first_turn:
+        description = f"**{player.name}**, it's your turn!\n\nClick **Pull Trigger** to continue.\n\n⏰ **You have 5 minutes to decide, or you'll automatically cash out.**\n\n*Note: Cash out is not available on the very first turn.*"
+    else:
+        description = f"**{player.name}**, it's your turn!\n\nClick **Pull Trigger** to continue or **Cash Out** to leave with your winnings.\n\n⏰ **You have 5 minutes to decide, or you'll automatically cash out.**"
+    embed = _roulette_embed(_ROULETTE_PROMPT_EMBED, (
+        ("💰 Potential Winnings", format_money(potential_winnings)),
+        ("🔫 Bullets", f"{game.bullets}/6"),
+        ("💀 Death Odds", f"{(game.bullets/6)*100:.1f}%"),
+        ("📈 Current Multiplier", f"{game.calculate_total_multiplier(player.rounds_survived):.2f}x"),
+        ("🎯 Rounds Survived", f"{player.rounds_survived}"),
+    ), description=description)
+    if last_standing:
+        embed.add_field(**_ROULETTE_VICTORY_FIELD)
+    return embed
 
-        #announce winner, but let them keep playing
-        embed = discord.Embed(
-            title = "LAST PLAYER STANDING!",
-            description = f"**{winner['name']}** is the last man standing!\n\n**But the game isn't over. Will they try their luck?**",
-            color = discord.Color.gold()
-        )
-        embed.add_field(name="💰 Current Winnings", value=format_money(game.pot + winner['current_stake']), inline=True)
-        embed.add_field(name="📈 Current Multiplier", value=f"{game.calculate_total_multiplier(winner['rounds_survived']):.2f}x", inline=True)
-        embed.add_field(name="🎯 Rounds Survived", value=f"{winner['rounds_survived']}", inline=True)
-        embed.add_field(name="🔫 Bullets Left", value=f"{game.bullets}/6", inline=True)
 
-        await channel.send(embed=embed)
-        await asyncio.sleep(2)
+#play a round of russian roulette
+async def play_roulette_round(channel, game_id):
+    # Turns that need no player input (first-turn eliminations) loop here instead of recursing;
+    # everything else returns and the next turn is driven by RouletteContinueView.
+    while True:
+        if game_id not in active_roulette_games:
+            return
+        game = active_roulette_games[game_id]
 
-    current_player_id = game.get_current_player()
-    if current_player_id is None:
-        await end_roulette_game(channel, game_id)
-        return
+        # Safety: abort if game exceeded max lifetime (prevents infinite loops)
+        if time.time() - game.created_at > ROULETTE_GAME_MAX_LIFETIME:
+            await _force_cleanup_roulette_game(game_id, refund=True)
+            try:
+                embed = discord.Embed(
+                    title="⏰ GAME TIMED OUT ⏰",
+                    description="This Russian Roulette game has been automatically ended due to exceeding the time limit.\n\n**All remaining players have been refunded.**",
+                    color=discord.Color.orange()
+                )
+                await channel.send(embed=embed)
+            except Exception:
+                pass
+            return
 
-    current_player = game.players[current_player_id]
+        alive_players = game.get_alive_players()
 
-    #revolver chamber spinning animation
-    embed = discord.Embed(
-        title=f"🔫 {current_player['name']}'s Turn",
-        description="*The cylinder re-spins...*\n\n🔄 🔄 🔄",
-        color=discord.Color.orange()
-    )
-    embed.add_field(name="💀 Bullets Remaining", value=f"{game.bullets}/6", inline=True)
-    embed.add_field(name="💰 Current Stake", value=format_money(current_player['current_stake']), inline=True)
-    embed.add_field(name="🎯 Rounds Survived", value=f"{current_player['rounds_survived']}", inline=True)
-    embed.add_field(name="📈 Current Multiplier", value=f"{game.calculate_total_multiplier(current_player['rounds_survived']):.2f}x", inline=True)
-    
-    msg = await channel.send(embed=embed)
-    await asyncio.sleep(2)
+        #check if  game should end, check if everyone died
+        if (len(alive_players) <= 0):
+            #game over
+            await end_roulette_game(channel, game_id)
+            return
 
-    #bullet firing logic
-    chambers = [False] * 6
-    for i in range(game.bullets):
-        chambers[i] = True
-    random.shuffle(chambers)
+        if len(alive_players) == 1 and game.max_players > 1:
+            # one player left, player can choose to keep playing
+            winner_id = alive_players[0]
+            winner = game.players[winner_id]
 
-    shot_fired = chambers[0]
-    # Blanks: 20% chance for bullet to be a blank when fired on a user who has the item (they survive)
-    is_blank = shot_fired and has_shop_item(current_player_id, "blanks") and random.random() < 0.20
-    survived = not shot_fired or is_blank
+            #announce winner, but let them keep playing
+            embed = discord.Embed(
+                title = "LAST PLAYER STANDING!",
+                description = f"**{winner.name}** is the last man standing!\n\n**But the game isn't over. Will they try their luck?**",
+                color = discord.Color.gold()
+            )
+            embed.add_field(name="💰 Current Winnings", value=format_money(game.pot + winner.current_stake), inline=True)
+            embed.add_field(name="📈 Current Multiplier", value=f"{game.calculate_total_multiplier(winner.rounds_survived):.2f}x", inline=True)
+            embed.add_field(name="🎯 Rounds Survived", value=f"{winner.rounds_survived}", inline=True)
+            embed.add_field(name="🔫 Bullets Left", value=f"{game.bullets}/6", inline=True)
 
-    if shot_fired and not is_blank:
-        # Player eliminated
-        game.eliminate(current_player_id)
-        game.bullets -= 1
+            await channel.send(embed=embed)
+            await asyncio.sleep(2)
 
-        embed = discord.Embed(
-            title="💥 BANG! 💥",
-            description=f"**{current_player['name']}** has been eliminated!",
-            color=discord.Color.dark_red()
-        )
-        embed.add_field(name="💀 Status", value="ELIMINATED", inline=True)
-        embed.add_field(name="💸 Lost", value=format_money(current_player['current_stake']), inline=True)
-        embed.add_field(name="💰 Pot Now", value=format_money(game.pot), inline=True)
-        embed.add_field(name="🔫 Bullets Left", value=f"{game.bullets}/6", inline=True)
-        embed.add_field(name="👥 Players Alive", value=f"{len(game.get_alive_players())}", inline=True)
+        current_player_id = game.get_current_player()
+        if current_player_id is None:
+            await end_roulette_game(channel, game_id)
+            return
 
-        await msg.edit(embed=embed)
+        current_player = game.players[current_player_id]
 
-        # remove player from active games
-        if current_player_id in user_active_games:
-            del user_active_games[current_player_id]
+        #revolver chamber spinning animation
+        embed = _roulette_embed(_ROULETTE_SPIN_EMBED, (
+            ("💀 Bullets Remaining", f"{game.bullets}/6"),
+            ("💰 Current Stake", format_money(current_player.current_stake)),
+            ("🎯 Rounds Survived", f"{current_player.rounds_survived}"),
+            ("📈 Current Multiplier", f"{game.calculate_total_multiplier(current_player.rounds_survived):.2f}x"),
+        ), title=f"🔫 {current_player.name}'s Turn")
+    
+        msg = await channel.send(embed=embed)
+        await asyncio.sleep(2)
 
-        # Check russian roulette achievement (player died = game completed)
-        await check_russian_roulette_achievement(current_player_id)
+        #bullet firing logic: the chamber under the hammer is uniform over 6, so one draw decides it
+        shot_fired = random.randrange(6) < game.bullets
+        # Blanks: 20% chance for bullet to be a blank when fired on a user who has the item (they survive)
+        is_blank = shot_fired and await asyncio.to_thread(has_shop_item, current_player_id, "blanks") and random.random() < 0.20
+        survived = not shot_fired or is_blank
 
-        # check if anyone is left
-        await asyncio.sleep(2)
-        if len(game.get_alive_players()) == 0:
-            await end_roulette_game(channel, game_id)
-            return
+        if shot_fired and not is_blank:
+            # Player eliminated
+            game.eliminate(current_player_id)
+            await _settle_roulette_escrow(game_id, current_player_id)
+            # Set 30-minute cooldown on /gather and /harvest for eliminated player
+            await asyncio.to_thread(update_user_last_roulette_elimination_time, current_player_id, time.time())
+            game.bullets -= 1
 
-        # continue to next player - give them option to cash out (except first turn)
-        game.next_turn()
-        await asyncio.sleep(2)
+            embed = _roulette_embed(_ROULETTE_SHOT_EMBED, (
+                ("💀 Status", "ELIMINATED"),
+                ("💸 Lost", format_money(current_player.current_stake)),
+                ("💰 Pot Now", format_money(game.pot)),
+                ("🔫 Bullets Left", f"{game.bullets}/6"),
+                ("👥 Players Alive", f"{game.alive_count()}"),
+            ), description=f"**{current_player.name}** has been eliminated!")
 
-        # Check if this is the very first turn (no one has survived a round yet)
-        is_first_turn = all(player['rounds_survived'] == 0 for player in game.players.values())
+            await msg.edit(embed=embed)
 
-        if is_first_turn:
-            # First turn - immediately continue to next player's turn
-            await play_roulette_round(channel, game_id)
-        else:
-            # Not first turn - give next player option to cash out or continue
-            alive_players = game.get_alive_players()
-            if len(alive_players) == 0:
-                await end_roulette_game(channel, game_id)
-                return
+            # remove player from active games
+            if current_player_id in user_active_games:
+                del user_active_games[current_player_id]
+
+            # Check russian roulette achievement (player died = game completed)
+            await check_russian_roulette_achievement(current_player_id)
 
-            next_player_id = game.get_current_player()
-            if next_player_id is None:
+            # single pause on the BANG before anything else is posted
+            await asyncio.sleep(2)
+            # check if anyone is left
+            if game.alive_count() == 0:
                 await end_roulette_game(channel, game_id)
                 return
 
-            next_player = game.players[next_player_id]
+            # continue to next player - give them option to cash out (except first turn)
+            game.next_turn()
+
+            # Check if this is the very first turn (no one has survived a round yet)
+            is_first_turn = all(player.rounds_survived == 0 for player in game.players.values())
 
-            # Determine total winnings if they cash out now
-            if len(alive_players) == 1:
-                potential_winnings = game.pot + next_player['current_stake']
+            if is_first_turn:
+                # First turn - immediately continue to next player's turn
+                continue
             else:
-                potential_winnings = next_player['current_stake']
+                # Not first turn - give next player option to cash out or continue
+                alive_players = game.get_alive_players()
+                if len(alive_players) == 0:
+                    await end_roulette_game(channel, game_id)
+                    return
 
-            # Create continue/cashout view (only allow cash out if not first turn)
-            is_first_turn_here = all(player['rounds_survived'] == 0 for player in game.players.values())
-            view = RouletteContinueView(game_id, timeout=300, allow_cashout=not is_first_turn_here)
+                next_player_id = game.get_current_player()
+                if next_player_id is None:
+                    await end_roulette_game(channel, game_id)
+                    return
 
-            if is_first_turn_here:
-                embed = discord.Embed(
-                    title="⚠️ YOUR TURN ⚠️",
-                    description=f"**{next_player['name']}**, it's your turn!\n\nClick **Pull Trigger** to continue.\n\n⏰ **You have 5 minutes to decide, or you'll automatically cash out.**\n\n*Note: Cash out is not available on the very first turn.*",
-                    color=discord.Color.gold()
-                )
-            else:
-                embed = discord.Embed(
-                    title="⚠️ YOUR TURN ⚠️",
-                    description=f"**{next_player['name']}**, it's your turn!\n\nClick **Pull Trigger** to continue or **Cash Out** to leave with your winnings.\n\n⏰ **You have 5 minutes to decide, or you'll automatically cash out.**",
-                    color=discord.Color.gold()
-                )
-            embed.add_field(name="💰 Potential Winnings", value=format_money(potential_winnings), inline=True)
-            embed.add_field(name="🔫 Bullets", value=f"{game.bullets}/6", inline=True)
-            embed.add_field(name="💀 Death Odds", value=f"{(game.bullets/6)*100:.1f}%", inline=True)
-            embed.add_field(name="📈 Current Multiplier", value=f"{game.calculate_total_multiplier(next_player['rounds_survived']):.2f}x", inline=True)
-            embed.add_field(name="🎯 Rounds Survived", value=f"{next_player['rounds_survived']}", inline=True)
+                next_player = game.players[next_player_id]
 
-            if len(alive_players) == 1 and game.max_players > 1:
-                embed.add_field(
-                    name="🏆 Victory Status",
-                    value="You won the multiplayer round! Keep playing to increase your multiplier or cash out now!",
-                    inline=False
-                )
-            await channel.send(f"<@{next_player_id}>", embed=embed, view=view)
-        return
+                # Determine total winnings if they cash out now
+                if len(alive_players) == 1:
+                    potential_winnings = game.pot + next_player.current_stake
+                else:
+                    potential_winnings = next_player.current_stake
 
-    if survived:
-        # Player survived (click or BLANK!)
-        game.player_survived_round(current_player_id)
-        if is_blank:
-            embed = discord.Embed(
-                title="💥 BLANK! 💥",
-                description=f"**{current_player['name']}** survived — it was a blank!",
-                color=discord.Color.green()
-            )
-        else:
-            embed = discord.Embed(
-                title="*click*",
-                description=f"**{current_player['name']}** survived!",
-                color=discord.Color.green()
-            )
-        new_multiplier = game.calculate_total_multiplier(current_player['rounds_survived'])
-        embed.add_field(name="✅ Status", value="ALIVE", inline=True)
-        embed.add_field(name="💰 Current Stake", value=format_money(current_player['current_stake']), inline=True)
-        embed.add_field(name="📈 Multiplier", value=f"{new_multiplier:.2f}x", inline=True)
-        embed.add_field(name="🎯 Rounds Survived", value=f"{current_player['rounds_survived']}", inline=True)
-        await msg.edit(embed=embed)
-
-    # If all bullets gone, reload chamber
-    if game.bullets == 0:
-        game.bullets = game.initial_bullets
-        game.round_number += 1
+                # Create continue/cashout view (only allow cash out if not first turn)
+                is_first_turn_here = all(player.rounds_survived == 0 for player in game.players.values())
+                view = RouletteContinueView(game_id, timeout=300, allow_cashout=not is_first_turn_here)
+
+                embed = _roulette_prompt_embed(game, next_player, potential_winnings, is_first_turn_here,
+                                               len(alive_players) == 1 and game.max_players > 1)
+                await channel.send(f"<@{next_player_id}>", embed=embed, view=view)
+            return
+
+        if survived:
+            # Player survived (click or BLANK!)
+            game.player_survived_round(current_player_id)
+            if is_blank:
+                title, description = "💥 BLANK! 💥", f"**{current_player.name}** survived — it was a blank!"
+            else:
+                title, description = "*click*", f"**{current_player.name}** survived!"
+            new_multiplier = game.calculate_total_multiplier(current_player.rounds_survived)
+            embed = _roulette_embed(_ROULETTE_SURVIVE_EMBED, (
+                ("✅ Status", "ALIVE"),
+                ("💰 Current Stake", format_money(current_player.current_stake)),
+                ("📈 Multiplier", f"{new_multiplier:.2f}x"),
+                ("🎯 Rounds Survived", f"{current_player.rounds_survived}"),
+            ), title=title, description=description)
+            await msg.edit(embed=embed)
+
+        # If all bullets gone, reload chamber
+        if game.bullets == 0:
+            game.bullets = game.initial_bullets
+            game.round_number += 1
         
-        await asyncio.sleep(2)
+            await asyncio.sleep(2)
         
-        embed = discord.Embed(
-            title=f"🔄 ROUND {game.round_number} 🔄",
-            description="*Reloading the chamber...*\n\n**Stakes just got higher!**",
-            color=discord.Color.blue()
-        )
-        embed.add_field(name="🔫 Bullets Reloaded", value=f"{game.bullets}/6", inline=True)
-        embed.add_field(name="👥 Players Remaining", value=f"{len(alive_players)}", inline=True)
-        embed.add_field(name="💰 Total Pot", value=format_money(game.pot), inline=True)
+            embed = discord.Embed(
+                title=f"🔄 ROUND {game.round_number} 🔄",
+                description="*Reloading the chamber...*\n\n**Stakes just got higher!**",
+                color=discord.Color.blue()
+            )
+            embed.add_field(name="🔫 Bullets Reloaded", value=f"{game.bullets}/6", inline=True)
+            embed.add_field(name="👥 Players Remaining", value=f"{len(alive_players)}", inline=True)
+            embed.add_field(name="💰 Total Pot", value=format_money(game.pot), inline=True)
         
-        await channel.send(embed=embed)
-        await asyncio.sleep(2)
+            await channel.send(embed=embed)
     
-    # Move to next player (or same player in solo/last-man-standing)
-    if len(alive_players) > 1:
-        game.next_turn()
-    # If solo or last survivor, they go again (don't increment turn)
+        # Move to next player (or same player in solo/last-man-standing)
+        if len(alive_players) > 1:
+            game.next_turn()
+        # If solo or last survivor, they go again (don't increment turn)
     
-    # Get next player for decision
-    next_player_id = game.get_current_player()
-    if next_player_id is None:
-        await end_roulette_game(channel, game_id)
-        return
+        # Get next player for decision
+        next_player_id = game.get_current_player()
+        if next_player_id is None:
+            await end_roulette_game(channel, game_id)
+            return
         
-    next_player = game.players[next_player_id]
-    
-    # Check if this is the very first turn (no one has survived a round yet)
-    is_first_turn = all(player['rounds_survived'] == 0 for player in game.players.values())
-    
-    # Determine total winnings if they cash out now
-    if len(alive_players) == 1:
-        # Last player standing gets pot + their stake
-        potential_winnings = game.pot + next_player['current_stake']
-    else:
-        # Multiplayer - just show their stake
-        potential_winnings = next_player['current_stake']
+        next_player = game.players[next_player_id]
     
-    # Create continue/cashout view (only allow cash out if not first turn)
-    view = RouletteContinueView(game_id, timeout=300, allow_cashout=not is_first_turn)
+        # Check if this is the very first turn (no one has survived a round yet)
+        is_first_turn = all(player.rounds_survived == 0 for player in game.players.values())
     
-    if is_first_turn:
-        embed = discord.Embed(
-            title="⚠️ YOUR TURN ⚠️",
-            description=f"**{next_player['name']}**, it's your turn!\n\nClick **Pull Trigger** to continue.\n\n⏰ **You have 5 minutes to decide, or you'll automatically cash out.**\n\n*Note: Cash out is not available on the very first turn.*",
-            color=discord.Color.gold()
-        )
-    else:
-        embed = discord.Embed(
-            title="⚠️ YOUR TURN ⚠️",
-            description=f"**{next_player['name']}**, it's your turn!\n\nClick **Pull Trigger** to continue or **Cash Out** to leave with your winnings.\n\n⏰ **You have 5 minutes to decide, or you'll automatically cash out.**",
-            color=discord.Color.gold()
-        )
+        # Determine total winnings if they cash out now
+        if len(alive_players) == 1:
+            # Last player standing gets pot + their stake
+            potential_winnings = game.pot + next_player.current_stake
+        else:
+            # Multiplayer - just show their stake
+            potential_winnings = next_player.current_stake
     
-    embed.add_field(name="💰 Potential Winnings", value=format_money(potential_winnings), inline=True)
-    embed.add_field(name="🔫 Bullets", value=f"{game.bullets}/6", inline=True)
-    embed.add_field(name="💀 Death Odds", value=f"{(game.bullets/6)*100:.1f}%", inline=True)
-    embed.add_field(name="📈 Current Multiplier", value=f"{game.calculate_total_multiplier(next_player['rounds_survived']):.2f}x", inline=True)
-    embed.add_field(name="🎯 Rounds Survived", value=f"{next_player['rounds_survived']}", inline=True)
+        # Create continue/cashout view (only allow cash out if not first turn)
+        view = RouletteContinueView(game_id, timeout=300, allow_cashout=not is_first_turn)
     
-    # Show different message for solo vs last-survivor
-    if len(alive_players) == 1 and game.max_players > 1:
-        embed.add_field(
-            name="🏆 Victory Status",
-            value="You won the multiplayer round! Keep playing to increase your multiplier or cash out now!",
-            inline=False
-        )
+        # Show different message for solo vs last-survivor
+        embed = _roulette_prompt_embed(game, next_player, potential_winnings, is_first_turn,
+                                       len(alive_players) == 1 and game.max_players > 1)
     
-    await channel.send(f"<@{next_player_id}>", embed=embed, view=view)
+        await channel.send(f"<@{next_player_id}>", embed=embed, view=view)
+        return
+
+def _roulette_lobby_description(host_name: str, player_count: int, max_players: int) -> str:
+    """Lobby embed description for /russian: player count, rules and how-to-play in one block."""
+    if max_players == 1:
+        how_to_play = "Click **Start** to begin your solo adventure!"
+    else:
+        how_to_play = f"Waiting for {max_players-1} more players to join! Host can click **Start** when ready!"
+    return (
+        f"**{host_name}** is playing with **{player_count}/{max_players}** players!\n\n*How long can you survive?*\n\n"
+        "**📋 Rules**\nCash out anytime to keep your winnings, or keep playing for more!\n\n"
+        f"**ℹ️ How to Play**\n{how_to_play}"
+    )
+
 
 class RouletteJoinView(discord.ui.View):
     def __init__(self, game_id: str, host_id: int, timeout = 300):
@@ -5285,7 +5353,7 @@ class RouletteJoinView(discord.ui.View):
             game = active_roulette_games[self.game_id]
             
             # Check if user is on Russian Roulette elimination cooldown (dead)
-            is_roulette_cooldown, roulette_time_left = check_roulette_elimination_cooldown(user_id)
+            is_roulette_cooldown, roulette_time_left = await asyncio.to_thread(check_roulette_elimination_cooldown, user_id)
             if is_roulette_cooldown:
                 minutes_left = roulette_time_left // 60
                 await safe_interaction_response(interaction, interaction.response.send_message,
@@ -5312,26 +5380,30 @@ class RouletteJoinView(discord.ui.View):
                 await safe_interaction_response(interaction, interaction.response.send_message, "❌ Game already started!", ephemeral=True)
                 return
                 
-            # Check user balance
-            user_balance = get_user_balance(user_id)
-            user_balance = normalize_money(user_balance)
+            # Check balance and deduct the buy-in in one atomic DB round-trip, off the event loop
             bet_amount = normalize_money(game.bet_amount)
-            
-            if not can_afford_rounded(user_balance, bet_amount):
+            success, _ = await asyncio.to_thread(atomic_deduct_balance, user_id, bet_amount)
+            if not success:
                 await safe_interaction_response(interaction, interaction.response.send_message, "❌ You don't have enough balance to join!", ephemeral=True)
                 return
+            # Escrow the buy-in before the player is visible in the game, so a game cleanup can't race ahead of it
+            try:
+                await asyncio.to_thread(add_roulette_escrow, self.game_id, user_id, bet_amount)
+            except Exception:
+                logger.exception("Error escrowing roulette buy-in of %s for user %s in game %s", bet_amount, user_id, self.game_id)
                 
-            # Join the game
-            game.add_player(user_id, interaction.user.name)
+            # Join the game (re-checked after the await: another join or Start may have landed meanwhile)
+            if (self.game_id not in active_roulette_games or game.game_started or user_id in user_active_games
+                    or not game.add_player(user_id, interaction.user.name)):
+                await _settle_roulette_escrow(self.game_id, user_id)
+                await asyncio.to_thread(refund_balance, user_id, bet_amount)
+                await safe_interaction_response(interaction, interaction.response.send_message, "❌ Couldn't join: the game filled up or started. Your bet was refunded.", ephemeral=True)
+                return
             user_active_games[user_id] = self.game_id
             
-            # Deduct bet
-            new_balance = normalize_money(user_balance - bet_amount)
-            update_user_balance(user_id, new_balance)
-            
             # Update the embed
             embed = interaction.message.embeds[0]
-            embed.description = f"**{game.host_name}** is playing with **{len(game.players)}/{game.max_players}** players!\n\n*How long can you survive?*"
+            embed.description = _roulette_lobby_description(game.host_name, len(game.players), game.max_players)
             
             # Update the view (disable join button if full)
             if len(game.players) >= game.max_players:
@@ -5339,8 +5411,8 @@ class RouletteJoinView(discord.ui.View):
                 button.label = "Game Full"
             
             await safe_interaction_response(interaction, interaction.response.edit_message, embed=embed, view=self)
-        except Exception as e:
-            print(f"Error in join_game: {e}")
+        except Exception:
+            logger.exception("Error in join_game")
             await safe_interaction_response(interaction, interaction.response.send_message, "❌ An error occurred. Please try again.", ephemeral=True)
 
     @discord.ui.button(label="Start", style=discord.ButtonStyle.blurple, emoji="❗")
@@ -5376,8 +5448,8 @@ class RouletteJoinView(discord.ui.View):
             
             # Start the actual game (this will set game_started and handle errors)
             await start_roulette_game(interaction.channel, self.game_id)
-        except Exception as e:
-            print(f"Error in start_game: {e}")
+        except Exception:
+            logger.exception("Error in start_game")
             await safe_interaction_response(interaction, interaction.response.send_message, "❌ An error occurred. Please try again.", ephemeral=True)
     
     @discord.ui.button(label="Cancel", style=discord.ButtonStyle.red, emoji="❌")
@@ -5403,34 +5475,23 @@ class RouletteJoinView(discord.ui.View):
             
             # Refund all players
             refunded_count = 0
-            for player_id in list(game.players.keys()):
-                try:
-                    user_balance = get_user_balance(player_id)
-                    user_balance = normalize_money(user_balance)
-                    refund_amount = normalize_money(game.bet_amount)
-                    new_balance = normalize_money(user_balance + refund_amount)
-                    update_user_balance(player_id, new_balance)
-                    refunded_count += 1
-                except Exception as e:
-                    print(f"Error refunding player {player_id}: {e}")
+            bet_amount = normalize_money(game.bet_amount)
+            refunds = {player_id: bet_amount for player_id in game.players}
+            try:
+                await _settle_roulette_escrow(self.game_id)
+                await asyncio.to_thread(refund_balances, refunds)
+                refunded_count = len(game.players)
+            except Exception:
+                logger.exception("Error refunding players of game %s; unrefunded amounts: %s", self.game_id, refunds)
             
             # Clean up game from all dictionaries
-            if self.game_id in active_roulette_games:
-                del active_roulette_games[self.game_id]
-            
-            for ch_id, tracked_game_id in list(active_roulette_channel_games.items()):
-                if tracked_game_id == self.game_id:
-                    del active_roulette_channel_games[ch_id]
-            
-            for player_id in list(user_active_games.keys()):
-                if user_active_games[player_id] == self.game_id:
-                    del user_active_games[player_id]
+            _untrack_roulette_game(game)
             
             # Update the message to show cancellation
             embed = discord.Embed(
                 title="❌ GAME CANCELLED",
                 description=f"**{game.host_name}** cancelled the game.\n\nAll bets have been refunded.",
-                color=discord.Color.red()
+                color=RED
             )
             embed.add_field(
                 name="💰 Refunded",
@@ -5439,8 +5500,8 @@ class RouletteJoinView(discord.ui.View):
             )
             
             await safe_interaction_response(interaction, interaction.response.edit_message, embed=embed, view=None)
-        except Exception as e:
-            print(f"Error in cancel_game: {e}")
+        except Exception:
+            logger.exception("Error in cancel_game")
             await safe_interaction_response(interaction, interaction.response.send_message, "❌ An error occurred. Please try again.", ephemeral=True)
     
     async def on_timeout(self):
@@ -5452,21 +5513,41 @@ class RouletteJoinView(discord.ui.View):
                 game.pot = normalize_money(game.bet_amount * len(game.players))
                 
                 # Find the channel where this game is running
-                channel = None
-                for ch_id, tracked_game_id in active_roulette_channel_games.items():
-                    if tracked_game_id == self.game_id:
-                        channel = bot.get_channel(ch_id)
-                        break
+                channel = bot.get_channel(game.channel_id) if game.channel_id else None
                 
                 if channel:
                     try:
                         await channel.send("⏰ **Auto-starting game after 5 minutes!**")
-                        await start_roulette_game(channel, self.game_id)
-                    except Exception as e:
-                        print(f"Error auto-starting roulette game: {e}")
-                        import traceback
-                        traceback.print_exc()
+                    except Exception:
+                        logger.exception("Error announcing auto-start of roulette game %s", self.game_id)
+                    # Run the game as its own task so the view's timeout callback returns right away
+                    # (start_roulette_game handles and refunds its own failures)
+                    task = asyncio.create_task(start_roulette_game(channel, self.game_id))
+                    _roulette_tasks.add(task)
+                    task.add_done_callback(_roulette_tasks.discard)
+                else:
+                    # Nowhere to play it; don't leave the buy-ins locked until the stale-game sweep
+                    await _force_cleanup_roulette_game(self.game_id, refund=True)
+
+
 
+class RouletteSoloStartView(RouletteJoinView):
+    """Lobby view for 1-player games: Start/Cancel only. Times out by refunding instead of auto-starting."""
+    def __init__(self, game_id: str, host_id: int, timeout = 300):
+        super().__init__(game_id, host_id, timeout=timeout)
+        self.remove_item(self.join_game)
+
+    async def on_timeout(self):
+        game = active_roulette_games.get(self.game_id)
+        if game is None or game.game_started:
+            return
+        channel = bot.get_channel(game.channel_id) if game.channel_id else None
+        await _force_cleanup_roulette_game(self.game_id, refund=True)
+        if channel:
+            try:
+                await channel.send(f"⏰ **{game.host_name}**'s Russian Roulette game was never started and has been cancelled. Your bet was refunded.")
+            except Exception:
+                logger.exception("Error in RouletteSoloStartView.on_timeout")
 
 
 # roulette continue view
@@ -5502,8 +5583,8 @@ class RouletteContinueView(discord.ui.View):
 
             # Continue the game
             await play_roulette_round(interaction.channel, self.game_id)
-        except Exception as e:
-            print(f"Error in continue_button: {e}")
+        except Exception:
+            logger.exception("Error in continue_button")
             await safe_interaction_response(interaction, interaction.response.send_message, "❌ An error occurred. Please try again.", ephemeral=True)
     
     @discord.ui.button(label="Cash Out", style=discord.ButtonStyle.secondary, emoji="💰")
@@ -5528,25 +5609,22 @@ class RouletteContinueView(discord.ui.View):
             
             # Cash out - player gets their stake back
             player = game.players[current_player_id]
-            winnings = normalize_money(player['current_stake'])
+            winnings = normalize_money(player.current_stake)
             
             # Add winnings to player balance
-            current_balance = get_user_balance(current_player_id)
-            current_balance = normalize_money(current_balance)
-            new_balance = normalize_money(current_balance + winnings)
-            update_user_balance(current_player_id, new_balance)
+            await _settle_roulette_escrow(self.game_id, current_player_id)
+            await asyncio.to_thread(refund_balance, current_player_id, winnings)
             
             # Remove from active games
             if current_player_id in user_active_games:
                 del user_active_games[current_player_id]
             
             # Mark player as eliminated (cashed out)
-            game.players[current_player_id]['alive'] = False
-            game.players[current_player_id]['cashed_out'] = True
+            game.cash_out(current_player_id)
             
             embed = discord.Embed(
                 title="💰 CASHED OUT! 💰",
-                description=f"**{player['name']}** decided to walk away!",
+                description=f"**{player.name}** decided to walk away!",
                 color=discord.Color.gold()
             )
             embed.add_field(name="💵 Winnings", value=format_money(winnings), inline=True)
@@ -5555,8 +5633,8 @@ class RouletteContinueView(discord.ui.View):
                 value=format_money(normalize_money(winnings - normalize_money(game.bet_amount))),
                 inline=True,
             )
-            embed.add_field(name="📈 Multiplier Achieved", value=f"{game.calculate_total_multiplier(player['rounds_survived']):.2f}x", inline=True)
-            embed.add_field(name="🎯 Rounds Survived", value=f"{player['rounds_survived']}", inline=True)
+            embed.add_field(name="📈 Multiplier Achieved", value=f"{game.calculate_total_multiplier(player.rounds_survived):.2f}x", inline=True)
+            embed.add_field(name="🎯 Rounds Survived", value=f"{player.rounds_survived}", inline=True)
             
             try:
                 await interaction.message.edit(embed=embed, view=None)
@@ -5565,18 +5643,18 @@ class RouletteContinueView(discord.ui.View):
             
             # Check for hidden achievement: Beating The Odds (cashout with 5 bullets = 5/6 death chance)
             # Send as ephemeral message to the user
-            if game.initial_bullets == 5 and unlock_hidden_achievement(current_player_id, "beating_the_odds"):
+            if game.initial_bullets == 5 and await asyncio.to_thread(unlock_hidden_achievement, current_player_id, "beating_the_odds"):
                 try:
                     # Send ephemeral notification to the user who cashed out
                     await send_hidden_achievement_notification(interaction, "beating_the_odds")
-                except Exception as e:
-                    print(f"Error sending Beating The Odds achievement notification: {e}")
+                except Exception:
+                    logger.exception("Error sending Beating The Odds achievement notification")
             
             # Check russian roulette achievement (cashout = game completed)
             await check_russian_roulette_achievement(current_player_id, interaction=interaction)
             
             # Check if game ends
-            alive_count = len(game.get_alive_players())
+            alive_count = game.alive_count()
             
             if alive_count == 0 or (alive_count == 1 and game.max_players > 1):
                 await asyncio.sleep(2)
@@ -5585,8 +5663,8 @@ class RouletteContinueView(discord.ui.View):
                 game.next_turn()
                 await asyncio.sleep(2)
                 await play_roulette_round(interaction.channel, self.game_id)
-        except Exception as e:
-            print(f"Error in cashout_button: {e}")
+        except Exception:
+            logger.exception("Error in cashout_button")
             await safe_interaction_response(interaction, interaction.response.send_message, "❌ An error occurred. Please try again.", ephemeral=True)
     
     async def on_timeout(self):
@@ -5601,44 +5679,36 @@ class RouletteContinueView(discord.ui.View):
             return
 
         # Check if player is still alive (hasn't already been eliminated)
-        if current_player_id not in game.players or not game.players[current_player_id]['alive']:
+        player = game.players.get(current_player_id)
+        if player is None or not player.alive:
             return
 
-        # Get the message channel - try game.channel_id first, then fallback to channel_games map
+        # Get the message channel (channel_id is set when the game is registered in /russian)
         channel = bot.get_channel(game.channel_id) if game.channel_id else None
-        if channel is None:
-            for ch_id, tracked_game_id in active_roulette_channel_games.items():
-                if tracked_game_id == self.game_id:
-                    channel = bot.get_channel(ch_id)
-                    break
 
         if channel is None:
             # Channel not found — force-cleanup the stuck game so it doesn't block forever
-            print(f"RouletteContinueView timeout: channel not found for game {self.game_id}, force-cleaning up")
-            _force_cleanup_roulette_game(self.game_id, refund=True)
+            logger.warning("RouletteContinueView timeout: channel not found for game %s, force-cleaning up", self.game_id)
+            await _force_cleanup_roulette_game(self.game_id, refund=True)
             return
 
         # Cash out - player gets their stake back
-        player = game.players[current_player_id]
-        winnings = normalize_money(player['current_stake'])
+        winnings = normalize_money(player.current_stake)
 
         # Add winnings to player balance
-        current_balance = get_user_balance(current_player_id)
-        current_balance = normalize_money(current_balance)
-        new_balance = normalize_money(current_balance + winnings)
-        update_user_balance(current_player_id, new_balance)
+        await _settle_roulette_escrow(self.game_id, current_player_id)
+        await asyncio.to_thread(refund_balance, current_player_id, winnings)
 
         # Remove from active games
         if current_player_id in user_active_games:
             del user_active_games[current_player_id]
 
         # Mark player as eliminated (cashed out)
-        game.players[current_player_id]['alive'] = False
-        game.players[current_player_id]['cashed_out'] = True
+        game.cash_out(current_player_id)
 
         embed = discord.Embed(
             title="💰 AUTO CASHED OUT! 💰",
-            description=f"**{player['name']}** timed out and was automatically cashed out!",
+            description=f"**{player.name}** timed out and was automatically cashed out!",
             color=discord.Color.orange()
         )
         embed.add_field(name="💵 Winnings", value=format_money(winnings), inline=True)
@@ -5647,8 +5717,8 @@ class RouletteContinueView(discord.ui.View):
             value=format_money(normalize_money(winnings - normalize_money(game.bet_amount))),
             inline=True,
         )
-        embed.add_field(name="📈 Multiplier Achieved", value=f"{game.calculate_total_multiplier(player['rounds_survived']):.2f}x", inline=True)
-        embed.add_field(name="🎯 Rounds Survived", value=f"{player['rounds_survived']}", inline=True)
+        embed.add_field(name="📈 Multiplier Achieved", value=f"{game.calculate_total_multiplier(player.rounds_survived):.2f}x", inline=True)
+        embed.add_field(name="🎯 Rounds Survived", value=f"{player.rounds_survived}", inline=True)
 
         await channel.send(embed=embed)
 
@@ -5656,7 +5726,7 @@ class RouletteContinueView(discord.ui.View):
         await check_russian_roulette_achievement(current_player_id)
 
         # Check if game ends
-        alive_count = len(game.get_alive_players())
+        alive_count = game.alive_count()
 
         if alive_count == 0 or (alive_count == 1 and game.max_players > 1):
             await asyncio.sleep(2)
@@ -5682,11 +5752,11 @@ async def end_roulette_game(channel, game_id):
         winner = game.players[winner_id]
         
         # Winner gets pot + their stake
-        total_winnings = game.pot + winner['current_stake']
+        total_winnings = game.pot + winner.current_stake
         
         # Add winnings to balance
-        current_balance = get_user_balance(winner_id)
-        update_user_balance(winner_id, current_balance + total_winnings)
+        await _settle_roulette_escrow(game_id, winner_id)
+        await asyncio.to_thread(refund_balance, winner_id, total_winnings)
         
         # Remove from active games
         if winner_id in user_active_games:
@@ -5697,13 +5767,13 @@ async def end_roulette_game(channel, game_id):
         
         embed = discord.Embed(
             title="🏆 WINNER! 🏆",
-            description=f"**{winner['name']}** is the last one standing!",
+            description=f"**{winner.name}** is the last one standing!",
             color=discord.Color.gold()
         )
         embed.add_field(name="💰 Total Winnings", value=format_money(total_winnings), inline=True)
         embed.add_field(name="💸 Net Profit", value=format_money(profit), inline=True)
-        embed.add_field(name="📈 Final Multiplier", value=f"{game.calculate_total_multiplier(winner['rounds_survived']):.2f}x", inline=True)
-        embed.add_field(name="🎯 Rounds Survived", value=f"{winner['rounds_survived']}", inline=True)
+        embed.add_field(name="📈 Final Multiplier", value=f"{game.calculate_total_multiplier(winner.rounds_survived):.2f}x", inline=True)
+        embed.add_field(name="🎯 Rounds Survived", value=f"{winner.rounds_survived}", inline=True)
         embed.add_field(name="💀 Opponents Eliminated", value=f"{len(game.players) - 1}", inline=True)
         embed.add_field(name="🔫 Initial Bullets", value=f"{game.initial_bullets}/6", inline=True)
         
@@ -5711,7 +5781,7 @@ async def end_roulette_game(channel, game_id):
         if game.max_players == 1:
             embed.add_field(
                 name="🎮 You walked away..", 
-                value=f"You survived **{winner['rounds_survived']}** rounds with **{game.initial_bullets}** bullets!",
+                value=f"You survived **{winner.rounds_survived}** rounds with **{game.initial_bullets}** bullets!",
                 inline=False
             )
         
@@ -5722,8 +5792,8 @@ async def end_roulette_game(channel, game_id):
         
     elif len(alive_players) == 0:
         # Check if everyone cashed out vs everyone died vs mixed (some cashed out, some died)
-        everyone_cashed_out = all(data.get("cashed_out", False) for data in game.players.values())
-        everyone_died = not any(data.get("cashed_out", False) for data in game.players.values())
+        everyone_cashed_out = all(data.cashed_out for data in game.players.values())
+        everyone_died = not any(data.cashed_out for data in game.players.values())
         
         if everyone_cashed_out:
             # Results screen: everyone left with their winnings
@@ -5733,15 +5803,15 @@ async def end_roulette_game(channel, game_id):
                 color=discord.Color.gold()
             )
             for player_id, data in game.players.items():
-                winnings = normalize_money(data["current_stake"])
+                winnings = normalize_money(data.current_stake)
                 profit = normalize_money(winnings - normalize_money(game.bet_amount))
-                mult = game.calculate_total_multiplier(data["rounds_survived"])
+                mult = game.calculate_total_multiplier(data.rounds_survived)
                 embed.add_field(
-                    name=f"**{data['name']}**",
+                    name=f"**{data.name}**",
                     value=(
                         f"💵 {format_money(winnings)} winnings | "
                         f"💸 {format_signed_money(profit)} profit\n"
-                        f"📈 {mult:.2f}x multiplier | 🎯 {data['rounds_survived']} rounds"
+                        f"📈 {mult:.2f}x multiplier | 🎯 {data.rounds_survived} rounds"
                     ),
                     inline=False
                 )
@@ -5751,7 +5821,7 @@ async def end_roulette_game(channel, game_id):
             embed = discord.Embed(
                 title="☠️ EVERYONE ELIMINATED ☠️",
                 description="Nobody survived... The pot is lost to the void.",
-                color=discord.Color.dark_red()
+                color=DARK_RED
             )
             embed.add_field(name="💰 Lost Pot", value=format_money(game.pot), inline=True)
             await channel.send(embed=embed)
@@ -5763,72 +5833,118 @@ async def end_roulette_game(channel, game_id):
                 color=discord.Color.blue()
             )
             for player_id, data in game.players.items():
-                if data.get("cashed_out", False):
-                    winnings = normalize_money(data["current_stake"])
+                if data.cashed_out:
+                    winnings = normalize_money(data.current_stake)
                     profit = normalize_money(winnings - normalize_money(game.bet_amount))
-                    mult = game.calculate_total_multiplier(data["rounds_survived"])
+                    mult = game.calculate_total_multiplier(data.rounds_survived)
                     embed.add_field(
-                        name=f"**{data['name']}** — Cashed out",
+                        name=f"**{data.name}** — Cashed out",
                         value=(
                             f"💵 {format_money(winnings)} winnings | "
                             f"💸 {format_signed_money(profit)} profit\n"
-                            f"📈 {mult:.2f}x multiplier | 🎯 {data['rounds_survived']} rounds"
+                            f"📈 {mult:.2f}x multiplier | 🎯 {data.rounds_survived} rounds"
                         ),
                         inline=False
                     )
                 else:
-                    lost = normalize_money(data["current_stake"])
+                    lost = normalize_money(data.current_stake)
                     embed.add_field(
-                        name=f"**{data['name']}** — Eliminated",
+                        name=f"**{data.name}** — Eliminated",
                         value=f"💀 Lost {format_money(lost)}",
                         inline=False
                     )
             await channel.send(embed=embed)
     
-    # Clean up - remove all players from active games tracker
-    for player_id in game.players.keys():
-        if player_id in user_active_games:
+    # Clean up - remove the game and all its players from the active games trackers
+    _untrack_roulette_game(game)
+
+
+def _untrack_roulette_game(game: RouletteGame):
+    """Remove a game from active_roulette_games, user_active_games and active_roulette_channel_games.
+
+    Uses game.channel_id and game.players as the reverse index, so this is O(players) rather than a scan
+    of every tracked user/channel. Refs that already point at a different game are left alone.
+    """
+    game_id = game.game_id
+    if active_roulette_games.get(game_id) is game:
+        del active_roulette_games[game_id]
+    if game.channel_id is not None and active_roulette_channel_games.get(game.channel_id) == game_id:
+        del active_roulette_channel_games[game.channel_id]
+    for player_id in game.players.keys() & user_active_games.keys():
+        if user_active_games[player_id] == game_id:
             del user_active_games[player_id]
-    
-    # Clean up game
-    del active_roulette_games[game_id]
-    for channel_id, tracked_game_id in list(active_roulette_channel_games.items()):
-        if tracked_game_id == game_id:
-            del active_roulette_channel_games[channel_id]
-            break
+    # Every stake is settled (paid out, refunded or lost) by the time a game is untracked
+    _roulette_escrow_bg(clear_roulette_escrow, game_id)
 
 
-def _force_cleanup_roulette_game(game_id: str, refund: bool = True):
-    """Force-cleanup a stuck/stale roulette game. Refunds all alive players and removes all tracking."""
-    if game_id not in active_roulette_games:
+def _roulette_escrow_bg(func, *args):
+    """Run a roulette escrow write off the event loop without making the game wait on it."""
+    async def _run():
+        try:
+            await asyncio.to_thread(func, *args)
+        except Exception:
+            logger.exception("Error updating roulette escrow (%s%s)", func.__name__, args)
+    task = asyncio.create_task(_run())
+    _roulette_tasks.add(task)
+    task.add_done_callback(_roulette_tasks.discard)
+
+
+async def _settle_roulette_escrow(game_id: str, user_id: int | None = None):
+    """Drop a player's escrow entry (or the whole game's, if user_id is None) BEFORE crediting their
+    payout/refund, so a crash in between can't make the startup escrow refund pay the stake twice.
+    Failures are logged and swallowed: the payout itself must still go through."""
+    try:
+        if user_id is None:
+            await asyncio.to_thread(clear_roulette_escrow, game_id)
+        else:
+            await asyncio.to_thread(release_roulette_escrow, game_id, user_id)
+    except Exception:
+        logger.exception("Error settling roulette escrow for game %s (user %s)", game_id, user_id)
+
+
+async def _force_cleanup_roulette_game(game_id: str, refund: bool = True):
+    """Force-cleanup a stuck/stale roulette game. Refunds all alive players and removes all tracking."""
+    if game_id not in active_roulette_games:
         return
     game = active_roulette_games[game_id]
-    if refund:
-        for player_id, data in game.players.items():
-            if data["alive"] and not data.get("cashed_out", False):
-                try:
-                    current_balance = get_user_balance(player_id)
-                    current_balance = normalize_money(current_balance)
-                    refund_amount = normalize_money(data["current_stake"])
-                    new_balance = normalize_money(current_balance + refund_amount)
-                    update_user_balance(player_id, new_balance)
-                except Exception as e:
-                    print(f"Error refunding player {player_id} during force cleanup: {e}")
-    # Remove all players from active games tracker
-    for player_id in game.players.keys():
-        if player_id in user_active_games:
-            del user_active_games[player_id]
-    # Remove game
-    del active_roulette_games[game_id]
-    for ch_id, tracked_game_id in list(active_roulette_channel_games.items()):
-        if tracked_game_id == game_id:
-            del active_roulette_channel_games[ch_id]
-            break
-    print(f"Force-cleaned up roulette game {game_id} (refund={refund})")
+    refunds = {
+        player_id: normalize_money(data.current_stake)
+        for player_id, data in game.players.items()
+        if data.alive and not data.cashed_out
+    } if refund else {}
+    # Untrack before the first await so a concurrent cleanup of the same game finds nothing to refund
+    _untrack_roulette_game(game)
+    if refunds:
+        try:
+            await _settle_roulette_escrow(game_id)
+            await asyncio.to_thread(refund_balances, refunds)
+        except Exception:
+            logger.exception("Error refunding players of game %s during force cleanup; unrefunded amounts: %s", game_id, refunds)
+    logger.info("Force-cleaned up roulette game %s (refund=%s)", game_id, refund)
+
+
+def _reap_orphan(container: dict, key, active_games: dict) -> bool:
+    """Return True if container[key] points at a game still in active_games; drop the ref if it's orphaned."""
+    game_id = container.get(key)
+    if game_id is None:
+        return False
+    if game_id in active_games:
+        return True
+    del container[key]
+    return False
+
+
+def _reap_roulette_orphans():
+    """Drop user/channel refs whose game is no longer in active_roulette_games."""
+    for container in (user_active_games, active_roulette_channel_games):
+        orphaned = [key for key, gid in container.items() if gid not in active_roulette_games]
+        for key in orphaned:
+            del container[key]
 
 
 async def roulette_stale_game_cleanup():
-    """Background task: clean up roulette games that exceed ROULETTE_GAME_MAX_LIFETIME (stuck/abandoned)."""
+    """Background task: clean up roulette games that exceed ROULETTE_GAME_MAX_LIFETIME (stuck/abandoned)
+    and sweep orphaned user/channel refs."""
     await bot.wait_until_ready()
     await asyncio.sleep(30)
     while not bot.is_closed():
@@ -5843,12 +5959,7 @@ async def roulette_stale_game_cleanup():
                 if not game:
                     continue
                 channel = bot.get_channel(game.channel_id) if game.channel_id else None
-                if channel is None:
-                    for ch_id, tracked_gid in active_roulette_channel_games.items():
-                        if tracked_gid == game_id:
-                            channel = bot.get_channel(ch_id)
-                            break
-                _force_cleanup_roulette_game(game_id, refund=True)
+                await _force_cleanup_roulette_game(game_id, refund=True)
                 if channel:
                     try:
                         embed = discord.Embed(
@@ -5857,10 +5968,14 @@ async def roulette_stale_game_cleanup():
                             color=discord.Color.orange()
                         )
                         await channel.send(embed=embed)
-                    except Exception as e:
-                        print(f"Error sending stale game cleanup message: {e}")
-        except Exception as e:
-            print(f"Error in roulette_stale_game_cleanup: {e}")
+                    except Exception:
+                        logger.exception("Error sending stale game cleanup message for game %s", game_id)
+            _reap_roulette_orphans()
+            # Keep this instance's escrow claimed, and pick up stakes of instances that died mid-game
+            await asyncio.to_thread(heartbeat_roulette_escrow_owner)
+            await asyncio.to_thread(refund_orphaned_roulette_escrow)
+        except Exception:
+            logger.exception("Error in roulette_stale_game_cleanup")
         await asyncio.sleep(60)
 
 
@@ -6081,6 +6196,8 @@ def _gathemon_pick_random_move(moves: list, last_used_move_index: int | None = N
 active_gathemon_challenges = {}  # challenge_id -> { challenger_id, opponent_id, bet }
 active_gathemon_battles = {}     # game_id -> GathemonBattle
 user_active_gathemon = {}        # user_id -> game_id
+# Challenge and battle IDs share one in-process counter (seeded from startup time), rendered as hex like roulette's
+_gathemon_id_counter = itertools.count(int(time.time()))
 
 
 class GathemonBattle:
@@ -6331,7 +6448,8 @@ class GathemonLobbyView(discord.ui.View):
             await safe_interaction_response(interaction, interaction.response.send_message, "❌ Challenge no longer exists!", ephemeral=False)
             return
         chall = active_gathemon_challenges[self.challenge_id]
-        if self.challenger_id in user_active_gathemon or self.opponent_id in user_active_gathemon:
+        if (_reap_orphan(user_active_gathemon, self.challenger_id, active_gathemon_battles)
+                or _reap_orphan(user_active_gathemon, self.opponent_id, active_gathemon_battles)):
             await safe_interaction_response(interaction, interaction.response.send_message, "❌ You or the challenger is already in a GathéMon battle!", ephemeral=False)
             return
         bet = self.bet
@@ -6346,7 +6464,7 @@ class GathemonLobbyView(discord.ui.View):
             await safe_interaction_response(interaction, interaction.response.send_message, "❌ You don't have enough plants!", ephemeral=False)
             return
         del active_gathemon_challenges[self.challenge_id]
-        game_id = str(uuid.uuid4())[:8]
+        game_id = format(next(_gathemon_id_counter), 'x')
         channel_id = interaction.channel_id
         member = interaction.guild.get_member(self.challenger_id) if interaction.guild else None
         challenger_name = member.name if member else (interaction.client.get_user(self.challenger_id).name if interaction.client.get_user(self.challenger_id) else "Challenger")
@@ -6478,7 +6596,7 @@ class GathemonUseMoveButton(discord.ui.Button):
             winner_id = battle.player1_id if is_p1 else battle.player2_id
             loser_id = battle.player2_id if is_p1 else battle.player1_id
             num_plants_won = battle.bet * 2
-            if has_shop_item(winner_id, "rare_candy"):
+            if await asyncio.to_thread(has_shop_item, winner_id, "rare_candy"):
                 num_plants_won += 2
             channel = interaction.channel
             battle.exp_gained = random.randint(23, 53)  # for embed: winner's Pokemon gained X Exp.
@@ -6512,6 +6630,7 @@ CURSOR_EMOJI = "📍"
 active_gathership_games = {}
 user_active_gathership = {}  # user_id -> game_id
 channel_gathership = {}  # channel_id -> game_id
+_gathership_game_id_counter = itertools.count(int(time.time()))
 
 
 class GathershipGame:
@@ -6627,9 +6746,7 @@ async def _gathership_refund_and_cleanup(game_id: str, channel=None):
     bet = normalize_money(game.bet)
     for uid in (game.host_id, game.opponent_id):
         try:
-            bal = get_user_balance(uid)
-            new_bal = normalize_money(bal + bet)
-            update_user_balance(uid, new_bal)
+            await asyncio.to_thread(refund_balance, uid, bet)
         except Exception as e:
             print(f"Gathership refund error for {uid}: {e}")
         if uid in user_active_gathership:
@@ -6651,8 +6768,7 @@ async def end_gathership_game(channel, game_id: str, winner_id: int, loser_id: i
         return
     game = active_gathership_games[game_id]
     total_pot = normalize_money(game.bet * 2)
-    current = get_user_balance(winner_id)
-    update_user_balance(winner_id, normalize_money(current + total_pot))
+    await asyncio.to_thread(refund_balance, winner_id, total_pot)
     for uid in (game.host_id, game.opponent_id):
         if uid in user_active_gathership:
             del user_active_gathership[uid]
@@ -6720,12 +6836,15 @@ class GathershipLobbyView(discord.ui.View):
             if interaction.user.id in user_active_gathership:
                 await safe_interaction_response(interaction, interaction.response.send_message, "❌ You're already in a Mayflower game!", ephemeral=True)
                 return
-            bal = get_user_balance(interaction.user.id)
-            if not can_afford_rounded(normalize_money(bal), game.bet):
+            success, _ = await asyncio.to_thread(atomic_deduct_balance, interaction.user.id, game.bet)
+            if not success:
                 await safe_interaction_response(interaction, interaction.response.send_message, "❌ You don't have enough balance to join!", ephemeral=True)
                 return
-            new_bal = normalize_money(bal - game.bet)
-            update_user_balance(interaction.user.id, new_bal)
+            # Re-check after the await: the lobby may have been cancelled or the user joined elsewhere
+            if self.game_id not in active_gathership_games or game.phase != "lobby" or interaction.user.id in user_active_gathership:
+                await asyncio.to_thread(refund_balance, interaction.user.id, game.bet)
+                await safe_interaction_response(interaction, interaction.response.send_message, "❌ Couldn't join: the game is no longer open. Your bet was refunded.", ephemeral=True)
+                return
             user_active_gathership[interaction.user.id] = self.game_id
             embed = interaction.message.embeds[0]
             host_mention = f"<@{game.host_id}>"
@@ -7113,15 +7232,10 @@ def _coinflip_critical_path(user_id: int, bet: float, choice: str) -> dict:
         if elapsed < COINFLIP_LOSS_COOLDOWN:
             return {"cooldown": True, "wait_secs": int(COINFLIP_LOSS_COOLDOWN - elapsed)}
 
-    current_balance = get_user_balance(user_id)
-    current_balance = normalize_money(current_balance)
-
-    if not can_afford_rounded(current_balance, bet):
-        return {"cant_afford": True, "balance": current_balance}
-
-    # Deduct bet
-    new_balance_after_bet = normalize_money(current_balance - bet)
-    update_user_balance(user_id, new_balance_after_bet)
+    # Deduct bet only if affordable (single conditional $inc)
+    success, new_balance_after_bet = atomic_deduct_balance(user_id, bet)
+    if not success:
+        return {"cant_afford": True, "balance": new_balance_after_bet}
 
     # Flip
     coin_result = random.choice(["heads", "tails"])
@@ -7152,8 +7266,7 @@ def _coinflip_critical_path(user_id: int, bet: float, choice: str) -> dict:
         achievements_unlocked.append(("coinflip_total", new_total_level))
 
     if won:
-        new_balance = normalize_money(new_balance_after_bet + (bet * 2))
-        update_user_balance(user_id, new_balance)
+        new_balance = increment_user_balance(user_id, bet * 2)
     else:
         new_balance = new_balance_after_bet
 
@@ -7234,8 +7347,8 @@ async def coinflip(interaction: discord.Interaction, bet: float, choice: str):
             await send_achievement_notification(interaction, achievement_name, achievement_level)
             # Small delay to ensure proper ordering
             await asyncio.sleep(0.5)
-    except Exception as e:
-        print(f"Error in coinflip command: {e}")
+    except Exception:
+        logger.exception("Error in coinflip command")
         await safe_interaction_response(interaction, interaction.followup.send, "❌ An error occurred. Please try again.", ephemeral=True)
 
 
@@ -7513,9 +7626,12 @@ def _slots_spin_critical_path(
                 "error": "insufficient_balance",
                 "balance": balance,
             }
-        new_balance = normalize_money(balance - bet)
-        update_user_balance(user_id, new_balance)
-        balance = new_balance
+        success, balance = atomic_deduct_balance(user_id, bet)
+        if not success:
+            return {
+                "error": "insufficient_balance",
+                "balance": balance,
+            }
 
     middle_only = bet_type == "0.1%"
     final_grid = generate_slot_grid(bet=effective_bet, balance=balance, middle_only=middle_only)
@@ -7532,11 +7648,7 @@ def _slots_spin_critical_path(
         cap_mult = 15
         if line_count > cap_mult:
             winnings = effective_bet * payout_mult * cap_mult
-        curr = get_user_balance(user_id)
-        curr = normalize_money(curr)
-        new_bal = normalize_money(curr + winnings)
-        update_user_balance(user_id, new_bal)
-        balance = new_bal
+        balance = increment_user_balance(user_id, winnings)
 
     # Slots achievements: spin count + win streak (hidden 777 = 3 wins in a row)
     increment_user_slots_spin_count(user_id)
@@ -7736,8 +7848,8 @@ class SlotsView(discord.ui.View):
             self._update_spin_button()
             embed = await self.update_embed()
             await safe_interaction_response(interaction, interaction.response.edit_message, embed=embed, view=self)
-        except Exception as e:
-            print(f"Error in bet_01pct: {e}")
+        except Exception:
+            logger.exception("Error in bet_01pct")
             await safe_interaction_response(interaction, interaction.response.send_message, "❌ An error occurred.", ephemeral=True)
 
     @discord.ui.button(label="1%", style=discord.ButtonStyle.secondary, custom_id="slots_1pct", row=0)
@@ -7752,8 +7864,8 @@ class SlotsView(discord.ui.View):
             self._update_spin_button()
             embed = await self.update_embed()
             await safe_interaction_response(interaction, interaction.response.edit_message, embed=embed, view=self)
-        except Exception as e:
-            print(f"Error in bet_1pct: {e}")
+        except Exception:
+            logger.exception("Error in bet_1pct")
             await safe_interaction_response(interaction, interaction.response.send_message, "❌ An error occurred.", ephemeral=True)
 
     @discord.ui.button(label="SPIN", style=discord.ButtonStyle.success, emoji="🎲", custom_id="slots_spin", row=0)
@@ -7769,8 +7881,8 @@ class SlotsView(discord.ui.View):
                 return
             self.spinning = True
             await self.animate_spin(interaction)
-        except Exception as e:
-            print(f"Error in spin_button: {e}")
+        except Exception:
+            logger.exception("Error in spin_button")
             await safe_interaction_response(interaction, interaction.response.send_message, "❌ An error occurred. Please try again.", ephemeral=True)
 
 
@@ -7802,8 +7914,8 @@ async def slots(interaction: discord.Interaction):
         view._update_spin_button()
         embed = await view.update_embed()
         await safe_interaction_response(interaction, interaction.followup.send, embed=embed, view=view)
-    except Exception as e:
-        print(f"Error in slots command: {e}")
+    except Exception:
+        logger.exception("Error in slots command")
         await safe_interaction_response(interaction, interaction.followup.send, "❌ An error occurred. Please try again.", ephemeral=True)
 
 
@@ -7827,9 +7939,29 @@ async def mongodb_keepalive_task():
 
 
 
+async def _cache_guild_invites():
+    """Snapshot invite use counts for every guild (needs "Manage Server" permission) for invite tracking."""
+    global _invite_cache
+    _invite_cache = {}
+    for guild in bot.guilds:
+        try:
+            invites = await guild.invites()
+            _invite_cache[guild.id] = {inv.code: inv.uses for inv in invites}
+        except discord.Forbidden:
+            print(f"[Invites] No permission to read invites in {guild.name} — enable 'Manage Server' for invite tracking.")
+        except Exception as e:
+            print(f"[Invites] Error caching invites for {guild.name}: {e}")
+
+
+# on_ready also fires after every gateway reconnect; command sync, startup recovery and the
+# background loops below must only run once per process
+_startup_done = False
+
+
 # on ready
 @bot.event
 async def on_ready():
+    global _startup_done
     print(f"Slash Gather, {bot.user.name}")
     #set bot status
     await bot.change_presence(
@@ -7838,6 +7970,13 @@ async def on_ready():
             name="running /gather on V1.1.2"
         )
     )
+    if _startup_done:
+        # Reconnect: commands are synced and tasks are running; just refresh invite counts we may have missed
+        print("Reconnected to gateway, skipping startup work")
+        await _cache_guild_invites()
+        return
+    _startup_done = True
+
     try:
         synced = await bot.tree.sync()
         print(f"Synced {len(synced)} commands globally")
@@ -7953,17 +8092,8 @@ async def on_ready():
     bot.loop.create_task(roulette_stale_game_cleanup())
     print("Started roulette stale game cleanup task")
 
-    # Cache invites for invite tracking (needs "Manage Server" permission)
-    global _invite_cache
-    _invite_cache = {}
-    for guild in bot.guilds:
-        try:
-            invites = await guild.invites()
-            _invite_cache[guild.id] = {inv.code: inv.uses for inv in invites}
-        except discord.Forbidden:
-            print(f"[Invites] No permission to read invites in {guild.name} — enable 'Manage Server' for invite tracking.")
-        except Exception as e:
-            print(f"[Invites] Error caching invites for {guild.name}: {e}")
+    # Cache invites for invite tracking
+    await _cache_guild_invites()
 
 
 @bot.event
@@ -8002,7 +8132,7 @@ async def on_member_join(member):
             print(f"[Invites] Error incrementing invite count for {inviter.id}: {e}")
 
     # Send welcome message in #welcome channel
-    welcome_channel = discord.utils.get(guild.text_channels, name="welcome")
+    welcome_channel = _get_text_channel(guild, "welcome")
     if welcome_channel:
         try:
             if inviter:
@@ -8116,6 +8246,42 @@ async def on_invite_delete(invite):
         del _invite_cache[guild_id][invite.code]
 
 
+@bot.event
+async def on_guild_channel_create(channel):
+    _text_channel_cache.pop(channel.guild.id, None)
+
+
+@bot.event
+async def on_guild_channel_update(before, after):
+    """Drop the cached roulette-channel classification and name index when a channel is renamed/moved."""
+    if getattr(before, "name", None) != getattr(after, "name", None):
+        _is_roulette_channel.pop(after.id, None)
+        _text_channel_cache.pop(after.guild.id, None)
+    elif getattr(before, "position", None) != getattr(after, "position", None):
+        _text_channel_cache.pop(after.guild.id, None)
+
+
+@bot.event
+async def on_guild_channel_delete(channel):
+    _is_roulette_channel.pop(channel.id, None)
+    _text_channel_cache.pop(channel.guild.id, None)
+
+
+@bot.event
+async def on_guild_role_create(role):
+    _role_cache.pop(role.guild.id, None)
+
+
+@bot.event
+async def on_guild_role_update(before, after):
+    _role_cache.pop(after.guild.id, None)
+
+
+@bot.event
+async def on_guild_role_delete(role):
+    _role_cache.pop(role.guild.id, None)
+
+
 # ----- Auto-log rare occurrences to #rares -----
 # Only these plant ripenesses get posted to #rares (NOT Perfectly Ripe or Full Bloom — those are too common).
 # Also posted to #rares: netherite+ imbue rolls (_post_rares_imbue), Nether Star claims (_post_rares_nether_star_claim), Black Shard claims (_post_rares_black_shard_claim).
@@ -8153,7 +8319,7 @@ async def _post_to_rares_channel(guild: discord.Guild, content: str) -> None:
     if not guild:
         return
     try:
-        rares_ch = discord.utils.get(guild.text_channels, name=RARES_CHANNEL_NAME)
+        rares_ch = _get_text_channel(guild, RARES_CHANNEL_NAME)
         if rares_ch:
             await rares_ch.send(content)
     except Exception as e:
@@ -8272,6 +8438,10 @@ def _gather_critical_path(member, user_id: int, channel_name: str, area: dict) -
             almost_unlocked = unlock_hidden_achievement(user_id, "almost_got_it")
         return {"on_cooldown": True, "time_left": time_left,
                 "is_roulette": is_roulette, "almost_unlocked": almost_unlocked}
+    # Claim the cooldown atomically so a concurrent /gather that read the same timestamp loses
+    if not claim_cooldown(user_id, "last_gather_time", full_data.get("last_gather_time", 0)):
+        return {"on_cooldown": True, "time_left": GATHER_COOLDOWN,
+                "is_roulette": False, "almost_unlocked": False}
 
     # --- perform gather + cooldown + command-count in ONE write ---
     gather_result = _perform_gather_for_user_sync(
@@ -8340,7 +8510,10 @@ async def _gather_post_response(interaction: discord.Interaction, user_id: int,
             _planter_role_locks[user_id] = asyncio.Lock()
         async with _planter_role_locks[user_id]:
             try:
-                old_role, new_role = await assign_gatherer_role(interaction.user, interaction.guild)
+                # Ranks only move at PLANTER_THRESHOLDS; skip the member fetch + role edit when the cached role already matches
+                gathered = gather_result.get("num_items", 1)
+                if not planter_role_is_current(interaction.user, full_data.get("bloom_cycle_plants", 0) + gathered):
+                    old_role, new_role = await assign_gatherer_role(interaction.user, interaction.guild)
             except Exception as e:
                 print(f"Error assigning gatherer role to user {user_id}: {e}")
 
@@ -8406,8 +8579,8 @@ async def _gather_post_response(interaction: discord.Interaction, user_id: int,
 
         # Almanac achievements (level + section hidden)
         await check_almanac_achievements_async(user_id, interaction, interaction.user.mention)
-    except Exception as e:
-        print(f"Error in gather post-response: {e}")
+    except Exception:
+        logger.exception("Error in gather post-response")
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -8508,8 +8681,7 @@ class StealView(discord.ui.View):
             # Decoys: victim gets 15% of stolen value back
             if has_shop_item(victim_id, "decoys") and stolen_value > 0:
                 decoy_refund = round(stolen_value * 0.15, 2)
-                victim_bal = get_user_balance(victim_id)
-                update_user_balance(victim_id, victim_bal + decoy_refund)
+                increment_user_balance(victim_id, decoy_refund)
             # Return stealer's updated balance for embed
             return get_user_balance(stealer_id)
 
@@ -8538,7 +8710,7 @@ class StealView(discord.ui.View):
         stealer_name = interaction.user.display_name
         # Decoys: show victim's 15% back in embed if applicable
         stolen_val = payload["value"] if self.steal_type == "gather" else payload["total_value"]
-        decoy_refund = round(stolen_val * 0.15, 2) if has_shop_item(self.victim_id, "decoys") and stolen_val > 0 else 0
+        decoy_refund = round(stolen_val * 0.15, 2) if stolen_val > 0 and await asyncio.to_thread(has_shop_item, self.victim_id, "decoys") else 0
         try:
             old_embed = interaction.message.embeds[0] if interaction.message.embeds else None
             if self.steal_type in ("gather", "harvest") and old_embed:
@@ -9528,8 +9700,8 @@ class SansView(discord.ui.View):
                 if self._update_task is None or self._update_task.done():
                     msg = getattr(interaction, "message", None)
                     self._update_task = asyncio.create_task(self._debounced_update(msg))
-        except Exception as e:
-            print(f"Error in Sans FIGHT button: {e}")
+        except Exception:
+            logger.exception("Error in Sans FIGHT button")
             try:
                 await safe_interaction_response(interaction, interaction.followup.send,
                     "❌ An error occurred. Please try again.", ephemeral=True)
@@ -9597,8 +9769,8 @@ class SansView(discord.ui.View):
                 time_str = f"{minutes}m {seconds}s" if minutes > 0 else f"{seconds}s"
                 await safe_interaction_response(interaction, interaction.followup.send,
                     f"{SOUL_EMOJI} **GAME OVER** - You're dead for **{time_str}**.", ephemeral=True)
-        except Exception as e:
-            print(f"Error in Sans MERCY button: {e}")
+        except Exception:
+            logger.exception("Error in Sans MERCY button")
             try:
                 await safe_interaction_response(interaction, interaction.followup.send,
                     "❌ An error occurred. Please try again.", ephemeral=True)
@@ -9618,7 +9790,7 @@ async def _send_boss_warning_embed(guild: discord.Guild, boss: dict, spawn_chann
         try:
             if ch.permissions_for(guild.me).send_messages:
                 if ch.id == spawn_channel.id:
-                    await ch.send("@here", embed=embed)
+                    await ch.send("@here", embed=embed, allowed_mentions=MENTION_HERE)
                 else:
                     await ch.send(embed=embed)
         except Exception as e:
@@ -10117,17 +10289,10 @@ def _pve_roll_items_and_batch_write(user_id: int, num_items: int, area_multiplie
     hourly_event = next((e for e in active_events if e["event_type"] == "hourly"), None)
     daily_event = next((e for e in active_events if e["event_type"] == "daily"), None)
 
-    # Pre-compute event-adjusted item weights once
-    item_weights = None
+    # Event-adjusted item weights (precomputed at module load)
     hourly_eid = hourly_event.get("effects", {}).get("event_id", "") if hourly_event else ""
     daily_eid = daily_event.get("effects", {}).get("event_id", "") if daily_event else ""
-
-    if hourly_eid == "may_flowers":
-        item_weights = [1.6 if i["category"] == "Flower" else 1.0 for i in GATHERABLE_ITEMS]
-    elif hourly_eid == "fruit_festival":
-        item_weights = [1.5 if i["category"] == "Fruit" else 1.0 for i in GATHERABLE_ITEMS]
-    elif hourly_eid == "vegetable_boom":
-        item_weights = [1.5 if i["category"] == "Vegetable" else 1.0 for i in GATHERABLE_ITEMS]
+    item_cum_weights = GATHER_EVENT_CUM_WEIGHTS.get(hourly_eid)
 
     # Pre-compute user multipliers once (all from full_data, zero extra DB calls)
     user_upgrades = full_data.get("basket_upgrades", {})
@@ -10168,18 +10333,9 @@ def _pve_roll_items_and_batch_write(user_id: int, num_items: int, area_multiplie
     # Additive boost factor (computed once)
     additive_boost = (bloom_mult - 1.0) + (water_mult - 1.0) + (ach_mult - 1.0) + (daily_mult - 1.0) + enchant_pct
 
-    # Pre-compute ripeness weights per category
-    def _ripe_cfg(rlist):
-        base_w = [r["chance"] for r in rlist]
-        if hourly_eid == "perfect_ripeness":
-            return rlist, base_w, True
-        if daily_eid == "ripeness_rush":
-            return rlist, [r["chance"] * 2 if "Perfect" in r["name"] else r["chance"] for r in rlist], False
-        return rlist, base_w, False
-
-    fruit_cfg = _ripe_cfg(LEVEL_OF_RIPENESS_FRUITS)
-    veg_cfg = _ripe_cfg(LEVEL_OF_RIPENESS_VEGETABLES)
-    flower_cfg = _ripe_cfg(LEVEL_OF_RIPENESS_FLOWERS)
+    # Pick the module-level cumulative ripeness weights for the active event
+    perfect_boost = hourly_eid == "perfect_ripeness"
+    ripe_cum = RIPENESS_RUSH_CUM_WEIGHTS if (not perfect_boost and daily_eid == "ripeness_rush") else RIPENESS_CUM_WEIGHTS
 
     # Pre-compute ALL money multipliers ONCE (they don't change per-item)
     beta_mult = get_beta_tester_money_multiplier(user_id)
@@ -10205,7 +10361,7 @@ def _pve_roll_items_and_batch_write(user_id: int, num_items: int, area_multiplie
     display_results = []
 
     for _ in range(num_items):
-        item = random.choices(GATHERABLE_ITEMS, weights=item_weights, k=1)[0] if item_weights else random.choice(GATHERABLE_ITEMS)
+        item = random.choices(GATHERABLE_ITEMS, cum_weights=item_cum_weights, k=1)[0] if item_cum_weights else random.choice(GATHERABLE_ITEMS)
         bv = item["base_value"] * area_multiplier
         cat = item["category"]
 
@@ -10216,18 +10372,11 @@ def _pve_roll_items_and_batch_write(user_id: int, num_items: int, area_multiplie
         elif hourly_eid == "vegetable_boom" and cat == "Vegetable":
             bv *= 2
 
-        if cat == "Fruit":
-            rlist, rw, pb = fruit_cfg
-        elif cat == "Vegetable":
-            rlist, rw, pb = veg_cfg
-        elif cat == "Flower":
-            rlist, rw, pb = flower_cfg
-        else:
-            rlist, rw, pb = [], [], False
+        rlist = RIPENESS_BY_CATEGORY.get(cat)
 
         if rlist:
-            rip = random.choices(rlist, weights=rw, k=1)[0]
-            rm = rip["multiplier"] * 1.5 if pb else rip["multiplier"]
+            rip = random.choices(rlist, cum_weights=ripe_cum[cat], k=1)[0]
+            rm = rip["multiplier"] * 1.5 if perfect_boost else rip["multiplier"]
             fv = bv * rm
         else:
             rip = {"name": "Normal"}
@@ -10259,16 +10408,12 @@ def _pve_roll_items_and_batch_write(user_id: int, num_items: int, area_multiplie
     if has_shop_item(user_id, "paladins_shield"):
         total_balance *= 1.10
     # Single batched DB write
-    pre_total = full_data.get("gather_stats_total_items", 0) or full_data.get("total_forage_count", 0)
-    pre_bloom_cycle = full_data.get("bloom_cycle_plants", 0)
     perform_harvest_batch_update(
         user_id=user_id,
         items_inc=items_inc,
         ripeness_inc=ripeness_inc,
         balance_increment=total_balance,
         num_items=num_items,
-        pre_total_items=pre_total,
-        pre_bloom_cycle=pre_bloom_cycle,
         set_cooldown=False,
         increment_command_count=False,
         almanac_pairs=almanac_pairs,
@@ -10500,8 +10645,7 @@ async def trigger_bee_swarm_event(channel: discord.TextChannel, area_multiplier:
 
 def _weighted_choice_jungle():
     """Pick one underground-jungle animal by spawn_weight (Moth rarer)."""
-    weights = [a.get("spawn_weight", 1.0) for a in PVE_WILD_ANIMALS_UNDERGROUND_JUNGLE_SINGLE]
-    return random.choices(PVE_WILD_ANIMALS_UNDERGROUND_JUNGLE_SINGLE, weights=weights, k=1)[0]
+    return random.choices(PVE_WILD_ANIMALS_UNDERGROUND_JUNGLE_SINGLE, cum_weights=PVE_JUNGLE_SINGLE_CUM_WEIGHTS, k=1)[0]
 
 
 async def trigger_pve_event(channel: discord.TextChannel, area_multiplier: float):
@@ -10680,7 +10824,7 @@ async def gather(interaction: discord.Interaction):
                 "JackPot", False, area_tag))
 
             # Unlock hidden achievement
-            if unlock_hidden_achievement(user_id, "get_lucky"):
+            if await asyncio.to_thread(unlock_hidden_achievement, user_id, "get_lucky"):
                 await send_hidden_achievement_notification(interaction, "get_lucky")
 
             # Background: role assignment + achievements
@@ -10714,7 +10858,6 @@ async def gather(interaction: discord.Interaction):
         hoe_rarity_display = RARITY_EMOJI.get(hoe_rarity, f"[{hoe_rarity}]") if hoe_rarity else None
 
         if is_crit:
-            pre_crit_value = gather_result['value'] / 2
             desc_prefix = f"{rip_emoji} " if rip_emoji else ""
             embed = discord.Embed(
                 title="\U0001f4a5 CRITICAL HIT! \U0001f4a5",
@@ -10758,7 +10901,7 @@ async def gather(interaction: discord.Interaction):
                 embed.add_field(name=f"{SERVER_TAG_EMOJI} **GTHR TAG**",
                     value=f"+{tag_percent:.2f}% - **+${gather_result['extra_money_from_server_tag']:,.2f}**", inline=False)
             if gather_result.get('extra_money_from_premium', 0) > 0:
-                tier = get_user_premium_tier(user_id)
+                tier = gather_result.get("premium_tier", 0)
                 premium_percent = (gather_result['premium_tier_multiplier'] - 1.0) * 100
                 embed.add_field(name=f"**{(PREMIUM_DISPLAY.get(tier, 'Premium')).upper()}**",
                     value=f"+{premium_percent:.2f}% - **+${gather_result['extra_money_from_premium']:,.2f}**", inline=False)
@@ -10808,7 +10951,7 @@ async def gather(interaction: discord.Interaction):
                 embed.add_field(name=f"{SERVER_TAG_EMOJI} **GTHR TAG**",
                     value=f"+{tag_percent:.2f}% - **+${gather_result['extra_money_from_server_tag']:,.2f}**", inline=False)
             if gather_result.get('extra_money_from_premium', 0) > 0:
-                tier = get_user_premium_tier(user_id)
+                tier = gather_result.get("premium_tier", 0)
                 premium_percent = (gather_result['premium_tier_multiplier'] - 1.0) * 100
                 embed.add_field(name=f"**{(PREMIUM_DISPLAY.get(tier, 'Premium')).upper()}**",
                     value=f"+{premium_percent:.2f}% - **+${gather_result['extra_money_from_premium']:,.2f}**", inline=False)
@@ -10950,9 +11093,8 @@ async def gather(interaction: discord.Interaction):
                 effective_chance = min(1.0, effective_chance * UNDERGROUND_JUNGLE_ANIMAL_SPAWN_MULT)
             if random.random() < effective_chance:
                 asyncio.create_task(trigger_pve_event(interaction.channel, area_mult))
-    except Exception as e:
-        traceback.print_exc()
-        print(f"Error in gather command: {e}")
+    except Exception:
+        logger.exception("Error in gather command")
         await safe_interaction_response(interaction, interaction.followup.send, "❌ An error occurred. Please try again.", ephemeral=True)
 
 
@@ -11029,9 +11171,7 @@ def _water_critical_path(user_id: int) -> dict:
     tier = get_user_premium_tier(user_id)
     base_per_day = PREMIUM_WATER_BASE_AMOUNTS.get(tier, PREMIUM_WATER_BASE_AMOUNTS[0])
     money_reward = normalize_money(consecutive_days * base_per_day)
-    current_balance = get_user_balance(user_id)
-    new_balance = normalize_money(current_balance + money_reward)
-    update_user_balance(user_id, new_balance)
+    increment_user_balance(user_id, money_reward)
     daily_bonus_multiplier = get_daily_bonus_multiplier(user_id)
 
     tree_rings_awarded = 0
@@ -11090,8 +11230,8 @@ async def water(interaction: discord.Interaction):
             await send_achievement_notification(interaction, "water_streak", result["water_streak_level_up"])
         if result.get("leap_year_unlocked"):
             await send_hidden_achievement_notification(interaction, "leap_year")
-    except Exception as e:
-        print(f"Error in water command: {e}")
+    except Exception:
+        logger.exception("Error in water command")
         await safe_interaction_response(interaction, interaction.followup.send, "❌ An error occurred. Please try again.", ephemeral=True)
 
 
@@ -11246,14 +11386,14 @@ async def stats(interaction: discord.Interaction):
     try:
         if not await safe_defer(interaction, ephemeral=True):
             return
+        user_id = interaction.user.id
         # Fetch member so primary_guild (GTHR tag) is populated from API if not in cache
         member_for_sync = interaction.user
         try:
             if interaction.guild:
-                member_for_sync = await interaction.guild.fetch_member(interaction.user.id)
+                member_for_sync = await interaction.guild.fetch_member(user_id)
         except Exception:
             pass
-        user_id = interaction.user.id
         # Run all sync + data fetches in parallel for speed
         sync_tasks = [
             asyncio.to_thread(sync_premium_tier_from_member, member_for_sync),
@@ -11287,35 +11427,10 @@ async def stats(interaction: discord.Interaction):
         tractor_attunement = doc["tractor_enchantment"]
         bloom_rank = _bloom_count_to_rank(bloom_count)
 
-        items_needed = None
-        next_rank = None
-        if cycle_plants < 50:
-            items_needed = 50 - cycle_plants
-            next_rank = "PLANTER II"
-        elif cycle_plants < 150:
-            items_needed = 150 - cycle_plants
-            next_rank = "PLANTER III"
-        elif cycle_plants < 300:
-            items_needed = 300 - cycle_plants
-            next_rank = "PLANTER IV"
-        elif cycle_plants < 500:
-            items_needed = 500 - cycle_plants
-            next_rank = "PLANTER V"
-        elif cycle_plants < 1000:
-            items_needed = 1000 - cycle_plants
-            next_rank = "PLANTER VI"
-        elif cycle_plants < 2000:
-            items_needed = 2000 - cycle_plants
-            next_rank = "PLANTER VII"
-        elif cycle_plants < 4000:
-            items_needed = 4000 - cycle_plants
-            next_rank = "PLANTER VIII"
-        elif cycle_plants < 10000:
-            items_needed = 10000 - cycle_plants
-            next_rank = "PLANTER IX"
-        elif cycle_plants < 15000:
-            items_needed = 15000 - cycle_plants
-            next_rank = "PLANTER X"
+        tier_index = bisect.bisect_right(PLANTER_THRESHOLDS, cycle_plants)
+        if tier_index < len(PLANTER_THRESHOLDS):
+            items_needed = PLANTER_THRESHOLDS[tier_index] - cycle_plants
+            next_rank = PLANTER_TIERS[tier_index + 1]
         else:
             items_needed = 0
             next_rank = "MAX RANK"
@@ -11635,10 +11750,8 @@ async def stats(interaction: discord.Interaction):
         await safe_interaction_response(
             interaction, interaction.followup.send, embeds=embeds, ephemeral=True
         )
-    except Exception as e:
-        print(f"Error in stats command: {e}")
-        import traceback
-        traceback.print_exc()
+    except Exception:
+        logger.exception("Error in stats command")
         await safe_interaction_response(interaction, interaction.followup.send, "❌ An error occurred. Please try again.", ephemeral=True)
 
 
@@ -11764,9 +11877,8 @@ async def syncpremium(interaction: discord.Interaction, user: discord.Member | N
                 f"{who} have any active premium purchases for this server, or already have the role. If they just bought, wait a moment and try again.",
                 ephemeral=True,
             )
-    except Exception as e:
-        print(f"Error in syncpremium command: {e}")
-        traceback.print_exc()
+    except Exception:
+        logger.exception("Error in syncpremium command")
         await safe_interaction_response(
             interaction, interaction.followup.send,
             "❌ An error occurred. Please try again.",
@@ -11824,9 +11936,8 @@ async def log_cmd(interaction: discord.Interaction, password: str, amount: int =
             f"```\n{content}\n```",
             ephemeral=True,
         )
-    except Exception as e:
-        print(f"Error in /log command: {e}")
-        traceback.print_exc()
+    except Exception:
+        logger.exception("Error in /log command")
         await safe_interaction_response(
             interaction, interaction.followup.send,
             "❌ An error occurred while reading the log.",
@@ -11862,25 +11973,21 @@ def _perform_harvest_for_user_sync(user_id: int, allow_chain: bool = True,
             water_multiplier = 1.0 + (water_base - 1.0) * 2
         else:
             water_multiplier = water_base
-        plants_before_harvest = full_data.get("gather_stats_total_items", 0)
         current_balance = full_data.get("balance", 0)
         achievement_multiplier = get_achievement_multiplier(user_id, full_data=full_data)
         daily_rate = 0.04 if full_data.get("shop_inventory", {}).get("golden_watering_can", 0) >= 1 else 0.02
         daily_bonus_multiplier = 1.0 + (full_data.get("consecutive_water_days", 0) * daily_rate)
         rank_perma_buff_mult = get_rank_perma_buff_multiplier(user_id, full_data=full_data)
-        pre_bloom_cycle = full_data.get("bloom_cycle_plants", 0)
     else:
         user_upgrades = get_user_basket_upgrades(user_id)
         harvest_upgrades = get_user_harvest_upgrades(user_id)
         tractor_enchant = get_user_tractor_attunement(user_id)
         bloom_multiplier = get_bloom_multiplier(user_id)
         water_multiplier = get_water_multiplier(user_id)
-        plants_before_harvest = get_user_total_items(user_id)
         current_balance = get_user_balance(user_id)
         achievement_multiplier = get_achievement_multiplier(user_id)
         daily_bonus_multiplier = get_daily_bonus_multiplier(user_id)
         rank_perma_buff_mult = get_rank_perma_buff_multiplier(user_id)
-        pre_bloom_cycle = get_user_bloom_cycle_plants(user_id)
 
     basket_tier = user_upgrades.get("basket", 0)
     soil_tier = user_upgrades.get("soil", 0)
@@ -11945,7 +12052,7 @@ def _perform_harvest_for_user_sync(user_id: int, allow_chain: bool = True,
     total_value_before_daily = 0.0
     items_inc: dict[str, int] = {}
     ripeness_inc: dict[str, int] = {}
-    month_index = random.randint(0, 11)
+    month_index = random.randrange(len(MONTHS))
     month_name = MONTHS[month_index]
     total_seasonal_bonus = 0.0
     seasonal_label = None
@@ -11963,25 +12070,23 @@ def _perform_harvest_for_user_sync(user_id: int, allow_chain: bool = True,
         else:
             increment_jackpot_dodge()
 
-    for _item_idx in range(total_items_to_harvest):
+    # Draw every harvested item up front (one random.choices call) and resolve the event ids once
+    harvest_items = random.choices(GATHERABLE_ITEMS, k=total_items_to_harvest)
+    h_eid = hourly_event.get("effects", {}).get("event_id", "") if hourly_event else ""
+    d_eid = daily_event.get("effects", {}).get("event_id", "") if daily_event else ""
+    jackpot_pool_add = 0.0
+
+    for _item_idx, item in enumerate(harvest_items):
         # === JACKPOT: first item in harvest becomes The JackPot ===
         _this_item_is_jackpot = (harvest_is_jackpot and _item_idx == 0)
 
-        item = random.choice(GATHERABLE_ITEMS)
         name = item["name"]
 
-        # Add raw base_value to jackpot pool (manual harvests, non-jackpot items)
+        # Add raw base_value to jackpot pool (manual harvests, non-jackpot items); written once after the loop
         if set_cooldown and not _this_item_is_jackpot:
-            add_to_jackpot_pool(item["base_value"])
-
-        if item["category"] == "Fruit":
-            ripeness_list = LEVEL_OF_RIPENESS_FRUITS
-        elif item["category"] == "Vegetable":
-            ripeness_list = LEVEL_OF_RIPENESS_VEGETABLES
-        elif item["category"] == "Flower":
-            ripeness_list = LEVEL_OF_RIPENESS_FLOWERS
-        else:
-            ripeness_list = []
+            jackpot_pool_add += item["base_value"]
+
+        ripeness_list = RIPENESS_BY_CATEGORY.get(item["category"])
         base_value = item["base_value"] * area_multiplier
         if hourly_event:
             eid = hourly_event.get("effects", {}).get("event_id", "")
@@ -11992,25 +12097,22 @@ def _perform_harvest_for_user_sync(user_id: int, allow_chain: bool = True,
             elif eid == "vegetable_boom" and item["category"] == "Vegetable":
                 base_value *= 2
         if ripeness_list:
-            weights = [r["chance"] for r in ripeness_list]
-            h_eid = hourly_event.get("effects", {}).get("event_id", "") if hourly_event else ""
-            d_eid = daily_event.get("effects", {}).get("event_id", "") if daily_event else ""
+            cum_weights = RIPENESS_CUM_WEIGHTS[item["category"]]
             if h_eid == "perfect_ripeness":
-                ripeness = random.choices(ripeness_list, weights=weights, k=1)[0]
+                ripeness = random.choices(ripeness_list, cum_weights=cum_weights, k=1)[0]
                 ripeness_multiplier = ripeness["multiplier"] * 1.5
             elif d_eid == "ripeness_rush":
-                rw = [r["chance"] * 2 if "Perfect" in r["name"] else r["chance"] for r in ripeness_list]
-                ripeness = random.choices(ripeness_list, weights=rw, k=1)[0]
+                ripeness = random.choices(ripeness_list, cum_weights=RIPENESS_RUSH_CUM_WEIGHTS[item["category"]], k=1)[0]
                 ripeness_multiplier = ripeness["multiplier"]
             else:
-                ripeness = random.choices(ripeness_list, weights=weights, k=1)[0]
+                ripeness = random.choices(ripeness_list, cum_weights=cum_weights, k=1)[0]
                 ripeness_multiplier = ripeness["multiplier"]
             final_value = base_value * ripeness_multiplier
         else:
             final_value = base_value
             ripeness = {"name": "Normal"}
 
-        is_gmo = random.choices([True, False], weights=[gmo_chance, 1 - gmo_chance], k=1)[0]
+        is_gmo = random.random() < gmo_chance
         if is_gmo:
             final_value *= 2
         final_value *= basket_multiplier * fertilizer_multiplier
@@ -12065,6 +12167,9 @@ def _perform_harvest_for_user_sync(user_id: int, allow_chain: bool = True,
             "is_jackpot": _this_item_is_jackpot,
         })
 
+    if jackpot_pool_add:
+        add_to_jackpot_pool(jackpot_pool_add)
+
     # All money buffs apply to the SAME base (additive stacking). Base = sum of (raw item * rank * bloomstone).
     base_for_buffs = float(total_value)
     has_fuzzy_dice = (full_data.get("shop_inventory", {}).get("fuzzy_dice", 0) >= 1) if (full_data is not None) else has_shop_item(user_id, "fuzzy_dice")
@@ -12078,7 +12183,9 @@ def _perform_harvest_for_user_sync(user_id: int, allow_chain: bool = True,
     beta_tester_mult = get_beta_tester_money_multiplier(user_id)
     server_booster_mult = get_server_booster_money_multiplier(user_id)
     server_tag_mult = get_server_tag_money_multiplier(user_id)
-    premium_mult = get_premium_tier_money_multiplier(user_id)
+    # Tier itself is returned too, so the embed can label the premium line without another read on the event loop
+    premium_tier = get_user_premium_tier(user_id)
+    premium_mult = PREMIUM_MONEY_MULTIPLIERS.get(premium_tier, 1.0)
     nether_star_mult = get_nether_star_money_multiplier(user_id)
     black_shard_mult = get_black_shard_money_multiplier(user_id)
     shadow_crystal_mult = get_shadow_crystal_money_multiplier(user_id)
@@ -12115,8 +12222,6 @@ def _perform_harvest_for_user_sync(user_id: int, allow_chain: bool = True,
         ripeness_inc=ripeness_inc,
         balance_increment=total_value,
         num_items=num_items,
-        pre_total_items=plants_before_harvest,
-        pre_bloom_cycle=pre_bloom_cycle,
         set_cooldown=set_cooldown,
         increment_command_count=increment_command_count,
         almanac_pairs=almanac_pairs,
@@ -12158,6 +12263,7 @@ def _perform_harvest_for_user_sync(user_id: int, allow_chain: bool = True,
         "extra_money_from_server_booster": extra_money_from_server_booster,
         "server_tag_multiplier": server_tag_mult,
         "extra_money_from_server_tag": extra_money_from_server_tag,
+        "premium_tier": premium_tier,
         "premium_tier_multiplier": premium_mult,
         "extra_money_from_premium": extra_money_from_premium,
         "nether_star_multiplier": nether_star_mult,
@@ -12233,6 +12339,9 @@ def _harvest_critical_path(member, user_id: int, channel_name: str, area: dict)
         if time_left == 0 and not is_roulette:
             almost_unlocked_too = unlock_hidden_achievement(user_id, "almost_got_it_too")
         return {"on_cooldown": True, "time_left": time_left, "is_roulette": is_roulette, "almost_unlocked_too": almost_unlocked_too}
+    # Claim the cooldown atomically so a concurrent /harvest that read the same timestamp loses
+    if not claim_cooldown(user_id, "last_harvest_time", full_data.get("last_harvest_time", 0)):
+        return {"on_cooldown": True, "time_left": HARVEST_COOLDOWN, "is_roulette": False, "almost_unlocked_too": False}
 
     # --- perform harvest + cooldown + command-count in ONE batch write ---
     result = _perform_harvest_for_user_sync(
@@ -12288,7 +12397,10 @@ async def _harvest_post_response(interaction: discord.Interaction, user_id: int,
             _planter_role_locks[user_id] = asyncio.Lock()
         async with _planter_role_locks[user_id]:
             try:
-                old_role, new_role = await assign_gatherer_role(interaction.user, interaction.guild)
+                # Ranks only move at PLANTER_THRESHOLDS; skip the member fetch + role edit when the cached role already matches
+                harvested = len(result.get("gathered_items", ()))
+                if not planter_role_is_current(interaction.user, full_data.get("bloom_cycle_plants", 0) + harvested):
+                    old_role, new_role = await assign_gatherer_role(interaction.user, interaction.guild)
             except Exception as e:
                 print(f"Error assigning gatherer role to user {user_id}: {e}")
 
@@ -12350,8 +12462,8 @@ async def _harvest_post_response(interaction: discord.Interaction, user_id: int,
 
         # Almanac achievements (level + section hidden)
         await check_almanac_achievements_async(user_id, interaction, interaction.user.mention)
-    except Exception as e:
-        print(f"Error in harvest post-response: {e}")
+    except Exception:
+        logger.exception("Error in harvest post-response")
 
 
 @bot.tree.command(name="harvest", description="Harvest a bunch of plants at once!")
@@ -12467,13 +12579,7 @@ async def harvest(interaction: discord.Interaction):
 
         # (obsolete) (~35–50 chars per line; 20–30 items stay under Discord’s 1024 limit)
         # One line per item: emoji (ripeness) GMO? — no plant name text to stay under 1024
-        lines = []
-        for item in gathered_items:
-            rip_em = get_ripeness_imbue_emoji(item.get("ripeness", ""))
-            emoji = get_item_display_emoji(item["name"])
-            gmo = " GMO! ✨" if item["is_gmo"] else ""
-            prefix = f"{rip_em} " if rip_em else ""
-            lines.append(f"{prefix}{emoji} (**{item['ripeness'].upper()}**){gmo}")
+        lines = _harvest_item_lines(gathered_items)
         items_display = "\n".join(lines)
         if len(items_display) > 1024:
             max_content = 1024 - 20  # reserve space for " … and 99999 more"
@@ -12522,7 +12628,7 @@ async def harvest(interaction: discord.Interaction):
             embed.add_field(name=f"{SERVER_TAG_EMOJI} **GTHR TAG**",
                 value=f"+{tag_percent:.2f}% - **+${result['extra_money_from_server_tag']:,.2f}**", inline=False)
         if result.get("extra_money_from_premium", 0) > 0:
-            tier = get_user_premium_tier(user_id)
+            tier = result.get("premium_tier", 0)
             premium_percent = (result['premium_tier_multiplier'] - 1.0) * 100
             embed.add_field(name=f"**{(PREMIUM_DISPLAY.get(tier, 'Premium')).upper()}**",
                 value=f"+{premium_percent:.2f}% - **+${result['extra_money_from_premium']:,.2f}**", inline=False)
@@ -12620,7 +12726,7 @@ async def harvest(interaction: discord.Interaction):
         for item in gathered_items:
             rare_label, _ = _plant_rare_label(item.get("ripeness", ""), item.get("is_gmo", False))
             if rare_label:
-                cat = next((i["category"] for i in GATHERABLE_ITEMS if i["name"] == item["name"]), "Item")
+                cat = GATHERABLE_CATEGORY_BY_NAME.get(item["name"], "Item")
                 asyncio.create_task(_post_rares_plant(
                     interaction.guild, interaction.user, "HARVEST",
                     item["name"], cat, item["value"], item["ripeness"], item.get("is_gmo", False),
@@ -12628,7 +12734,7 @@ async def harvest(interaction: discord.Interaction):
 
         # Unlock jackpot achievement if harvest hit jackpot
         if harvest_is_jackpot:
-            if unlock_hidden_achievement(user_id, "get_lucky"):
+            if await asyncio.to_thread(unlock_hidden_achievement, user_id, "get_lucky"):
                 await send_hidden_achievement_notification(interaction, "get_lucky")
 
         # === Background: role assignment + achievements (user already has the response) ===
@@ -12678,8 +12784,8 @@ async def harvest(interaction: discord.Interaction):
                 effective_chance = min(1.0, effective_chance * UNDERGROUND_JUNGLE_ANIMAL_SPAWN_MULT)
             if random.random() < effective_chance:
                 asyncio.create_task(trigger_pve_event(interaction.channel, area_mult))
-    except Exception as e:
-        print(f"Error in harvest command: {e}")
+    except Exception:
+        logger.exception("Error in harvest command")
         await safe_interaction_response(interaction, interaction.followup.send, "❌ An error occurred. Please try again.", ephemeral=True)
 
 
@@ -12758,8 +12864,8 @@ async def achievements(interaction: discord.Interaction, hidden: bool = False):
         embed.add_field(name="━━━━━━━━━━━━━━━━━━━━", value=f"**Hidden Achievements:** {hidden_achievements_count}/{TOTAL_HIDDEN_ACHIEVEMENTS}", inline=False)
         
         await safe_interaction_response(interaction, interaction.followup.send, embed=embed)
-    except Exception as e:
-        print(f"Error in achievements command: {e}")
+    except Exception:
+        logger.exception("Error in achievements command")
         await safe_interaction_response(interaction, interaction.followup.send, "❌ An error occurred. Please try again.", ephemeral=True)
 
 
@@ -12904,7 +13010,7 @@ async def bloom(interaction: discord.Interaction):
         has_planter_x = "PLANTER X" in user_roles
         cycle_plants = get_user_bloom_cycle_plants(user_id)
         bloom_cost = bloom_prestige_cost(user_id)
-        user_balance = get_user_balance(user_id)
+        user_balance = await asyncio.to_thread(get_user_balance, user_id)
         plants_needed = max(0, BLOOM_PLANTS_REQUIRED - cycle_plants)
         money_needed = max(0.0, bloom_cost - user_balance)
 
@@ -12938,8 +13044,8 @@ async def bloom(interaction: discord.Interaction):
             await safe_interaction_response(interaction, interaction.followup.send, embed=embed, view=view)
         else:
             await safe_interaction_response(interaction, interaction.followup.send, embed=embed)
-    except Exception as e:
-        print(f"Error in bloom command: {e}")
+    except Exception:
+        logger.exception("Error in bloom command")
         await safe_interaction_response(interaction, interaction.followup.send, "❌ An error occurred. Please try again.", ephemeral=True)
 
 
@@ -12961,9 +13067,9 @@ def _unlock_critical_path(member, user_id: int, area_key: str) -> dict:
     if effective_planter_level < area_data["required_planter_level"]:
         return {"success": False, "error": f"❌ You must be **{area_data['required_planter_rank']}** or above to unlock **{area_data['display_name']}**, {name}! Keep gathering to rank up!"}
     unlock_cost = bloom_scaled_price(user_id, area_data["unlock_cost"])
-    user_balance = get_user_balance(user_id)
-    if user_balance < unlock_cost:
-        money_needed = unlock_cost - user_balance
+    success, new_balance = atomic_deduct_balance(user_id, unlock_cost)
+    if not success:
+        money_needed = unlock_cost - new_balance
         return {
             "success": False,
             "error": (
@@ -12971,8 +13077,6 @@ def _unlock_critical_path(member, user_id: int, area_key: str) -> dict:
                 f"(Cost: **{format_money(unlock_cost)}**)"
             ),
         }
-    new_balance = normalize_money(user_balance - unlock_cost)
-    update_user_balance(user_id, new_balance)
     unlock_user_area(user_id, area_key)
     updated_unlocked = get_user_unlocked_areas(user_id)
     unlocked_levels = [i + 1 for i, key in enumerate(AREA_ORDER_FOR_ACHIEVEMENT) if updated_unlocked.get(key)]
@@ -13026,8 +13130,8 @@ async def unlock(interaction: discord.Interaction, area: app_commands.Choice[str
         await safe_interaction_response(interaction, interaction.followup.send, embed=embed)
         if result.get("should_notify_areas"):
             await send_achievement_notification(interaction, "areas_unlocked", result["areas_achievement_level"])
-    except Exception as e:
-        print(f"Error in unlock command: {e}")
+    except Exception:
+        logger.exception("Error in unlock command")
         await safe_interaction_response(interaction, interaction.followup.send, "❌ An error occurred. Please try again.", ephemeral=True)
 
 
@@ -13513,9 +13617,7 @@ async def inviteawards(interaction: discord.Interaction, action: app_commands.Ch
             # Apply the reward
             reward_msg = ""
             if reward["type"] == "money":
-                current_balance = get_user_balance(user_id)
-                new_balance = normalize_money(current_balance + reward["amount"])
-                update_user_balance(user_id, new_balance)
+                new_balance = await asyncio.to_thread(increment_user_balance, user_id, reward["amount"])
                 reward_msg = f"You received {reward['description']}!"
             elif reward["type"] == "tree_rings":
                 increment_tree_rings(user_id, reward["amount"])
@@ -13547,8 +13649,8 @@ async def inviteawards(interaction: discord.Interaction, action: app_commands.Ch
             embed.set_footer(text=f"Invites: {total_invites} | Use /inviteawards check to see all rewards")
             
             await safe_interaction_response(interaction, interaction.followup.send, embed=embed, ephemeral=True)
-    except Exception as e:
-        print(f"Error in inviteawards command: {e}")
+    except Exception:
+        logger.exception("Error in inviteawards command")
         await safe_interaction_response(interaction, interaction.followup.send, "❌ An error occurred. Please try again.", ephemeral=True)
 
 
@@ -13723,9 +13825,8 @@ class DailyShopInventoryButton(discord.ui.Button):
             else:
                 await safe_interaction_response(
                     interaction, interaction.followup.send, embeds=embeds, ephemeral=True)
-        except Exception as e:
-            traceback.print_exc()
-            print(f"Error in dailyshop Inventory button: {e}")
+        except Exception:
+            logger.exception("Error in dailyshop Inventory button")
             await safe_interaction_response(interaction, interaction.followup.send, "❌ An error occurred. Please try again.", ephemeral=True)
 
 
@@ -13795,9 +13896,8 @@ async def dailyshop(interaction: discord.Interaction, action: app_commands.Choic
             return
         embed, view = _build_daily_shop_embed_and_view(offerings, date_est, user_id, tree_rings=data["tree_rings"])
         await safe_interaction_response(interaction, interaction.followup.send, embed=embed, view=view, ephemeral=True)
-    except Exception as e:
-        traceback.print_exc()
-        print(f"Error in dailyshop command: {e}")
+    except Exception:
+        logger.exception("Error in dailyshop command")
         await safe_interaction_response(interaction, interaction.followup.send, "❌ An error occurred. Please try again.", ephemeral=True)
 
 
@@ -13845,8 +13945,8 @@ async def treering(interaction: discord.Interaction, password: str):
             ephemeral=True,
         )
         print(f"Admin {interaction.user.name} used /treering — recalculated for {updated_count} users")
-    except Exception as e:
-        print(f"Error in treering command: {e}")
+    except Exception:
+        logger.exception("Error in treering command")
         await safe_interaction_response(interaction, interaction.followup.send, "❌ An error occurred. Please try again.", ephemeral=True)
 
 
@@ -13864,8 +13964,8 @@ async def jackpot_cmd(interaction: discord.Interaction):
             f"and it has dodged **{dodge_count:,}** planters so far."
         )
         await safe_interaction_response(interaction, interaction.followup.send, content=message)
-    except Exception as e:
-        print(f"Error in jackpot command: {e}")
+    except Exception:
+        logger.exception("Error in jackpot command")
         await safe_interaction_response(interaction, interaction.followup.send, "❌ An error occurred. Please try again.", ephemeral=True)
 
 
@@ -13933,8 +14033,8 @@ class AlmanacView(discord.ui.View):
                 return
             self.page = max(0, self.page - 1)
             await interaction.response.edit_message(embed=self._build_embed(), view=self)
-        except Exception as e:
-            print(f"Error in almanac prev_page: {e}")
+        except Exception:
+            logger.exception("Error in almanac prev_page")
             await safe_defer(interaction)
 
     @discord.ui.button(label="Next ▶", style=discord.ButtonStyle.secondary, custom_id="almanac_next")
@@ -13945,8 +14045,8 @@ class AlmanacView(discord.ui.View):
                 return
             self.page = min(self._max_page, self.page + 1)
             await interaction.response.edit_message(embed=self._build_embed(), view=self)
-        except Exception as e:
-            print(f"Error in almanac next_page: {e}")
+        except Exception:
+            logger.exception("Error in almanac next_page")
             await safe_defer(interaction)
 
 
@@ -13970,8 +14070,8 @@ async def almanac(interaction: discord.Interaction, section: app_commands.Choice
         view = AlmanacView(user_id, section_cat, almanac_entries=almanac_entries)
         embed = view._build_embed()
         await safe_interaction_response(interaction, interaction.followup.send, embed=embed, view=view, ephemeral=True)
-    except Exception as e:
-        print(f"Error in almanac command: {e}")
+    except Exception:
+        logger.exception("Error in almanac command")
         await safe_interaction_response(interaction, interaction.followup.send, "❌ An error occurred. Please try again.", ephemeral=True)
 
 
@@ -14084,32 +14184,32 @@ class BasketUpgradeView(discord.ui.View):
     async def buy_basket(self, interaction: discord.Interaction, button: discord.ui.Button):
         try:
             await self.handle_purchase(interaction, "basket", BASKET_UPGRADES, "Basket")
-        except Exception as e:
-            print(f"Error in buy_basket: {e}")
+        except Exception:
+            logger.exception("Error in buy_basket")
             await safe_interaction_response(interaction, interaction.response.send_message, "❌ An error occurred. Please try again.", ephemeral=True)
     
     @discord.ui.button(label="", style=discord.ButtonStyle.primary, emoji="👟", row=0)
     async def buy_shoes(self, interaction: discord.Interaction, button: discord.ui.Button):
         try:
             await self.handle_purchase(interaction, "shoes", SHOES_UPGRADES, "Shoes")
-        except Exception as e:
-            print(f"Error in buy_shoes: {e}")
+        except Exception:
+            logger.exception("Error in buy_shoes")
             await safe_interaction_response(interaction, interaction.response.send_message, "❌ An error occurred. Please try again.", ephemeral=True)
     
     @discord.ui.button(label="", style=discord.ButtonStyle.primary, emoji="🧤", row=1)
     async def buy_gloves(self, interaction: discord.Interaction, button: discord.ui.Button):
         try:
             await self.handle_purchase(interaction, "gloves", GLOVES_UPGRADES, "Gloves")
-        except Exception as e:
-            print(f"Error in buy_gloves: {e}")
+        except Exception:
+            logger.exception("Error in buy_gloves")
             await safe_interaction_response(interaction, interaction.response.send_message, "❌ An error occurred. Please try again.", ephemeral=True)
     
     @discord.ui.button(label="", style=discord.ButtonStyle.primary, emoji="🌱", row=1)
     async def buy_soil(self, interaction: discord.Interaction, button: discord.ui.Button):
         try:
             await self.handle_purchase(interaction, "soil", SOIL_UPGRADES, "Soil")
-        except Exception as e:
-            print(f"Error in buy_soil: {e}")
+        except Exception:
+            logger.exception("Error in buy_soil")
             await safe_interaction_response(interaction, interaction.response.send_message, "❌ An error occurred. Please try again.", ephemeral=True)
     
     async def handle_purchase(self, interaction: discord.Interaction, upgrade_type: str, upgrade_list: list, upgrade_name: str):
@@ -14130,17 +14230,13 @@ class BasketUpgradeView(discord.ui.View):
                 return
 
             cost = bloom_scaled_price(self.user_id, UPGRADE_PRICES[current_tier])
-            balance = await asyncio.to_thread(get_user_balance, self.user_id)
-
-            if balance < cost:
+            # Deduct money only if affordable, then upgrade
+            success, new_balance = await asyncio.to_thread(atomic_deduct_balance, self.user_id, cost)
+            if not success:
                 await interaction.followup.send(
-                    f"❌ You don't have enough money! You need **${cost:,.2f}** but only have **${balance:,.2f}**.",
+                    f"❌ You don't have enough money! You need **${cost:,.2f}** but only have **${new_balance:,.2f}**.",
                     ephemeral=True)
                 return
-
-            # Deduct money and upgrade
-            new_balance = balance - cost
-            await asyncio.to_thread(update_user_balance, self.user_id, new_balance)
             await asyncio.to_thread(set_user_basket_upgrade, self.user_id, upgrade_type, current_tier + 1)
 
             next_upgrade = upgrade_list[current_tier]
@@ -14159,8 +14255,8 @@ class BasketUpgradeView(discord.ui.View):
                 await interaction.message.edit(embed=embed, view=self)
             except:
                 pass  # Message might have been deleted
-        except Exception as e:
-            print(f"Error in handle_purchase (gear): {e}")
+        except Exception:
+            logger.exception("Error in handle_purchase (gear)")
             try:
                 if not interaction.response.is_done():
                     await interaction.response.send_message("❌ An error occurred. Please try again.", ephemeral=True)
@@ -14182,8 +14278,8 @@ async def gear(interaction: discord.Interaction):
         embed = await asyncio.to_thread(view.create_embed)
         
         await safe_interaction_response(interaction, interaction.followup.send, embed=embed, view=view)
-    except Exception as e:
-        print(f"Error in gear command: {e}")
+    except Exception:
+        logger.exception("Error in gear command")
         await safe_interaction_response(interaction, interaction.followup.send, "❌ An error occurred. Please try again.", ephemeral=True)
 
 
@@ -14348,32 +14444,32 @@ class HarvestUpgradeView(discord.ui.View):
     async def buy_car(self, interaction: discord.Interaction, button: discord.ui.Button):
         try:
             await self.handle_purchase(interaction, "car", HARVEST_CAR_UPGRADES, HARVEST_CAR_PRICES, "Vehicle")
-        except Exception as e:
-            print(f"Error in buy_car: {e}")
+        except Exception:
+            logger.exception("Error in buy_car")
             await safe_interaction_response(interaction, interaction.response.send_message, "❌ An error occurred. Please try again.", ephemeral=True)
     
     @discord.ui.button(label="", style=discord.ButtonStyle.primary, emoji="🌾", row=0)
     async def buy_chain(self, interaction: discord.Interaction, button: discord.ui.Button):
         try:
             await self.handle_purchase(interaction, "chain", HARVEST_CHAIN_UPGRADES, HARVEST_CHAIN_PRICES, "Yield")
-        except Exception as e:
-            print(f"Error in buy_chain: {e}")
+        except Exception:
+            logger.exception("Error in buy_chain")
             await safe_interaction_response(interaction, interaction.response.send_message, "❌ An error occurred. Please try again.", ephemeral=True)
     
     @discord.ui.button(label="", style=discord.ButtonStyle.primary, emoji="💩", row=1)
     async def buy_fertilizer(self, interaction: discord.Interaction, button: discord.ui.Button):
         try:
             await self.handle_purchase(interaction, "fertilizer", HARVEST_FERTILIZER_UPGRADES, HARVEST_FERTILIZER_PRICES, "Fertilizer")
-        except Exception as e:
-            print(f"Error in buy_fertilizer: {e}")
+        except Exception:
+            logger.exception("Error in buy_fertilizer")
             await safe_interaction_response(interaction, interaction.response.send_message, "❌ An error occurred. Please try again.", ephemeral=True)
     
     @discord.ui.button(label="", style=discord.ButtonStyle.primary, emoji="⚡", row=1)
     async def buy_cooldown(self, interaction: discord.Interaction, button: discord.ui.Button):
         try:
             await self.handle_purchase(interaction, "cooldown", HARVEST_COOLDOWN_UPGRADES, HARVEST_COOLDOWN_PRICES, "Workers")
-        except Exception as e:
-            print(f"Error in buy_cooldown: {e}")
+        except Exception:
+            logger.exception("Error in buy_cooldown")
             await safe_interaction_response(interaction, interaction.response.send_message, "❌ An error occurred. Please try again.", ephemeral=True)
     
     async def handle_purchase(self, interaction: discord.Interaction, upgrade_type: str, upgrade_list: list, price_list: list, upgrade_name: str):
@@ -14394,17 +14490,13 @@ class HarvestUpgradeView(discord.ui.View):
                 return
 
             cost = bloom_scaled_price(self.user_id, price_list[current_tier])
-            balance = await asyncio.to_thread(get_user_balance, self.user_id)
-
-            if balance < cost:
+            # Deduct money only if affordable, then upgrade
+            success, new_balance = await asyncio.to_thread(atomic_deduct_balance, self.user_id, cost)
+            if not success:
                 await interaction.followup.send(
-                    f"❌ You don't have enough money! You need **${cost:,.2f}** but only have **${balance:,.2f}**.",
+                    f"❌ You don't have enough money! You need **${cost:,.2f}** but only have **${new_balance:,.2f}**.",
                     ephemeral=True)
                 return
-
-            # Deduct money and upgrade
-            new_balance = balance - cost
-            await asyncio.to_thread(update_user_balance, self.user_id, new_balance)
             await asyncio.to_thread(set_user_harvest_upgrade, self.user_id, upgrade_type, current_tier + 1)
 
             next_upgrade = upgrade_list[current_tier]
@@ -14423,8 +14515,8 @@ class HarvestUpgradeView(discord.ui.View):
                 await interaction.message.edit(embed=embed, view=self)
             except:
                 pass  # Message might have been deleted
-        except Exception as e:
-            print(f"Error in handle_purchase (harvest): {e}")
+        except Exception:
+            logger.exception("Error in handle_purchase (harvest)")
             try:
                 if not interaction.response.is_done():
                     await interaction.response.send_message("❌ An error occurred. Please try again.", ephemeral=True)
@@ -14446,8 +14538,8 @@ async def orchard(interaction: discord.Interaction):
         embed = await asyncio.to_thread(view.create_embed)
         
         await safe_interaction_response(interaction, interaction.followup.send, embed=embed, view=view)
-    except Exception as e:
-        print(f"Error in orchard command: {e}")
+    except Exception:
+        logger.exception("Error in orchard command")
         await safe_interaction_response(interaction, interaction.followup.send, "❌ An error occurred. Please try again.", ephemeral=True)
 
 
@@ -14659,10 +14751,10 @@ class ImbueView(discord.ui.View):
                 await interaction.followup.edit_message(interaction.message.id, embed=embed, view=self)
             except Exception as edit_e:
                 print(f"Error editing imbue Recast message: {edit_e}")
-        except Exception as e:
+        except Exception:
             # Refund if we took money but failed to update the message
             await asyncio.to_thread(refund_balance, self.user_id, self.cost)
-            print(f"Error in recast_button (refunded ${self.cost:,.0f} to {self.user_id}): {e}")
+            logger.exception("Error in recast_button (refunded $%s to %s)", f"{self.cost:,.0f}", self.user_id)
             await safe_interaction_response(interaction, interaction.followup.send,
                 "\u274c An error occurred and your money has been refunded. Please try again.", ephemeral=True)
 
@@ -14733,14 +14825,14 @@ async def imbue(interaction: discord.Interaction, tool: app_commands.Choice[str]
                 embed = view._build_embed(balance_override=new_balance)
 
                 await safe_interaction_response(interaction, interaction.followup.send, embed=embed, view=view, ephemeral=True)
-            except Exception as inner_e:
+            except Exception:
                 # Refund if we took money but failed to show the imbue menu (in thread)
                 await asyncio.to_thread(refund_balance, user_id, cost)
-                print(f"Error in imbue command (refunded ${cost:,.0f} to {user_id}): {inner_e}")
+                logger.exception("Error in imbue command (refunded $%s to %s)", f"{cost:,.0f}", user_id)
                 await safe_interaction_response(interaction, interaction.followup.send,
                     "\u274c An error occurred and your money has been refunded. Please try again.", ephemeral=True)
-    except Exception as e:
-        print(f"Error in imbue command: {e}")
+    except Exception:
+        logger.exception("Error in imbue command")
         await safe_interaction_response(interaction, interaction.followup.send,
             "\u274c An error occurred. Please try again.", ephemeral=True)
 
@@ -14945,8 +15037,8 @@ class HireView(discord.ui.View):
                 await interaction.message.edit(embed=embed, view=self)
             else:
                 await safe_defer(interaction)
-        except Exception as e:
-            print(f"Error in previous_button (hire): {e}")
+        except Exception:
+            logger.exception("Error in previous_button (hire)")
             try:
                 if not interaction.response.is_done():
                     await interaction.response.send_message("❌ An error occurred. Please try again.", ephemeral=True)
@@ -14972,8 +15064,8 @@ class HireView(discord.ui.View):
                 await interaction.message.edit(embed=embed, view=self)
             else:
                 await safe_defer(interaction)
-        except Exception as e:
-            print(f"Error in next_button (hire): {e}")
+        except Exception:
+            logger.exception("Error in next_button (hire)")
             try:
                 if not interaction.response.is_done():
                     await interaction.response.send_message("❌ An error occurred. Please try again.", ephemeral=True)
@@ -15041,8 +15133,8 @@ class HireView(discord.ui.View):
                 await interaction.message.edit(embed=embed, view=self)
             except:
                 pass  # Message might have been deleted
-        except Exception as e:
-            print(f"Error in hire_button: {e}")
+        except Exception:
+            logger.exception("Error in hire_button")
             try:
                 if not interaction.response.is_done():
                     await interaction.response.send_message("❌ An error occurred. Please try again.", ephemeral=True)
@@ -15108,8 +15200,8 @@ class HireView(discord.ui.View):
                 await interaction.message.edit(embed=embed, view=self)
             except:
                 pass
-        except Exception as e:
-            print(f"Error in buy_tool_button: {e}")
+        except Exception:
+            logger.exception("Error in buy_tool_button")
             try:
                 if not interaction.response.is_done():
                     await interaction.response.send_message("❌ An error occurred. Please try again.", ephemeral=True)
@@ -15133,8 +15225,8 @@ async def hire(interaction: discord.Interaction):
         view.update_buttons()
         
         await safe_interaction_response(interaction, interaction.followup.send, embed=embed, view=view)
-    except Exception as e:
-        print(f"Error in hire command: {e}")
+    except Exception:
+        logger.exception("Error in hire command")
         await safe_interaction_response(interaction, interaction.followup.send, "❌ An error occurred. Please try again.", ephemeral=True)
 
 
@@ -15230,8 +15322,8 @@ class GpuView(discord.ui.View):
                 await interaction.message.edit(embed=embed, view=self)
             else:
                 await safe_defer(interaction)
-        except Exception as e:
-            print(f"Error in previous_button (gpu): {e}")
+        except Exception:
+            logger.exception("Error in previous_button (gpu)")
             try:
                 if not interaction.response.is_done():
                     await interaction.response.send_message("❌ An error occurred. Please try again.", ephemeral=True)
@@ -15257,8 +15349,8 @@ class GpuView(discord.ui.View):
                 await interaction.message.edit(embed=embed, view=self)
             else:
                 await safe_defer(interaction)
-        except Exception as e:
-            print(f"Error in next_button (gpu): {e}")
+        except Exception:
+            logger.exception("Error in next_button (gpu)")
             try:
                 if not interaction.response.is_done():
                     await interaction.response.send_message("❌ An error occurred. Please try again.", ephemeral=True)
@@ -15316,8 +15408,8 @@ class GpuView(discord.ui.View):
                 await interaction.message.edit(embed=embed, view=self)
             except:
                 pass  # Message might have been deleted
-        except Exception as e:
-            print(f"Error in buy_button (gpu): {e}")
+        except Exception:
+            logger.exception("Error in buy_button (gpu)")
             try:
                 if not interaction.response.is_done():
                     await interaction.response.send_message("❌ An error occurred. Please try again.", ephemeral=True)
@@ -15340,8 +15432,8 @@ async def gpu(interaction: discord.Interaction):
         view.update_buttons()
         
         await safe_interaction_response(interaction, interaction.followup.send, embed=embed, view=view)
-    except Exception as e:
-        print(f"Error in gpu command: {e}")
+    except Exception:
+        logger.exception("Error in gpu command")
         await safe_interaction_response(interaction, interaction.followup.send, "❌ An error occurred. Please try again.", ephemeral=True)
 
 
@@ -15430,8 +15522,8 @@ async def starthourlyevent(interaction: discord.Interaction, password: str, even
         )
         await safe_interaction_response(interaction, interaction.followup.send, embed=embed, ephemeral=True)
         print(f"Admin {interaction.user.name} started hourly event: {event_info['name']} for {duration_minutes} minutes")
-    except Exception as e:
-        print(f"Error in starthourlyevent command: {e}")
+    except Exception:
+        logger.exception("Error in starthourlyevent command")
         await safe_interaction_response(interaction, interaction.followup.send, "❌ An error occurred. Please try again.", ephemeral=True)
 
 
@@ -15513,8 +15605,8 @@ async def startdailyevent(interaction: discord.Interaction, password: str, event
         )
         await safe_interaction_response(interaction, interaction.followup.send, embed=embed, ephemeral=True)
         print(f"Admin {interaction.user.name} started daily event: {event_info['name']}")
-    except Exception as e:
-        print(f"Error in startdailyevent command: {e}")
+    except Exception:
+        logger.exception("Error in startdailyevent command")
         await safe_interaction_response(interaction, interaction.followup.send, "❌ An error occurred. Please try again.", ephemeral=True)
 
 
@@ -15594,8 +15686,8 @@ async def startcelestialevent(interaction: discord.Interaction, password: str, e
         )
         await safe_interaction_response(interaction, interaction.followup.send, embed=embed, ephemeral=True)
         print(f"Admin {interaction.user.name} started celestial event: {title} for {duration} minutes")
-    except Exception as e:
-        print(f"Error in startcelestialevent command: {e}")
+    except Exception:
+        logger.exception("Error in startcelestialevent command")
         await safe_interaction_response(interaction, interaction.followup.send, "❌ An error occurred. Please try again.", ephemeral=True)
 
 
@@ -15676,8 +15768,8 @@ async def endevent(interaction: discord.Interaction, password: str, event_type:
         )
         await safe_interaction_response(interaction, interaction.followup.send, embed=embed, ephemeral=True)
         print(f"Admin {interaction.user.name} ended {event_type} event: {event_info['name']}")
-    except Exception as e:
-        print(f"Error in endevent command: {e}")
+    except Exception:
+        logger.exception("Error in endevent command")
         await safe_interaction_response(interaction, interaction.followup.send, "❌ An error occurred. Please try again.", ephemeral=True)
 
 
@@ -15703,7 +15795,7 @@ async def endrussian(interaction: discord.Interaction, password: str):
 
         game = active_roulette_games[game_id]
         player_count = len(game.players)
-        _force_cleanup_roulette_game(game_id, refund=True)
+        await _force_cleanup_roulette_game(game_id, refund=True)
 
         embed = discord.Embed(
             title="🛑 RUSSIAN ROULETTE ENDED BY ADMIN 🛑",
@@ -15715,8 +15807,8 @@ async def endrussian(interaction: discord.Interaction, password: str):
         await interaction.channel.send(embed=embed)
         await safe_interaction_response(interaction, interaction.followup.send, "✅ Game ended and players refunded.", ephemeral=True)
         print(f"Admin {interaction.user.name} force-ended roulette game {game_id} in channel {channel_id}")
-    except Exception as e:
-        print(f"Error in endrussian command: {e}")
+    except Exception:
+        logger.exception("Error in endrussian command")
         await safe_interaction_response(interaction, interaction.followup.send, "❌ An error occurred. Please try again.", ephemeral=True)
 
 
@@ -15745,7 +15837,7 @@ _SPAWN_CHANNEL_CHOICES = [
 
 async def _spawn_resolve_channel(interaction: discord.Interaction, channel: str):
     """Returns (target, area_mult) or (None, None) after sending an error if invalid."""
-    target = discord.utils.get(interaction.guild.text_channels, name=channel)
+    target = _get_text_channel(interaction.guild, channel)
     if not target:
         await safe_interaction_response(interaction, interaction.followup.send,
             f"❌ Channel **#{channel}** not found in this server.", ephemeral=True)
@@ -15843,8 +15935,8 @@ async def spawn_animal(interaction: discord.Interaction, password: str, animal:
         await target.send(embed=embed, view=view)
         await safe_interaction_response(interaction, interaction.followup.send,
             f"✅ Spawned **{chosen['name']}** in {target.mention}!", ephemeral=True)
-    except Exception as e:
-        print(f"Error in spawn_animal command: {e}")
+    except Exception:
+        logger.exception("Error in spawn_animal command")
         await safe_interaction_response(interaction, interaction.followup.send, "❌ An error occurred. Please try again.", ephemeral=True)
 
 
@@ -15892,8 +15984,8 @@ async def spawn_boss(interaction: discord.Interaction, password: str, boss: str,
             return
 
         await safe_interaction_response(interaction, interaction.followup.send, f"❌ Unknown boss **{boss}**.", ephemeral=True)
-    except Exception as e:
-        print(f"Error in spawn_boss command: {e}")
+    except Exception:
+        logger.exception("Error in spawn_boss command")
         await safe_interaction_response(interaction, interaction.followup.send, "❌ An error occurred. Please try again.", ephemeral=True)
 
 
@@ -15932,35 +16024,10 @@ async def user_admin(interaction: discord.Interaction, password: str, member: di
         user_balance = doc["balance"]
         total_items = doc["gather_stats_total_items"]
         cycle_plants = doc["bloom_cycle_plants"]
-        items_needed = None
-        next_rank = None
-        if cycle_plants < 50:
-            items_needed = 50 - cycle_plants
-            next_rank = "PLANTER II"
-        elif cycle_plants < 150:
-            items_needed = 150 - cycle_plants
-            next_rank = "PLANTER III"
-        elif cycle_plants < 300:
-            items_needed = 300 - cycle_plants
-            next_rank = "PLANTER IV"
-        elif cycle_plants < 500:
-            items_needed = 500 - cycle_plants
-            next_rank = "PLANTER V"
-        elif cycle_plants < 1000:
-            items_needed = 1000 - cycle_plants
-            next_rank = "PLANTER VI"
-        elif cycle_plants < 2000:
-            items_needed = 2000 - cycle_plants
-            next_rank = "PLANTER VII"
-        elif cycle_plants < 4000:
-            items_needed = 4000 - cycle_plants
-            next_rank = "PLANTER VIII"
-        elif cycle_plants < 10000:
-            items_needed = 10000 - cycle_plants
-            next_rank = "PLANTER IX"
-        elif cycle_plants < 15000:
-            items_needed = 15000 - cycle_plants
-            next_rank = "PLANTER X"
+        tier_index = bisect.bisect_right(PLANTER_THRESHOLDS, cycle_plants)
+        if tier_index < len(PLANTER_THRESHOLDS):
+            items_needed = PLANTER_THRESHOLDS[tier_index] - cycle_plants
+            next_rank = PLANTER_TIERS[tier_index + 1]
         else:
             items_needed = 0
             next_rank = "MAX RANK"
@@ -16127,10 +16194,8 @@ async def user_admin(interaction: discord.Interaction, password: str, member: di
 
         await safe_interaction_response(interaction, interaction.followup.send,
             embeds=[embed_stats, embed_items, embed_shop, embed_ach, embed_hidden, embed_ref], ephemeral=True)
-    except Exception as e:
-        import traceback
-        print(f"Error in user admin command: {e}")
-        traceback.print_exc()
+    except Exception:
+        logger.exception("Error in user admin command")
         await safe_interaction_response(interaction, interaction.followup.send, "❌ An error occurred. Please try again.", ephemeral=True)
 
 
@@ -16203,8 +16268,8 @@ async def reset(interaction: discord.Interaction, password: str, type: str):
                 )
             await safe_interaction_response(interaction, interaction.followup.send, embed=embed, ephemeral=True)
             print(f"Admin {interaction.user.name} reset crypto prices to base values")
-    except Exception as e:
-        print(f"Error in reset command: {e}")
+    except Exception:
+        logger.exception("Error in reset command")
         await safe_interaction_response(interaction, interaction.followup.send, "❌ An error occurred. Please try again.", ephemeral=True)
 
 
@@ -16244,8 +16309,8 @@ async def rollback(interaction: discord.Interaction, password: str):
             await safe_interaction_response(interaction, interaction.followup.send,
                 f"❌ Rollback script exited immediately. Stderr: {err[:500] or 'none'}", ephemeral=True)
         print(f"Admin {interaction.user.name} ran /rollback")
-    except Exception as e:
-        print(f"Error in rollback command: {e}")
+    except Exception:
+        logger.exception("Error in rollback command")
         await safe_interaction_response(interaction, interaction.followup.send, "❌ An error occurred. Please try again.", ephemeral=True)
 
 
@@ -16385,8 +16450,8 @@ async def cron(interaction: discord.Interaction, password: str, action: app_comm
             "❌ Invalid action. Use one of: Enable, Disable, or Status.",
             ephemeral=True,
         )
-    except Exception as e:
-        print(f"Error in cron command: {e}")
+    except Exception:
+        logger.exception("Error in cron command")
         await safe_interaction_response(interaction, interaction.followup.send, "❌ An error occurred. Please try again.", ephemeral=True)
 
 
@@ -16482,8 +16547,8 @@ async def wipe(interaction: discord.Interaction, password: str, type: str):
 
         await safe_interaction_response(interaction, interaction.followup.send, embed=embed, ephemeral=True)
         print(f"Admin {interaction.user.name} wiped {type} data for {wiped_count} users")
-    except Exception as e:
-        print(f"Error in wipe command: {e}")
+    except Exception:
+        logger.exception("Error in wipe command")
         await safe_interaction_response(interaction, interaction.followup.send, "❌ An error occurred. Please try again.", ephemeral=True)
 
 
@@ -16558,7 +16623,7 @@ async def set_command(
         
         # Handle each type
         if type_lower == "money":
-            update_user_balance(user_id, amount)
+            await asyncio.to_thread(update_user_balance, user_id, amount)
             embed = discord.Embed(
                 title="\u2705 Money Set",
                 description=f"{target_user.mention}'s balance has been set to **${amount:,.2f}**!",
@@ -16637,8 +16702,8 @@ async def set_command(
             print(f"Admin {interaction.user.name} used /set to set {target_user.name}'s {coin_upper} to {amount:,.2f}")
         
         await safe_interaction_response(interaction, interaction.followup.send, embed=embed, ephemeral=True)
-    except Exception as e:
-        print(f"Error in set command: {e}")
+    except Exception:
+        logger.exception("Error in set command")
         await safe_interaction_response(interaction, interaction.followup.send, "\u274c An error occurred. Please try again.", ephemeral=True)
 
 
@@ -16781,8 +16846,8 @@ async def setrank(
         )
         print(f"Admin {interaction.user.name} used /setrank to set {user.name}'s rank to {rank_str}")
         await safe_interaction_response(interaction, interaction.followup.send, embed=embed, ephemeral=True)
-    except Exception as e:
-        print(f"Error in setrank command: {e}")
+    except Exception:
+        logger.exception("Error in setrank command")
         await safe_interaction_response(interaction, interaction.followup.send, "❌ An error occurred. Please try again.", ephemeral=True)
 
 
@@ -16850,8 +16915,8 @@ async def market_admin(interaction: discord.Interaction, password: str, news: ap
         embed.add_field(name="Prices Reset", value=f"**{reset_count}** stock(s) reset to real-life API values", inline=False)
         
         await safe_interaction_response(interaction, interaction.followup.send, embed=embed, ephemeral=True)
-    except Exception as e:
-        print(f"Error in market admin command: {e}")
+    except Exception:
+        logger.exception("Error in market admin command")
         await safe_interaction_response(interaction, interaction.followup.send, "\u274c An error occurred. Please try again.", ephemeral=True)
 
 
@@ -16884,8 +16949,8 @@ async def shutdown(interaction: discord.Interaction, password: str):
             "🛑 Shutting down the bot...", ephemeral=True)
         print(f"Bot shutdown requested by {interaction.user} ({interaction.user.id})")
         await bot.close()
-    except Exception as e:
-        print(f"Error in shutdown command: {e}")
+    except Exception:
+        logger.exception("Error in shutdown command")
         try:
             await safe_interaction_response(interaction, interaction.followup.send, "❌ Shutdown failed.", ephemeral=True)
         except Exception:
@@ -17006,16 +17071,14 @@ async def give(
                     "❌ **Error**: Please provide a positive `amount` for money.", ephemeral=True)
                 return
 
-            current_balance = get_user_balance(user_id)
-            new_balance = normalize_money(current_balance + amount)
-            update_user_balance(user_id, new_balance)
+            new_balance = await asyncio.to_thread(increment_user_balance, user_id, amount)
 
             embed = discord.Embed(
                 title="🎉 Giveaway – Money",
                 description=f"**${amount:,.2f}** has been given to {user.mention}!",
                 color=discord.Color.gold()
             )
-            embed.add_field(name="Previous Balance", value=f"${current_balance:,.2f}", inline=True)
+            embed.add_field(name="Previous Balance", value=f"${normalize_money(new_balance - amount):,.2f}", inline=True)
             embed.add_field(name="New Balance", value=f"${new_balance:,.2f}", inline=True)
             embed.set_footer(text=f"Given by {interaction.user.name}")
             print(f"Admin {interaction.user.name} used /give money to give {user.name} ${amount:,.2f}")
@@ -17149,8 +17212,8 @@ async def give(
             return
 
         await safe_interaction_response(interaction, interaction.followup.send, embed=embed, ephemeral=True)
-    except Exception as e:
-        print(f"Error in give command: {e}")
+    except Exception:
+        logger.exception("Error in give command")
         await safe_interaction_response(interaction, interaction.followup.send, "❌ An error occurred. Please try again.", ephemeral=True)
 
 
@@ -17190,14 +17253,12 @@ async def bot_pay(interaction: discord.Interaction, password: str, user: discord
                 "❌ **Error**: You cannot pay bots.", ephemeral=True)
             return
         user_id = user.id
-        current = get_user_balance(user_id)
-        new_balance = normalize_money(current + amount)
-        update_user_balance(user_id, new_balance)
+        new_balance = await asyncio.to_thread(increment_user_balance, user_id, amount)
         log_msg = f"{PROGRESS_Y} **/GATHER** paid ${amount:,.2f} to {user.mention}!"
         await safe_interaction_response(interaction, interaction.followup.send, log_msg, ephemeral=False)
         print(f"Admin {interaction.user.name} used /bot_pay to give {user.name} ${amount:,.2f}")
-    except Exception as e:
-        print(f"Error in bot_pay command: {e}")
+    except Exception:
+        logger.exception("Error in bot_pay command")
         await safe_interaction_response(interaction, interaction.followup.send, "❌ An error occurred. Please try again.", ephemeral=True)
 
 
@@ -17213,8 +17274,7 @@ def _apply_giveaway_prize(user_id: int, prize_data: dict) -> None:
     ptype = prize_data.get("type")
     if ptype == "money":
         amt = float(prize_data["amount"])
-        cur = get_user_balance(user_id)
-        update_user_balance(user_id, normalize_money(cur + amt))
+        increment_user_balance(user_id, amt)
     elif ptype == "shop_item":
         add_shop_item_to_user(user_id, prize_data["item_id"], 1)
     elif ptype == "imbue":
@@ -17377,7 +17437,7 @@ async def giveaway(
                 "❌ This command can only be used in the **#giveaways** channel.", ephemeral=True)
             return
         guild = interaction.guild
-        giveaways_ch = discord.utils.get(guild.text_channels, name="giveaways")
+        giveaways_ch = _get_text_channel(guild, "giveaways")
         if not giveaways_ch:
             await safe_interaction_response(interaction, interaction.followup.send,
                 "❌ **#giveaways** channel not found.", ephemeral=True)
@@ -17478,31 +17538,18 @@ async def giveaway(
         await safe_interaction_response(interaction, interaction.followup.send,
             f"✅ Giveaway started in #giveaways! Ends in **{int(duration_minutes)}** minutes. React with {PROGRESS_Y} to enter.", ephemeral=True)
         print(f"Admin {interaction.user.name} started /giveaway in #giveaways: {prize_display}, {num_winners} winner(s)")
-    except Exception as e:
-        print(f"Error in giveaway command: {e}")
-        import traceback
-        traceback.print_exc()
+    except Exception:
+        logger.exception("Error in giveaway command")
         await safe_interaction_response(interaction, interaction.followup.send, "❌ An error occurred. Please try again.", ephemeral=True)
 
 
 def _pay_critical_path(sender_id: int, recipient_id: int, amount: float) -> dict:
     """All DB work for /pay in ONE sync call (runs via to_thread)."""
-    # Check sender balance
-    sender_balance = get_user_balance(sender_id)
-    sender_balance = normalize_money(sender_balance)
-
-    if not can_afford_rounded(sender_balance, amount):
+    # Transfer money: debit the sender only if affordable, then credit the recipient ($inc on both)
+    success, _ = atomic_deduct_balance(sender_id, amount)
+    if not success:
         return {"cant_afford": True}
-
-    # Get recipient balance
-    recipient_balance = get_user_balance(recipient_id)
-    recipient_balance = normalize_money(recipient_balance)
-
-    # Transfer money
-    new_sender_balance = normalize_money(sender_balance - amount)
-    new_recipient_balance = normalize_money(recipient_balance + amount)
-    update_user_balance(sender_id, new_sender_balance)
-    update_user_balance(recipient_id, new_recipient_balance)
+    increment_user_balance(recipient_id, amount)
 
     # Check for hidden achievements
     sender_achievement = False
@@ -17567,8 +17614,8 @@ async def pay(interaction: discord.Interaction, amount: float, user: discord.Mem
 
         if result["recipient_achievement"]:
             await send_hidden_achievement_notification_dm(recipient_id, "beneficiary")
-    except Exception as e:
-        print(f"Error in pay command: {e}")
+    except Exception:
+        logger.exception("Error in pay command")
         await safe_interaction_response(interaction, interaction.followup.send, "❌ An error occurred. Please try again.", ephemeral=True)
 
 
@@ -17674,8 +17721,8 @@ class LeaderboardView(discord.ui.View):
                 self.update_buttons()
                 embed = self.create_embed(self.current_page)
                 await interaction.message.edit(embed=embed, view=self)
-        except Exception as e:
-            print(f"Error in previous_button (leaderboard): {e}")
+        except Exception:
+            logger.exception("Error in previous_button (leaderboard)")
             try:
                 await interaction.followup.send("❌ An error occurred. Please try again.", ephemeral=True)
             except:
@@ -17691,8 +17738,8 @@ class LeaderboardView(discord.ui.View):
                 self.update_buttons()
                 embed = self.create_embed(self.current_page)
                 await interaction.message.edit(embed=embed, view=self)
-        except Exception as e:
-            print(f"Error in next_button (leaderboard): {e}")
+        except Exception:
+            logger.exception("Error in next_button (leaderboard)")
             try:
                 await interaction.followup.send("❌ An error occurred. Please try again.", ephemeral=True)
             except:
@@ -17710,7 +17757,7 @@ leaderboard_messages = {}  # {guild_id: {"plants": message_id, "money": message_
 async def update_leaderboard_message(guild: discord.Guild, leaderboard_type: str):
     """Update or create a leaderboard message in the #leaderboard channel."""
     # Find the leaderboard channel
-    leaderboard_channel = discord.utils.get(guild.text_channels, name="leaderboard")
+    leaderboard_channel = _get_text_channel(guild, "leaderboard")
     
     if not leaderboard_channel:
         return  # Channel doesn't exist, skip
@@ -17952,6 +17999,9 @@ STOCK_TICKERS = [
     {"name": "Sproutify", "symbol": "SPRT", "base_price": 55.0, "max_shares": 16000, "emoji": "<:SPRT:1473422604172792024>"},
 ]
 
+# Symbol -> ticker definition, so hot paths don't scan STOCK_TICKERS
+STOCK_TICKERS_BY_SYMBOL = {t["symbol"]: t for t in STOCK_TICKERS}
+
 # Stock data storage: {guild_id: {ticker_symbol: {"price": float, "price_history": [float], "available_shares": int, "real_price": float, "shares_outstanding": int, "market_cap": float, "news_multiplier": float, "last_api_fetch": float}}}
 stock_data = {}
 
@@ -18139,20 +18189,25 @@ def get_change_emoji(change_5min: float) -> str:
     else:  # Positive (more than 0.1%)
         return "🟢"
 
+def get_shares_outstanding(guild_id: int, symbol: str) -> int:
+    """Shares outstanding for *symbol* from the guild's API data, falling back to the ticker's max_shares."""
+    ticker_info = STOCK_TICKERS_BY_SYMBOL.get(symbol)
+    if not ticker_info:
+        return 0
+    api_shares = stock_data.get(guild_id, {}).get(symbol, {}).get("shares_outstanding")
+    if api_shares and api_shares > 0:
+        return api_shares
+    return ticker_info.get("max_shares", 0)
+
 def calculate_available_shares(guild_id: int, symbol: str) -> int:
     """Calculate available shares by summing all user holdings and subtracting from real shares outstanding."""
     from database import _get_users_collection
     
-    ticker_info = next((t for t in STOCK_TICKERS if t["symbol"] == symbol), None)
-    if not ticker_info:
+    if symbol not in STOCK_TICKERS_BY_SYMBOL:
         return 0
     
     # Get shares outstanding from stock_data (from API) or fallback to max_shares
-    shares_outstanding = ticker_info.get("max_shares", 0)  # Fallback
-    if guild_id in stock_data and symbol in stock_data[guild_id]:
-        api_shares = stock_data[guild_id][symbol].get("shares_outstanding")
-        if api_shares and api_shares > 0:
-            shares_outstanding = api_shares
+    shares_outstanding = get_shares_outstanding(guild_id, symbol)
     
     # Get all users' stock holdings for this symbol
     users = _get_users_collection()
@@ -18172,7 +18227,7 @@ def calculate_available_shares(guild_id: int, symbol: str) -> int:
 async def update_marketboard_message(guild: discord.Guild):
     """Update or create the marketboard message in #grow-jones channel."""
     # Find the grow-jones channel
-    market_channel = discord.utils.get(guild.text_channels, name="grow-jones")
+    market_channel = _get_text_channel(guild, "grow-jones")
     
     if not market_channel:
         return  # Channel doesn't exist, skip
@@ -18338,6 +18393,24 @@ async def update_marketboard_message(guild: discord.Guild):
     except Exception as e:
         logging.error(f"Unexpected error updating marketboard in {guild.name}: {e}", exc_info=True)
 
+# guild id -> pending debounced marketboard refresh (trades within MARKETBOARD_DEBOUNCE_SECONDS share one edit)
+_mb_pending: dict[int, asyncio.Task] = {}
+MARKETBOARD_DEBOUNCE_SECONDS = 0.5
+
+async def _safe_update_marketboard(guild: discord.Guild):
+    """Wait out the debounce window, then refresh the marketboard without raising (see schedule_marketboard_update)."""
+    await asyncio.sleep(MARKETBOARD_DEBOUNCE_SECONDS)
+    _mb_pending.pop(guild.id, None)
+    try:
+        await update_marketboard_message(guild)
+    except Exception as e:
+        logging.error(f"Error updating marketboard in {guild.name}: {e}", exc_info=True)
+
+def schedule_marketboard_update(guild: discord.Guild):
+    """Debounced marketboard refresh: the first trade in a burst schedules the edit, later ones are coalesced."""
+    if guild.id not in _mb_pending:
+        _mb_pending[guild.id] = asyncio.create_task(_safe_update_marketboard(guild))
+
 async def update_all_marketboards():
     """Background task to update all marketboards every 6 hours."""
     await bot.wait_until_ready()
@@ -18399,7 +18472,7 @@ async def send_market_news(guild: discord.Guild):
             return
         
         # Find the market-news channel
-        news_channel = discord.utils.get(guild.text_channels, name="market-news")
+        news_channel = _get_text_channel(guild, "market-news")
         
         if not news_channel:
             logging.warning(f"Market news channel not found in guild '{guild.name}' (ID: {guild.id}). Skipping market news.")
@@ -18555,6 +18628,15 @@ CRYPTO_COINS = [
     {"name": "Canopy", "symbol": "CNY", "base_price": 855.0},
 ]
 
+CRYPTO_COIN_SYMBOLS = tuple(c["symbol"] for c in CRYPTO_COINS)
+CRYPTO_COINS_BY_SYMBOL = {c["symbol"]: c for c in CRYPTO_COINS}
+
+
+def format_crypto_holdings(holdings: dict) -> str:
+    """Format crypto holdings as one "**SYM**: amount" line per coin (for embed fields)."""
+    return "\n".join(f"**{sym}**: {holdings.get(sym, 0.0):.4f}" for sym in CRYPTO_COIN_SYMBOLS)
+
+
 # Crypto price history storage: {symbol: [float]} - keeps last 6 prices (5 minutes + current)
 crypto_price_history = {}
 
@@ -18706,7 +18788,7 @@ def get_crypto_change_emoji(change_5min: float) -> str:
 async def update_coinbase_message(guild: discord.Guild):
     """Update or create the crypto market message in #fernbase channel."""
     # Find the fernbase channel
-    fernbase_channel = discord.utils.get(guild.text_channels, name="fernbase")
+    fernbase_channel = _get_text_channel(guild, "fernbase")
     
     if not fernbase_channel:
         return  # Channel doesn't exist, skip
@@ -18862,7 +18944,7 @@ async def gardener_background_task():
                                 for guild in bot.guilds:
                                     member = guild.get_member(user_id)
                                     if member:
-                                        lawn_channel = discord.utils.get(guild.text_channels, name="lawn")
+                                        lawn_channel = _get_text_channel(guild, "lawn")
                                         if lawn_channel and lawn_channel.permissions_for(guild.me).send_messages:
                                             try:
                                                 mention = member.mention
@@ -18873,13 +18955,7 @@ async def gardener_background_task():
                                                     color=harvest_color
                                                 )
                                                 
-                                                lines = []
-                                                for item in harvest_result["gathered_items"][:20]:
-                                                    rip_em = get_ripeness_imbue_emoji(item.get("ripeness", ""))
-                                                    emoji = get_item_display_emoji(item["name"])
-                                                    gmo = " GMO! ✨" if item["is_gmo"] else ""
-                                                    prefix = f"{rip_em} " if rip_em else ""
-                                                    lines.append(f"{prefix}{emoji} (**{item['ripeness'].upper()}**){gmo}")
+                                                lines = _harvest_item_lines(harvest_result["gathered_items"][:20])
                                                 items_display = "\n".join(lines) or "No items"
                                                 # Discord embed field value limit is 1024 characters
                                                 if len(items_display) > 1024:
@@ -18922,7 +18998,7 @@ async def gardener_background_task():
                                     member = guild.get_member(user_id)
                                     if member:
                                         user_name = member.display_name or member.name
-                                        lawn_channel = discord.utils.get(guild.text_channels, name="lawn")
+                                        lawn_channel = _get_text_channel(guild, "lawn")
                                         if lawn_channel:
                                             try:
                                                 if lawn_channel.permissions_for(guild.me).send_messages:
@@ -18952,8 +19028,8 @@ async def gardener_background_task():
             
             # Stagger between users to avoid bursts that freeze the event loop on low-end hardware
             await asyncio.sleep(0.5)
-        except Exception as e:
-            print(f"Error in gardener background task: {e}")
+        except Exception:
+            logger.exception("Error in gardener background task")
 
         # Wait 60 seconds (1 minute) before next check
         await asyncio.sleep(60)
@@ -18987,7 +19063,7 @@ async def secret_gardener_background_task():
                             for guild in bot.guilds:
                                 member = guild.get_member(user_id)
                                 if member:
-                                    lawn_channel = discord.utils.get(guild.text_channels, name="lawn")
+                                    lawn_channel = _get_text_channel(guild, "lawn")
                                     if lawn_channel and lawn_channel.permissions_for(guild.me).send_messages:
                                         try:
                                             embed = discord.Embed(
@@ -18995,13 +19071,7 @@ async def secret_gardener_background_task():
                                                 description=f"{member.mention}, the Secret Gardener sparked!",
                                                 color=discord.Color.purple()
                                             )
-                                            lines = []
-                                            for item in harvest_result["gathered_items"][:20]:
-                                                rip_em = get_ripeness_imbue_emoji(item.get("ripeness", ""))
-                                                emoji = get_item_display_emoji(item["name"])
-                                                gmo = " GMO! ✨" if item["is_gmo"] else ""
-                                                prefix = f"{rip_em} " if rip_em else ""
-                                                lines.append(f"{prefix}{emoji} (**{item['ripeness'].upper()}**){gmo}")
+                                            lines = _harvest_item_lines(harvest_result["gathered_items"][:20])
                                             items_display = "\n".join(lines) or "No items"
                                             # Truncate to fit Discord's 1024 char field limit
                                             if len(items_display) > 1024:
@@ -19042,7 +19112,7 @@ async def secret_gardener_background_task():
                                 member = guild.get_member(user_id)
                                 if member:
                                     user_name = member.display_name or member.name
-                                    lawn_channel = discord.utils.get(guild.text_channels, name="lawn")
+                                    lawn_channel = _get_text_channel(guild, "lawn")
                                     if lawn_channel and lawn_channel.permissions_for(guild.me).send_messages:
                                         try:
                                             rip_em = get_ripeness_imbue_emoji(gather_result.get("ripeness", ""))
@@ -19067,8 +19137,8 @@ async def secret_gardener_background_task():
                         print(f"Error processing secret gardener for user {user_id}: {e}")
                 # Stagger between users on low-end hardware
                 await asyncio.sleep(0.5)
-        except Exception as e:
-            print(f"Error in secret gardener background task: {e}")
+        except Exception:
+            logger.exception("Error in secret gardener background task")
 
         await asyncio.sleep(60)
 
@@ -19144,8 +19214,8 @@ async def gpu_background_task():
             
             # Small delay to avoid overwhelming the system
             await asyncio.sleep(1)
-        except Exception as e:
-            print(f"Error in GPU background task: {e}")
+        except Exception:
+            logger.exception("Error in GPU background task")
         
         # Wait 60 seconds (1 minute) before next check
         await asyncio.sleep(60)
@@ -19155,7 +19225,7 @@ async def gpu_background_task():
 async def send_event_start_embed(guild: discord.Guild, event: dict, duration_minutes: int):
     """Send event start embed to #events channel."""
     # Try exact match first
-    events_channel = discord.utils.get(guild.text_channels, name="events")
+    events_channel = _get_text_channel(guild, "events")
     
     # If not found, try case-insensitive search
     if not events_channel:
@@ -19189,7 +19259,7 @@ async def send_event_start_embed(guild: discord.Guild, event: dict, duration_min
         )
         embed.set_footer(text=SOLAR_ECLIPSE_FOOTER)
         try:
-            await events_channel.send("@here", embed=embed)
+            await events_channel.send("@here", embed=embed, allowed_mentions=MENTION_HERE)
             return True
         except Exception as e:
             print(f"ERROR sending Solar Eclipse start embed in {guild.name}: {e}")
@@ -19202,7 +19272,7 @@ async def send_event_start_embed(guild: discord.Guild, event: dict, duration_min
         )
         embed.set_footer(text=BLOOD_MOON_FOOTER)
         try:
-            await events_channel.send("@here", embed=embed)
+            await events_channel.send("@here", embed=embed, allowed_mentions=MENTION_HERE)
             return True
         except Exception as e:
             print(f"ERROR sending Blood Moon start embed in {guild.name}: {e}")
@@ -19235,7 +19305,7 @@ async def send_event_start_embed(guild: discord.Guild, event: dict, duration_min
     embed.set_footer(text="Go /gather!!")
     
     try:
-        await events_channel.send("@here", embed=embed)
+        await events_channel.send("@here", embed=embed, allowed_mentions=MENTION_HERE)
         return True
     except Exception as e:
         print(f"ERROR sending event start embed in {guild.name}: {e}")
@@ -19247,7 +19317,7 @@ async def send_event_start_embed(guild: discord.Guild, event: dict, duration_min
 async def send_event_end_embed(guild: discord.Guild, event: dict):
     """Send event end embed to #events channel."""
     # Try exact match first
-    events_channel = discord.utils.get(guild.text_channels, name="events")
+    events_channel = _get_text_channel(guild, "events")
     
     # If not found, try case-insensitive search
     if not events_channel:
@@ -19374,9 +19444,7 @@ def _apply_auto_water_for_user(user_id: int, now_est: datetime.datetime) -> bool
     increment_user_water_count(user_id)
     money_reward = consecutive_days * 5000.0
     money_reward = normalize_money(money_reward)
-    current_balance = get_user_balance(user_id)
-    new_balance = normalize_money(current_balance + money_reward)
-    update_user_balance(user_id, new_balance)
+    new_balance = increment_user_balance(user_id, money_reward)
     if consecutive_days == 5 and is_first_water_today:
         increment_tree_rings(user_id, 10)
     return True
@@ -19403,8 +19471,8 @@ async def irrigation_auto_water_task():
                         except Exception as e:
                             print(f"Irrigation: error watering user {uid}: {e}")
             await asyncio.sleep(60)
-        except Exception as e:
-            print(f"Error in irrigation_auto_water_task: {e}")
+        except Exception:
+            logger.exception("Error in irrigation_auto_water_task")
             await asyncio.sleep(60)
 
 
@@ -19610,10 +19678,8 @@ async def event_manager_loop():
                     print("Event manager: started Blood Moon.")
 
             await asyncio.sleep(30)
-        except Exception as e:
-            print(f"Error in event_manager_loop: {e}")
-            import traceback
-            traceback.print_exc()
+        except Exception:
+            logger.exception("Error in event_manager_loop")
             await asyncio.sleep(30)
 
 
@@ -19630,41 +19696,36 @@ class MiningView(discord.ui.View):
         self.session_value = 0.0  # Total value mined in this session (base value only)
         self.timed_out = False  # Track if session has timed out
         self.last_embed_update = 0.0  # Track last embed update time for rate limiting
-        self.timer_task = None  # Background task for monitoring timer
+        self.timer_task = None  # Background task that ends the session when time expires
         # Ensure GPU boosts are numbers (convert to float/int if needed)
         self.gpu_percent_boost = float(gpu_percent_boost) if gpu_percent_boost else 0.0  # Total percent increase from GPUs
         self.gpu_seconds_boost = int(gpu_seconds_boost) if gpu_seconds_boost else 0  # Total seconds increase from GPUs
         self.gpus_used = gpus_used if gpus_used else []  # List of GPU names being used
         self.blockchain_achievement_unlocked = False  # Track if Blockchain achievement was unlocked
+        self._max_time = 60 + self.gpu_seconds_boost  # Session length in seconds
+        # Countdown embed, built once and mutated by _update_timer_embed on each refresh
+        self._timer_description_prefix = f"💰 **GPU MULTI: +{self.gpu_percent_boost}%**" if self.gpu_percent_boost > 0 else ""
+        self._timer_embed = discord.Embed(title="⛏️ /mine", color=discord.Color.light_grey())
+        self._timer_embed.add_field(name="**MINES:**", value="**0**", inline=True)
+        if self.gpus_used:
+            self._timer_embed.add_field(name="**GPUS:**", value="\n".join(f"**{g}**" for g in self.gpus_used), inline=False)
+        self._crypto_field_idx = None
+        self._timer_embed.set_footer(text="Keep clicking!")
     
-    async def _timer_monitor_task(self):
-        """Background task that monitors the timer and disables button when time expires."""
-        max_time = 60 + self.gpu_seconds_boost
-        
-        while not self.timed_out and self.session_started and self.start_time:
-            current_time = time.time()
-            elapsed_time = current_time - self.start_time
-            time_remaining = max_time - elapsed_time
-            
-            if time_remaining <= 0:
-                # Time expired - disable button and show expiration message instantly
-                if not self.timed_out:
-                    # Disable the button immediately
-                    for item in self.children:
-                        item.disabled = True
-                    # Update the message with disabled button state immediately
-                    if self.message:
-                        try:
-                            await self.message.edit(view=self)
-                        except Exception as e:
-                            print(f"Error disabling button: {e}")
-                    # Handle timeout (this will set timed_out and show the expiration message)
-                    await self._handle_timeout()
-                break
-            
-            # Update embed periodically (every 0.5 seconds) to show countdown
-            await self._update_timer_embed(time_remaining, max_time)
-            await asyncio.sleep(0.5)
+    async def _run_timeout_once(self):
+        """Sleep once for the whole session, then end it (no polling; clicks refresh the countdown)."""
+        await asyncio.sleep(self._max_time)
+        if self.timed_out:
+            return
+        # Disable the button immediately, then show the expiration message
+        for item in self.children:
+            item.disabled = True
+        if self.message:
+            try:
+                await self.message.edit(view=self)
+            except Exception as e:
+                print(f"Error disabling button: {e}")
+        await self._handle_timeout()
     
     async def _update_timer_embed(self, time_remaining: float, max_time: int, force_update: bool = False):
         """Update the embed with the current timer countdown. Rate limited to avoid spam."""
@@ -19686,30 +19747,16 @@ class MiningView(discord.ui.View):
         for sym, amt in self.session_mined.items():
             session_summary += f"**{sym}**: **{amt:.4f}**\n"
 
-        # Create GPU info text
-        gpu_text = ""
-        if self.gpus_used:
-            gpu_text = "\n".join(f"**{g}**" for g in self.gpus_used)
-
-        # Create description with countdown timer
-        description_text = ""
-        if self.gpu_percent_boost > 0:
-            description_text += f"💰 **GPU MULTI: +{self.gpu_percent_boost}%**"
-
-        # Show time remaining in integer seconds - BOLD THE SECONDS
-        description_text += f"\n\n⏰ Time Remaining: **{int(time_remaining)}** seconds"
-
-        success_embed = discord.Embed(
-            title="⛏️ /mine",
-            description=description_text,
-            color=discord.Color.light_grey()
-        )
-        success_embed.add_field(name="**MINES:**", value=f"**{self.total_mines}**", inline=True)
-        if gpu_text:
-            success_embed.add_field(name="**GPUS:**", value=gpu_text, inline=False)
+        # Mutate the view's embed in place; only the countdown, mine count and crypto totals change
+        success_embed = self._timer_embed
+        success_embed.description = f"{self._timer_description_prefix}\n\n⏰ Time Remaining: **{int(time_remaining)}** seconds"
+        success_embed.set_field_at(0, name="**MINES:**", value=f"**{self.total_mines}**", inline=True)
         if session_summary:
-            success_embed.add_field(name="**CRYPTO:**", value=session_summary.strip(), inline=False)
-        success_embed.set_footer(text="Keep clicking!")
+            if self._crypto_field_idx is None:
+                success_embed.add_field(name="**CRYPTO:**", value=session_summary.strip(), inline=False)
+                self._crypto_field_idx = len(success_embed.fields) - 1
+            else:
+                success_embed.set_field_at(self._crypto_field_idx, name="**CRYPTO:**", value=session_summary.strip(), inline=False)
         
         try:
             await self.message.edit(embed=success_embed, view=self)
@@ -19724,8 +19771,8 @@ class MiningView(discord.ui.View):
         
         self.timed_out = True
         
-        # Cancel timer task if it's still running
-        if self.timer_task and not self.timer_task.done():
+        # Cancel timer task if it's still running (unless we're being called from it)
+        if self.timer_task and not self.timer_task.done() and self.timer_task is not asyncio.current_task():
             self.timer_task.cancel()
             try:
                 await self.timer_task
@@ -19779,8 +19826,9 @@ class MiningView(discord.ui.View):
     @discord.ui.button(label="MINE!", style=discord.ButtonStyle.success, emoji="⛏️")
     async def mine_button(self, interaction: discord.Interaction, button: discord.ui.Button):
         try:
+            user_id = interaction.user.id
             # Check user authorization first
-            if interaction.user.id != self.user_id:
+            if user_id != self.user_id:
                 await safe_interaction_response(interaction, interaction.response.send_message, "❌ This is not your mining session!", ephemeral=True)
                 return
             
@@ -19797,18 +19845,17 @@ class MiningView(discord.ui.View):
                 self.session_started = True
                 self.start_time = time.time()
                 # Set cooldown when session actually starts
-                update_user_last_mine_time(self.user_id, self.start_time)
-                # Start the timer monitor task
-                self.timer_task = asyncio.create_task(self._timer_monitor_task())
+                update_user_last_mine_time(user_id, self.start_time)
+                # Schedule the one-shot session timeout
+                self.timer_task = asyncio.create_task(self._run_timeout_once())
                 # Update embed to show timer has started (force update on first click)
-                await self._update_timer_embed(60 + self.gpu_seconds_boost, 60 + self.gpu_seconds_boost, force_update=True)
+                await self._update_timer_embed(self._max_time, self._max_time, force_update=True)
                 # Continue to mine on this first click
             else:
                 # Check if session has timed out - early check before processing
                 # The timer task handles the main timeout, but we check here as a safety measure
                 elapsed_time = time.time() - self.start_time
-                max_time = 60 + self.gpu_seconds_boost
-                if elapsed_time >= max_time:
+                if elapsed_time >= self._max_time:
                     # Session has expired - return early (timer task will handle the rest)
                     return
             
@@ -19854,7 +19901,7 @@ class MiningView(discord.ui.View):
                     "blockchain_unlocked": blockchain_unlocked,
                 }
 
-            result = await asyncio.to_thread(_mine_critical_path, interaction.user.id, self.gpu_percent_boost)
+            result = await asyncio.to_thread(_mine_critical_path, user_id, self.gpu_percent_boost)
 
             symbol = result["symbol"]
             amount = result["amount"]
@@ -19863,9 +19910,7 @@ class MiningView(discord.ui.View):
 
             # Update session tracking (in-memory only)
             self.total_mines += 1
-            if symbol not in self.session_mined:
-                self.session_mined[symbol] = 0.0
-            self.session_mined[symbol] += amount
+            self.session_mined[symbol] = self.session_mined.get(symbol, 0.0) + amount
             self.session_value += mine_value
             
             # Check timeout again after processing (in case processing took time)
@@ -19876,15 +19921,14 @@ class MiningView(discord.ui.View):
             # Update embed only if not timed out (rate limited to avoid slowing down clicks)
             if self.session_started and not self.timed_out:
                 elapsed_time = time.time() - self.start_time
-                max_time = 60 + self.gpu_seconds_boost
-                time_remaining = max(0, max_time - elapsed_time)
+                time_remaining = max(0, self._max_time - elapsed_time)
                 
                 # Update embed asynchronously - don't block button processing
                 # Use create_task so it doesn't delay the button response
-                asyncio.create_task(self._update_timer_embed(time_remaining, max_time))
+                asyncio.create_task(self._update_timer_embed(time_remaining, self._max_time))
                 
-        except Exception as e:
-            print(f"Error in mine_button: {e}")
+        except Exception:
+            logger.exception("Error in mine_button")
             # Already deferred, so use followup if needed
             try:
                 if hasattr(interaction, 'followup'):
@@ -19905,6 +19949,18 @@ class MiningView(discord.ui.View):
         super().stop()
 
 
+# /mine intro text keyed by (has GPU percent boost, has GPU seconds boost)
+_MINE_DESC_BASE = "You will have **{total_time}** seconds to click as many times as you can!"
+_MINE_DESC_PERCENT = "\n💰 **GPU MULTI: +{total_percent_boost}%**"
+_MINE_DESC_SECONDS = "\n⏱️ **ADDED TIME: +{total_seconds_boost} seconds**"
+_MINE_DESC_TEMPLATES = {
+    (False, False): _MINE_DESC_BASE,
+    (True, False): _MINE_DESC_BASE + _MINE_DESC_PERCENT,
+    (False, True): _MINE_DESC_BASE + _MINE_DESC_SECONDS,
+    (True, True): _MINE_DESC_BASE + _MINE_DESC_PERCENT + _MINE_DESC_SECONDS,
+}
+
+
 def _mine_prepare_sync(member, user_id: int) -> dict:
     """Run in thread: sync premium + roulette check + cooldown data + GPUs. Returns dict for mine command."""
     sync_premium_tier_from_member(member)
@@ -19930,6 +19986,7 @@ async def mine(interaction: discord.Interaction):
             return
 
         user_id = interaction.user.id
+        user_name = interaction.user.name
         data = await asyncio.to_thread(_mine_prepare_sync, interaction.user, user_id)
 
         # Check if user is on Russian Roulette elimination cooldown (dead)
@@ -19937,17 +19994,17 @@ async def mine(interaction: discord.Interaction):
             roulette_time_left = data["roulette_time_left"]
             if roulette_time_left < 60:
                 await safe_interaction_response(interaction, interaction.followup.send,
-                    f"Sorry, {interaction.user.name}, you're dead. You cannot mine for {roulette_time_left} second(s)", ephemeral=True)
+                    f"Sorry, {user_name}, you're dead. You cannot mine for {roulette_time_left} second(s)", ephemeral=True)
             else:
                 minutes_left = roulette_time_left // 60
                 await safe_interaction_response(interaction, interaction.followup.send,
-                    f"Sorry, {interaction.user.name}, you're dead. You cannot mine for {minutes_left} minute(s)", ephemeral=True)
+                    f"Sorry, {user_name}, you're dead. You cannot mine for {minutes_left} minute(s)", ephemeral=True)
             return
 
         # Check if command is being used in the correct channel
         if not hasattr(interaction.channel, 'name') or interaction.channel.name != "gathercoin":
             await safe_interaction_response(interaction, interaction.followup.send,
-                f"❌ This command can only be used in the #gathercoin channel, {interaction.user.name}!",
+                f"❌ This command can only be used in the #gathercoin channel, {user_name}!",
                 ephemeral=True)
             return
 
@@ -19980,7 +20037,7 @@ async def mine(interaction: discord.Interaction):
                 minutes_left = time_left // 60
                 seconds_left = time_left % 60
                 await safe_interaction_response(interaction, interaction.followup.send,
-                    f"⏰ You must wait {minutes_left} minutes and {seconds_left} seconds before mining again, {interaction.user.name}.",
+                    f"⏰ You must wait {minutes_left} minutes and {seconds_left} seconds before mining again, {user_name}.",
                     ephemeral=True)
                 return
 
@@ -20001,11 +20058,11 @@ async def mine(interaction: discord.Interaction):
         # Create mining embed with button
         base_time = 60
         total_time = base_time + total_seconds_boost
-        description_text = f"You will have **{total_time}** seconds to click as many times as you can!"
-        if total_percent_boost > 0:
-            description_text += f"\n💰 **GPU MULTI: +{total_percent_boost}%**"
-        if total_seconds_boost > 0:
-            description_text += f"\n⏱️ **ADDED TIME: +{total_seconds_boost} seconds**"
+        description_text = _MINE_DESC_TEMPLATES[(total_percent_boost > 0, total_seconds_boost > 0)].format(
+            total_time=total_time,
+            total_percent_boost=total_percent_boost,
+            total_seconds_boost=total_seconds_boost,
+        )
 
         embed = discord.Embed(
             title="⛏️ **/mine**",
@@ -20023,8 +20080,8 @@ async def mine(interaction: discord.Interaction):
         if message:
             view.message = message
         # Don't start the timeout checker here - it will start when the user clicks the button
-    except Exception as e:
-        print(f"Error in mine command: {e}")
+    except Exception:
+        logger.exception("Error in mine command")
         await safe_interaction_response(interaction, interaction.followup.send, "❌ An error occurred. Please try again.", ephemeral=True)
 
 
@@ -20035,7 +20092,21 @@ def _sell_initial_sync(member, user_id: int) -> dict:
     sync_premium_tier_from_member(member)
     holdings = get_user_crypto_holdings(user_id)
     prices = get_crypto_prices()
-    return {"holdings": holdings, "prices": prices}
+    full_data = get_user_gather_full_data(user_id)
+    return {"holdings": holdings, "prices": prices, "full_data": full_data}
+
+
+def _sell_base_multipliers(user_id: int, full_data: dict) -> tuple[float, float, float, float, float]:
+    """Return (bloom, water, rank, achievement, daily) multipliers for /sell from prefetched *full_data* (no DB)."""
+    has_golden_can = full_data.get("shop_inventory", {}).get("golden_watering_can", 0) >= 1
+    bloom_multiplier = 1.0 + (full_data.get("tree_rings", 0) * 0.005)
+    water_base = 1.0 + (full_data.get("water_count", 0) * 0.01)
+    water_multiplier = 1.0 + (water_base - 1.0) * 2 if has_golden_can else water_base
+    rank_perma_buff_multiplier = get_rank_perma_buff_multiplier(user_id, full_data=full_data)
+    achievement_multiplier = get_achievement_multiplier(user_id, full_data=full_data)
+    daily_rate = 0.04 if has_golden_can else 0.02
+    daily_bonus_multiplier = 1.0 + (full_data.get("consecutive_water_days", 0) * daily_rate)
+    return bloom_multiplier, water_multiplier, rank_perma_buff_multiplier, achievement_multiplier, daily_bonus_multiplier
 
 
 def _sell_critical_path(member, user_id: int, coin: str, amount: float | None) -> dict:
@@ -20051,6 +20122,7 @@ def _sell_critical_path(member, user_id: int, coin: str, amount: float | None) -
     initial = _sell_initial_sync(member, user_id)
     holdings: dict = initial["holdings"]
     prices: dict = initial["prices"]
+    full_data: dict = initial["full_data"]
 
     member_name = getattr(member, "name", "you")
 
@@ -20060,11 +20132,7 @@ def _sell_critical_path(member, user_id: int, coin: str, amount: float | None) -
         base_sale_value = 0.0
         sold_items: list[str] = []
         # Track updated holdings locally to avoid an extra DB read
-        updated_holdings = {
-            "RTC": float(holdings.get("RTC", 0.0)),
-            "TER": float(holdings.get("TER", 0.0)),
-            "CNY": float(holdings.get("CNY", 0.0)),
-        }
+        updated_holdings = {sym: float(holdings.get(sym, 0.0)) for sym in CRYPTO_COIN_SYMBOLS}
 
         for crypto_coin in CRYPTO_COINS:
             symbol = crypto_coin["symbol"]
@@ -20089,24 +20157,24 @@ def _sell_critical_path(member, user_id: int, coin: str, amount: float | None) -
             }
 
         # Apply boosts to sale value (additive from base, then rank multiplies subtotal)
-        bloom_multiplier = get_bloom_multiplier(user_id)
-        water_multiplier = get_water_multiplier(user_id)
-        rank_perma_buff_multiplier = get_rank_perma_buff_multiplier(user_id)
-        achievement_multiplier = get_achievement_multiplier(user_id)
-        daily_bonus_multiplier = get_daily_bonus_multiplier(user_id)
-
-        # Calculate additive boosts from base
-        extra_from_bloom = base_sale_value * (bloom_multiplier - 1.0)
-        extra_from_water = base_sale_value * (water_multiplier - 1.0)
-        extra_from_achievement = base_sale_value * (achievement_multiplier - 1.0)
-        extra_from_daily = base_sale_value * (daily_bonus_multiplier - 1.0)
+        bloom_multiplier, water_multiplier, rank_perma_buff_multiplier, achievement_multiplier, daily_bonus_multiplier = (
+            _sell_base_multipliers(user_id, full_data)
+        )
 
-        # Subtotal before rank
-        subtotal = base_sale_value + extra_from_bloom + extra_from_water + extra_from_achievement + extra_from_daily
-        # Rank is multiplicative on subtotal
-        extra_from_rank = subtotal * (rank_perma_buff_multiplier - 1.0)
-        # All money buffs below apply to the SAME base value (additive stacking)
-        base_for_buffs = float(subtotal + extra_from_rank)
+        if bloom_multiplier == water_multiplier == rank_perma_buff_multiplier == achievement_multiplier == daily_bonus_multiplier == 1.0:
+            # No boosts active: skip the per-boost math
+            extra_from_bloom = extra_from_achievement = extra_from_daily = extra_from_rank = 0.0
+            base_for_buffs = float(base_sale_value)
+        else:
+            # Additive boosts from base collapse into one factor; rank multiplies the subtotal
+            subtotal = base_sale_value * (bloom_multiplier + water_multiplier + achievement_multiplier + daily_bonus_multiplier - 3.0)
+            # All money buffs below apply to the SAME base value (additive stacking)
+            base_for_buffs = float(subtotal * rank_perma_buff_multiplier)
+            # Per-boost deltas, only needed for the embed breakdown
+            extra_from_bloom = base_sale_value * (bloom_multiplier - 1.0)
+            extra_from_achievement = base_sale_value * (achievement_multiplier - 1.0)
+            extra_from_daily = base_sale_value * (daily_bonus_multiplier - 1.0)
+            extra_from_rank = base_for_buffs - subtotal
         beta_mult = get_beta_tester_money_multiplier(user_id)
         sb_mult = get_server_booster_money_multiplier(user_id)
         tag_mult = get_server_tag_money_multiplier(user_id)
@@ -20135,9 +20203,7 @@ def _sell_critical_path(member, user_id: int, coin: str, amount: float | None) -
         total_sale_value = base_for_buffs + extra_beta + extra_booster + extra_tag + extra_premium + extra_ns + extra_bs + extra_sc + extra_edward + extra_eclipse + extra_msi + extra_gamer_multi + extra_jump_multi + extra_jump_debuff
 
         # Add money to balance (with boosts)
-        current_balance = get_user_balance(user_id)
-        new_balance = current_balance + total_sale_value
-        update_user_balance(user_id, new_balance)
+        new_balance = increment_user_balance(user_id, total_sale_value)
 
         # Create success embed
         embed = discord.Embed(
@@ -20147,7 +20213,7 @@ def _sell_critical_path(member, user_id: int, coin: str, amount: float | None) -
         embed.add_field(name="**SOLD**", value="\n".join(sold_items) if sold_items else "None", inline=False)
 
         # Show boosts if applicable
-        bloom_count = get_user_bloom_count(user_id)
+        bloom_count = full_data.get("bloom_count", 0)
         if bloom_count > 0 and extra_from_bloom > 0:
             multiplier_percent = (bloom_multiplier - 1.0) * 100
             embed.add_field(
@@ -20171,7 +20237,7 @@ def _sell_critical_path(member, user_id: int, coin: str, amount: float | None) -
                 inline=False,
             )
         # Show rank perma buff if applicable (only if not PINE I) - multiplicative on subtotal
-        bloom_rank = get_bloom_rank(user_id)
+        bloom_rank = _bloom_count_to_rank(bloom_count)
         if bloom_rank != "PINE I" and extra_from_rank > 0:
             rank_percent = (rank_perma_buff_multiplier - 1.0) * 100
             embed.add_field(
@@ -20240,7 +20306,7 @@ def _sell_critical_path(member, user_id: int, coin: str, amount: float | None) -
         if black_shard_mult > 1.0:
             bs_count = get_user_shop_inventory(user_id).get("black_shard", 0)
             if bs_count > 0:
-                item_boost_sources.append(("Black Shard", total_count))
+                item_boost_sources.append(("Black Shard", bs_count))
 
         if item_boost_sources:
             total_item_extra = extra_ns + extra_bs
@@ -20254,7 +20320,7 @@ def _sell_critical_path(member, user_id: int, coin: str, amount: float | None) -
 
         embed.add_field(
             name="**CRYPTO**",
-            value=f"**RTC**: {updated_holdings['RTC']:.4f}\n**TER**: {updated_holdings['TER']:.4f}\n**CNY**: {updated_holdings['CNY']:.4f}",
+            value=format_crypto_holdings(updated_holdings),
             inline=False,
         )
         embed.add_field(name="💰 **TOTAL**", value=f"**${total_sale_value:,.2f}**", inline=True)
@@ -20295,24 +20361,24 @@ def _sell_critical_path(member, user_id: int, coin: str, amount: float | None) -
         base_sale_value *= 1.50
 
     # Apply boosts to sale value (additive from base, then rank multiplies subtotal)
-    bloom_multiplier = get_bloom_multiplier(user_id)
-    water_multiplier = get_water_multiplier(user_id)
-    rank_perma_buff_multiplier = get_rank_perma_buff_multiplier(user_id)
-    achievement_multiplier = get_achievement_multiplier(user_id)
-    daily_bonus_multiplier = get_daily_bonus_multiplier(user_id)
+    bloom_multiplier, water_multiplier, rank_perma_buff_multiplier, achievement_multiplier, daily_bonus_multiplier = (
+        _sell_base_multipliers(user_id, full_data)
+    )
 
-    # Calculate additive boosts from base
-    extra_from_bloom = base_sale_value * (bloom_multiplier - 1.0)
-    extra_from_water = base_sale_value * (water_multiplier - 1.0)
-    extra_from_achievement = base_sale_value * (achievement_multiplier - 1.0)
-    extra_from_daily = base_sale_value * (daily_bonus_multiplier - 1.0)
-
-    # Subtotal before rank
-    subtotal = base_sale_value + extra_from_bloom + extra_from_water + extra_from_achievement + extra_from_daily
-    # Rank is multiplicative on subtotal
-    extra_from_rank = subtotal * (rank_perma_buff_multiplier - 1.0)
-    # All money buffs below apply to the SAME base value (additive stacking)
-    base_for_buffs = float(subtotal + extra_from_rank)
+    if bloom_multiplier == water_multiplier == rank_perma_buff_multiplier == achievement_multiplier == daily_bonus_multiplier == 1.0:
+        # No boosts active: skip the per-boost math
+        extra_from_bloom = extra_from_achievement = extra_from_daily = extra_from_rank = 0.0
+        base_for_buffs = float(base_sale_value)
+    else:
+        # Additive boosts from base collapse into one factor; rank multiplies the subtotal
+        subtotal = base_sale_value * (bloom_multiplier + water_multiplier + achievement_multiplier + daily_bonus_multiplier - 3.0)
+        # All money buffs below apply to the SAME base value (additive stacking)
+        base_for_buffs = float(subtotal * rank_perma_buff_multiplier)
+        # Per-boost deltas, only needed for the embed breakdown
+        extra_from_bloom = base_sale_value * (bloom_multiplier - 1.0)
+        extra_from_achievement = base_sale_value * (achievement_multiplier - 1.0)
+        extra_from_daily = base_sale_value * (daily_bonus_multiplier - 1.0)
+        extra_from_rank = base_for_buffs - subtotal
     beta_mult = get_beta_tester_money_multiplier(user_id)
     sb_mult = get_server_booster_money_multiplier(user_id)
     tag_mult = get_server_tag_money_multiplier(user_id)
@@ -20336,17 +20402,11 @@ def _sell_critical_path(member, user_id: int, coin: str, amount: float | None) -
 
     # Update holdings (subtract) in DB and locally
     update_user_crypto_holdings(user_id, coin, -amount)
-    updated_holdings = {
-        "RTC": float(holdings.get("RTC", 0.0)),
-        "TER": float(holdings.get("TER", 0.0)),
-        "CNY": float(holdings.get("CNY", 0.0)),
-    }
+    updated_holdings = {sym: float(holdings.get(sym, 0.0)) for sym in CRYPTO_COIN_SYMBOLS}
     updated_holdings[coin] = updated_holdings.get(coin, 0.0) - float(amount)
 
     # Add money to balance (with boosts)
-    current_balance = get_user_balance(user_id)
-    new_balance = current_balance + sale_value
-    update_user_balance(user_id, new_balance)
+    new_balance = increment_user_balance(user_id, sale_value)
 
     # Create success embed
     embed = discord.Embed(
@@ -20355,7 +20415,7 @@ def _sell_critical_path(member, user_id: int, coin: str, amount: float | None) -
     )
 
     # Show boosts if applicable
-    bloom_count = get_user_bloom_count(user_id)
+    bloom_count = full_data.get("bloom_count", 0)
     if bloom_count > 0 and extra_from_bloom > 0:
         multiplier_percent = (bloom_multiplier - 1.0) * 100
         embed.add_field(
@@ -20379,7 +20439,7 @@ def _sell_critical_path(member, user_id: int, coin: str, amount: float | None) -
             inline=False,
         )
     # Show rank perma buff if applicable (only if not PINE I) - multiplicative on subtotal
-    bloom_rank = get_bloom_rank(user_id)
+    bloom_rank = _bloom_count_to_rank(bloom_count)
     if bloom_rank != "PINE I" and extra_from_rank > 0:
         rank_percent = (rank_perma_buff_multiplier - 1.0) * 100
         embed.add_field(
@@ -20442,7 +20502,7 @@ def _sell_critical_path(member, user_id: int, coin: str, amount: float | None) -
 
     embed.add_field(
         name="**CRYPTO**",
-        value=f"**RTC**: {updated_holdings['RTC']:.4f}\n**TER**: {updated_holdings['TER']:.4f}\n**CNY**: {updated_holdings['CNY']:.4f}",
+        value=format_crypto_holdings(updated_holdings),
         inline=False,
     )
     embed.add_field(name="💰 **TOTAL**", value=f"**${sale_value:,.2f}**", inline=True)
@@ -20479,8 +20539,8 @@ async def sell(interaction: discord.Interaction, coin: str, amount: float = None
 
         embed: discord.Embed = result["embed"]
         await safe_interaction_response(interaction, interaction.followup.send, embed=embed)
-    except Exception as e:
-        print(f"Error in sell command: {e}")
+    except Exception:
+        logger.exception("Error in sell command")
         await safe_interaction_response(
             interaction,
             interaction.followup.send,
@@ -20505,43 +20565,45 @@ async def portfolio(interaction: discord.Interaction):
         # Get stock holdings
         stock_holdings = get_user_stock_holdings(user_id)
         
-        # Initialize stocks for guild if needed to get current prices
+        guild_stocks = {}
         if guild_id:
-            await initialize_stocks(guild_id)
-            stock_prices = {}
-            for ticker in STOCK_TICKERS:
-                symbol = ticker["symbol"]
-                if symbol in stock_data.get(guild_id, {}):
-                    stock_prices[symbol] = stock_data[guild_id][symbol]["price"]
-                else:
-                    stock_prices[symbol] = ticker["base_price"]
-        else:
-            # Fallback to base prices if no guild
-            stock_prices = {ticker["symbol"]: ticker["base_price"] for ticker in STOCK_TICKERS}
+            # Initialize stocks for guild if needed to get current prices
+            if guild_id not in stock_data:
+                await initialize_stocks(guild_id)
+            guild_stocks = stock_data.get(guild_id, {})
         
-        # Calculate crypto values
-        crypto_values = {}
+        # Walk only what the user holds (usually a small subset of coins/tickers)
+        crypto_fields = []
         crypto_total = 0.0
-        
-        for coin in CRYPTO_COINS:
-            symbol = coin["symbol"]
-            amount = crypto_holdings.get(symbol, 0.0)
-            price = crypto_prices.get(symbol, coin["base_price"])
-            value = amount * price
-            crypto_values[symbol] = value
+        for symbol, amount in crypto_holdings.items():
+            if amount <= 0:
+                continue
+            coin = CRYPTO_COINS_BY_SYMBOL.get(symbol)
+            if not coin:
+                continue
+            value = amount * crypto_prices.get(symbol, coin["base_price"])
             crypto_total += value
+            crypto_fields.append((
+                f"**{coin['name']} ({symbol})**",
+                f"**AMOUNT**: {amount:.4f}\n**VALUE**: ${value:.2f}",
+            ))
         
-        # Calculate stock values
-        stock_values = {}
+        stock_fields = []
         stock_total = 0.0
-        
-        for ticker in STOCK_TICKERS:
-            symbol = ticker["symbol"]
-            shares = stock_holdings.get(symbol, 0)
-            price = stock_prices.get(symbol, ticker["base_price"])
+        for symbol, shares in stock_holdings.items():
+            if shares <= 0:
+                continue
+            ticker = STOCK_TICKERS_BY_SYMBOL.get(symbol)
+            if not ticker:
+                continue
+            symbol_data = guild_stocks.get(symbol)
+            price = symbol_data["price"] if symbol_data else ticker["base_price"]
             value = shares * price
-            stock_values[symbol] = value
             stock_total += value
+            stock_fields.append((
+                f"**{ticker['name']} ({symbol})**",
+                f"**SHARES**: {shares:,}\n**VALUE**: ${value:.2f}",
+            ))
         
         # Total portfolio value
         total_value = crypto_total + stock_total
@@ -20556,17 +20618,8 @@ async def portfolio(interaction: discord.Interaction):
         # Add cryptocurrency section
         if crypto_total > 0:
             embed.description += "\n**💰 CRYPTOCURRENCY:**"
-            for coin in CRYPTO_COINS:
-                symbol = coin["symbol"]
-                amount = crypto_holdings.get(symbol, 0.0)
-                if amount > 0:
-                    price = crypto_prices.get(symbol, coin["base_price"])
-                    value = crypto_values.get(symbol, 0.0)
-                    embed.add_field(
-                        name=f"**{coin['name']} ({symbol})**",
-                        value=f"**AMOUNT**: {amount:.4f}\n**VALUE**: ${value:.2f}",
-                        inline=True
-                    )
+            for name, value in crypto_fields:
+                embed.add_field(name=name, value=value, inline=True)
             # Add total as a field right after crypto holdings
             embed.add_field(
                 name="\u200b",
@@ -20577,17 +20630,8 @@ async def portfolio(interaction: discord.Interaction):
         # Add stock section
         if stock_total > 0:
             embed.description += "\n**📈 STOCKS:**"
-            for ticker in STOCK_TICKERS:
-                symbol = ticker["symbol"]
-                shares = stock_holdings.get(symbol, 0)
-                if shares > 0:
-                    price = stock_prices.get(symbol, ticker["base_price"])
-                    value = stock_values.get(symbol, 0.0)
-                    embed.add_field(
-                        name=f"**{ticker['name']} ({symbol})**",
-                        value=f"**SHARES**: {shares:,}\n**VALUE**: ${value:.2f}",
-                        inline=True
-                    )
+            for name, value in stock_fields:
+                embed.add_field(name=name, value=value, inline=True)
             # Add total as a field right after stock holdings
             embed.add_field(
                 name="\u200b",
@@ -20601,11 +20645,50 @@ async def portfolio(interaction: discord.Interaction):
         embed.set_footer(text="Do /mine to get crypto, /sell to sell it, and /stocks to buy/sell shares!")
         
         await safe_interaction_response(interaction, interaction.followup.send, embed=embed)
-    except Exception as e:
-        print(f"Error in portfolio command: {e}")
+    except Exception:
+        logger.exception("Error in portfolio command")
         await safe_interaction_response(interaction, interaction.followup.send, "❌ An error occurred. Please try again.", ephemeral=True)
 
 
+def build_trade_embed(action: str, amount: int, ticker_info: dict, price: float, total: float, new_balance: float, share_total: int) -> discord.Embed:
+    """Build the /stocks buy/sell confirmation embed from a single dict via Embed.from_dict."""
+    if action == "buy":
+        title, verb = "✅ **PURCHASE SUCCESSFUL!**", "bought"
+        total_name, balance_name, shares_name = "Cost", "New Balance", "Total Shares Owned"
+    else:
+        title, verb = "✅ **SOLD!**", "sold"
+        total_name, balance_name, shares_name = "**REVENUE**", "**NEW BALANCE**", "Remaining Shares"
+    return discord.Embed.from_dict({
+        "title": title,
+        "description": f"You {verb} **{amount:,} share(s)** of {ticker_info['emoji']} **{ticker_info['name']}** ({ticker_info['symbol']}) at **${price:.2f}** each.",
+        "color": GREEN,
+        "fields": [
+            {"name": total_name, "value": f"**${total:.2f}**", "inline": True},
+            {"name": balance_name, "value": f"**${new_balance:.2f}**", "inline": True},
+            {"name": shares_name, "value": f"**{share_total:,}**", "inline": False},
+        ],
+        "footer": {"text": "Use /portfolio to view all your holdings"},
+    })
+
+
+def _stocks_buy_critical_path(user_id: int, ticker: str, amount: int, total_cost: float) -> tuple:
+    """Balance and holdings writes for a /stocks buy in ONE sync call (runs via to_thread).
+    Returns ``(success, new_balance)``; nothing is written when the user can't afford it."""
+    success, new_balance = atomic_deduct_balance(user_id, total_cost)
+    if success:
+        update_user_stock_holdings(user_id, ticker, amount)
+    return success, new_balance
+
+
+def _stocks_sell_critical_path(user_id: int, ticker: str, amount: int, total_value: float):
+    """Holdings and balance writes for a /stocks sell in ONE sync call (runs via to_thread).
+    Returns ``(new_balance, remaining_shares)``, or None if the user no longer holds *amount* shares."""
+    remaining_shares = sell_user_stock_holdings(user_id, ticker, amount)
+    if remaining_shares is None:
+        return None
+    return increment_user_balance(user_id, total_value), remaining_shares
+
+
 @bot.tree.command(name="stocks", description="Buy or sell stocks")
 @app_commands.choices(action=[
     app_commands.Choice(name="buy", value="buy"),
@@ -20631,7 +20714,7 @@ async def stocks(interaction: discord.Interaction, action: str, ticker: str, amo
         user_id = interaction.user.id
         
         # Check if user is on Russian Roulette elimination cooldown (dead)
-        is_roulette_cooldown, roulette_time_left = check_roulette_elimination_cooldown(user_id)
+        is_roulette_cooldown, roulette_time_left = await asyncio.to_thread(check_roulette_elimination_cooldown, user_id)
         if is_roulette_cooldown:
             minutes_left = roulette_time_left // 60
             await safe_interaction_response(interaction, interaction.followup.send,
@@ -20648,11 +20731,7 @@ async def stocks(interaction: discord.Interaction, action: str, ticker: str, amo
             return
         
         # Find the ticker info
-        ticker_info = None
-        for t in STOCK_TICKERS:
-            if t["symbol"] == ticker:
-                ticker_info = t
-                break
+        ticker_info = STOCK_TICKERS_BY_SYMBOL.get(ticker)
         
         if not ticker_info:
             await safe_interaction_response(interaction, interaction.followup.send,
@@ -20667,21 +20746,20 @@ async def stocks(interaction: discord.Interaction, action: str, ticker: str, amo
                 ephemeral=True)
             return
     
-        await initialize_stocks(guild_id)
+        if guild_id not in stock_data:
+            await initialize_stocks(guild_id)
         
         # Get current stock price
-        if ticker not in stock_data.get(guild_id, {}):
-            current_price = ticker_info["base_price"]
-        else:
-            current_price = stock_data[guild_id][ticker]["price"]
+        ticker_data = stock_data.get(guild_id, {}).get(ticker)
+        current_price = ticker_data["price"] if ticker_data else ticker_info["base_price"]
         
         # Get user's current stock holdings
-        stock_holdings = get_user_stock_holdings(user_id)
+        stock_holdings = await asyncio.to_thread(get_user_stock_holdings, user_id)
         current_shares = stock_holdings.get(ticker, 0)
         
         if action == "buy":
             # Check if enough shares are available in the market
-            available_shares = calculate_available_shares(guild_id, ticker)
+            available_shares = await asyncio.to_thread(calculate_available_shares, guild_id, ticker)
             if available_shares == 0:
                 await safe_interaction_response(interaction, interaction.followup.send,
                     f"❌ No shares available! All shares of {ticker_info['emoji']} **{ticker_info['name']}** ({ticker}) have been purchased.",
@@ -20699,48 +20777,30 @@ async def stocks(interaction: discord.Interaction, action: str, ticker: str, amo
             # Calculate total cost
             total_cost = amount * current_price
             
-            # Check if user has enough balance
-            user_balance = get_user_balance(user_id)
-            if user_balance < total_cost:
+            # Deduct money only if affordable, then add shares (in order, one thread hop)
+            success, new_balance = await asyncio.to_thread(_stocks_buy_critical_path, user_id, ticker, amount, total_cost)
+            if not success:
                 await safe_interaction_response(interaction, interaction.followup.send,
                     f"❌ You don't have enough balance to buy {amount} share(s) of {ticker_info['emoji']} **{ticker_info['name']}** ({ticker})!\n\n"
-                    f"You need **${total_cost:.2f}** but only have **${user_balance:.2f}**.",
+                    f"You need **${total_cost:.2f}** but only have **${new_balance:.2f}**.",
                     ephemeral=True)
                 return
             
-            # Deduct money and add shares
-            new_balance = user_balance - total_cost
-            update_user_balance(user_id, new_balance)
-            update_user_stock_holdings(user_id, ticker, amount)
-            
             # Check for hidden achievement: CEO (own over 50% of shares for any company)
             # Get shares outstanding from stock_data or fallback to max_shares
-            shares_outstanding = ticker_info.get("max_shares", 0)
-            if guild_id and guild_id in stock_data and ticker in stock_data[guild_id]:
-                api_shares = stock_data[guild_id][ticker].get("shares_outstanding")
-                if api_shares and api_shares > 0:
-                    shares_outstanding = api_shares
+            shares_outstanding = get_shares_outstanding(guild_id, ticker)
             
             user_owned_shares = current_shares + amount
             ceo_unlocked = False
-            if shares_outstanding > 0 and (user_owned_shares / shares_outstanding) > 0.5:
-                ceo_unlocked = unlock_hidden_achievement(user_id, "ceo")
+            # Integer cross-multiply: most buys can't cross 50%, so skip the achievement DB call
+            if shares_outstanding > 0 and 2 * user_owned_shares > shares_outstanding:
+                ceo_unlocked = await asyncio.to_thread(unlock_hidden_achievement, user_id, "ceo")
             
             # Create success embed
-            embed = discord.Embed(
-                title="✅ **PURCHASE SUCCESSFUL!**",
-                description=f"You bought **{amount:,} share(s)** of {ticker_info['emoji']} **{ticker_info['name']}** ({ticker}) at **${current_price:.2f}** each.",
-                color=discord.Color.green()
-            )
-            embed.add_field(name="Cost", value=f"**${total_cost:.2f}**", inline=True)
-            embed.add_field(name="New Balance", value=f"**${new_balance:.2f}**", inline=True)
-            embed.add_field(name="Total Shares Owned", value=f"**{current_shares + amount:,}**", inline=False)
+            embed = build_trade_embed("buy", amount, ticker_info, current_price, total_cost, new_balance, user_owned_shares)
             
-            # Update marketboard immediately
-            try:
-                await update_marketboard_message(interaction.guild)
-            except Exception as e:
-                print(f"Error updating marketboard after buy: {e}")
+            # Refresh the marketboard in the background so the trade response isn't delayed
+            schedule_marketboard_update(interaction.guild)
             
         else:  # sell
             # Check if user has enough shares
@@ -20755,29 +20815,21 @@ async def stocks(interaction: discord.Interaction, action: str, ticker: str, amo
             # Calculate total value
             total_value = amount * current_price
             
-            # Add money and remove shares
-            user_balance = get_user_balance(user_id)
-            new_balance = user_balance + total_value
-            update_user_balance(user_id, new_balance)
-            update_user_stock_holdings(user_id, ticker, -amount)
+            # Remove shares only if still held, then credit the sale (in order, one thread hop)
+            sale = await asyncio.to_thread(_stocks_sell_critical_path, user_id, ticker, amount, total_value)
+            if sale is None:
+                await safe_interaction_response(interaction, interaction.followup.send,
+                    f"❌ You don't have enough shares to sell!",
+                    ephemeral=True)
+                return
+            new_balance, remaining_shares = sale
             
             # Create success embed
-            embed = discord.Embed(
-                title="✅ **SOLD!**",
-                description=f"You sold **{amount:,} share(s)** of {ticker_info['emoji']} **{ticker_info['name']}** ({ticker}) at **${current_price:.2f}** each.",
-                color=discord.Color.green()
-            )
-            embed.add_field(name="**REVENUE**", value=f"**${total_value:.2f}**", inline=True)
-            embed.add_field(name="**NEW BALANCE**", value=f"**${new_balance:.2f}**", inline=True)
-            embed.add_field(name="Remaining Shares", value=f"**{current_shares - amount:,}**", inline=False)
+            embed = build_trade_embed("sell", amount, ticker_info, current_price, total_value, new_balance, remaining_shares)
             
-            # Update marketboard immediately
-            try:
-                await update_marketboard_message(interaction.guild)
-            except Exception as e:
-                print(f"Error updating marketboard after sell: {e}")
+            # Refresh the marketboard in the background so the trade response isn't delayed
+            schedule_marketboard_update(interaction.guild)
         
-        embed.set_footer(text=f"Use /portfolio to view all your holdings")
         await safe_interaction_response(interaction, interaction.followup.send, embed=embed)
         
         # Send CEO achievement embed (ephemeral = hidden to user only); fallback to DM if needed
@@ -20786,8 +20838,8 @@ async def stocks(interaction: discord.Interaction, action: str, ticker: str, amo
                 await send_hidden_achievement_notification(interaction, "ceo")
             except Exception:
                 await send_hidden_achievement_notification_dm(user_id, "ceo")
-    except Exception as e:
-        print(f"Error in stocks command: {e}")
+    except Exception:
+        logger.exception("Error in stocks command")
         await safe_interaction_response(interaction, interaction.followup.send, "❌ An error occurred. Please try again.", ephemeral=True)
 
 
@@ -20802,113 +20854,99 @@ async def russian(
     players: int = 1 # default 1
 ):
     try:
-        if not await safe_defer(interaction):
-            return
         #start russian roullette
         user_id = interaction.user.id
         user_name = interaction.user.name
         channel_id = interaction.channel.id
         channel_name = interaction.channel.name.lower() if hasattr(interaction.channel, 'name') else ""
 
-        # Check if user is on Russian Roulette elimination cooldown
-        is_roulette_cooldown, roulette_time_left = check_roulette_elimination_cooldown(user_id)
-        if is_roulette_cooldown:
-            minutes_left = roulette_time_left // 60
-            await safe_interaction_response(interaction, interaction.followup.send,
-                f"Sorry, {interaction.user.name}, you're dead. You cannot /russian for {minutes_left} minute(s)", ephemeral=True)
-            return
-
-        # Check if this is a Russian Roulette channel (by name pattern)
-        is_roulette_channel = "russian" in channel_name or "roulette" in channel_name
+        # Cheap synchronous checks first: reject bad input directly, without paying for a defer round-trip
+        # Check if this is a Russian Roulette channel (by name pattern, cached per channel)
+        is_roulette_channel = _is_roulette_channel.get(channel_id)
+        if is_roulette_channel is None:
+            is_roulette_channel = "russian" in channel_name or "roulette" in channel_name
+            _is_roulette_channel[channel_id] = is_roulette_channel
         
         # If in a Russian Roulette channel, require Planter II or above
         if is_roulette_channel:
-            planter_roles = ["PLANTER I", "PLANTER II", "PLANTER III", "PLANTER IV", "PLANTER V", "PLANTER VI", "PLANTER VII", "PLANTER VIII", "PLANTER IX", "PLANTER X"]
-            user_roles = [role.name for role in interaction.user.roles]
-            has_planter_role = any(role in planter_roles for role in user_roles)
-            
-            if not has_planter_role:
-                await safe_interaction_response(interaction, interaction.followup.send,
-                    f"❌ You must be at least **Planter II** to play Russian Roulette. (Go /gather!!)\n\n",
-                    ephemeral=True)
-                return
-            
-            # Check if they have Planter II or higher (not Planter I)
-            planter_levels = ["PLANTER I", "PLANTER II", "PLANTER III", "PLANTER IV", "PLANTER V", "PLANTER VI", "PLANTER VII", "PLANTER VIII", "PLANTER IX", "PLANTER X"]
-            user_planter_role = next((role for role in user_roles if role in planter_levels), None)
-            
-            if user_planter_role == "PLANTER I":
-                await safe_interaction_response(interaction, interaction.followup.send,
+            user_role_names = {role.name for role in interaction.user.roles}
+            if not (user_role_names & PLANTER_II_PLUS):
+                await safe_interaction_response(interaction, interaction.response.send_message,
                     f"❌ You must be at least **Planter II** to play Russian Roulette. (Go /gather!!)\n\n",
                     ephemeral=True)
                 return
 
-        # make sure game is actually valid and the person can do it
-
-        # first, check if game already in channel
-        if channel_id in active_roulette_channel_games:
-            existing_game_id = active_roulette_channel_games[channel_id]
-            if existing_game_id in active_roulette_games:
-                await safe_interaction_response(interaction, interaction.followup.send, f"There's already a Russian Roulette game running in this channel!", ephemeral=True)
-                return
-            else:
-                #clean up orphaned ref
-                del active_roulette_channel_games[channel_id]
-        
-
-        # make sure user is not already in a game
-        if user_id in user_active_games:
-            existing_game_id = user_active_games[user_id]
-            if existing_game_id in active_roulette_games:
-                await safe_interaction_response(interaction, interaction.followup.send, f"You're already in a game! Finish it or cash out first!", ephemeral=True)
-                return
-            else:
-                #clean up orphaned ref
-                del user_active_games[user_id]
-
-
         if bullets < 1 or bullets > 5:
-            await safe_interaction_response(interaction, interaction.followup.send, f"Invalid number of bullets", ephemeral=True)
+            await safe_interaction_response(interaction, interaction.response.send_message, f"Invalid number of bullets", ephemeral=True)
             return
 
         if players < 1 or players > 6:
-            await safe_interaction_response(interaction, interaction.followup.send, f"Invalid number of players", ephemeral=True)
+            await safe_interaction_response(interaction, interaction.response.send_message, f"Invalid number of players", ephemeral=True)
             return
         if bet <= 0:
-            await safe_interaction_response(interaction, interaction.followup.send, f"❌ Bet amount must be greater than $0.00!", ephemeral=True)
+            await safe_interaction_response(interaction, interaction.response.send_message, f"❌ Bet amount must be greater than $0.00!", ephemeral=True)
             return
 
-        # Validate bet has at most 2 decimal places (no fractional cents)
-        if not validate_money_precision(bet):
-            await safe_interaction_response(interaction, interaction.followup.send, "❌ Bet amount must be in dollars and cents (maximum 2 decimal places)!", ephemeral=True)
+        # Convert to integer cents once; rejects fractional cents and makes the balance check exact
+        bet_cents = round(bet * 100)
+        if abs(bet * 100 - bet_cents) > 1e-6:
+            await safe_interaction_response(interaction, interaction.response.send_message, "❌ Bet amount must be in dollars and cents (maximum 2 decimal places)!", ephemeral=True)
             return
+        bet = bet_cents / 100
 
-        # Normalize bet to exactly 2 decimal places
-        bet = normalize_money(bet)
+        if not await safe_defer(interaction):
+            return
+
+        # Check if user is on Russian Roulette elimination cooldown
+        is_roulette_cooldown, roulette_time_left = await asyncio.to_thread(check_roulette_elimination_cooldown, user_id)
+        if is_roulette_cooldown:
+            minutes_left = roulette_time_left // 60
+            await safe_interaction_response(interaction, interaction.followup.send,
+                f"Sorry, {interaction.user.name}, you're dead. You cannot /russian for {minutes_left} minute(s)", ephemeral=True)
+            return
 
         # get user balance
-        user_balance = get_user_balance(user_id)
-        user_balance = normalize_money(user_balance)
-        
-        if not can_afford_rounded(user_balance, bet):
+        # Single balance read; the stored balance is canonical and already 2dp
+        balance_cents = round(await asyncio.to_thread(get_user_balance, user_id) * 100)
+        if balance_cents < bet_cents:
             await safe_interaction_response(interaction, interaction.followup.send, f"You don't have enough balance to play Russian Roulette.", ephemeral=True)
             return
 
-        #create unique game ID
-        game_id = str(uuid.uuid4())[:8]
+        # Check-and-register with no await in between: on the single event loop this block runs
+        # atomically, so concurrent /russian calls can't both claim the same channel or user
+        reject_msg = None
+        # first, check if game already in channel; then make sure user is not already in a game
+        if _reap_orphan(active_roulette_channel_games, channel_id, active_roulette_games):
+            reject_msg = "There's already a Russian Roulette game running in this channel!"
+        elif _reap_orphan(user_active_games, user_id, active_roulette_games):
+            reject_msg = "You're already in a game! Finish it or cash out first!"
+
+        if reject_msg is None:
+            #create unique game ID
+            game_id = format(next(_roulette_game_id_counter), 'x')
 
-        #create new game (bet is already normalized)
-        game = RouletteGame(game_id, user_id, user_name, bullets, bet, players)
-        game.channel_id = channel_id
-        active_roulette_games[game_id] = game
-        user_active_games[user_id] = game_id
-        active_roulette_channel_games[channel_id] = game_id
+            #create new game (bet is already normalized)
+            game = RouletteGame(game_id, user_id, user_name, bullets, bet, players, channel_id=channel_id)
+            active_roulette_games[game_id] = game
+            user_active_games[user_id] = game_id
+            active_roulette_channel_games[channel_id] = game_id
+
+        if reject_msg is not None:
+            await safe_interaction_response(interaction, interaction.followup.send, reject_msg, ephemeral=True)
+            return
 
-        # deduct bet from host
-        new_balance = normalize_money(user_balance - bet)
-        update_user_balance(user_id, new_balance)
+        # deduct bet from host atomically; the balance read above may be stale by now
+        success, _ = await asyncio.to_thread(atomic_deduct_balance, user_id, bet)
+        if not success:
+            _untrack_roulette_game(game)
+            await safe_interaction_response(interaction, interaction.followup.send, f"You don't have enough balance to play Russian Roulette.", ephemeral=True)
+            return
+        try:
+            await asyncio.to_thread(add_roulette_escrow, game_id, user_id, bet)
+        except Exception:
+            logger.exception("Error escrowing roulette buy-in of %s for user %s in game %s", bet, user_id, game_id)
         # increase bullet multiplier
-        bullet_multiplier = 1.2 ** bullets
+        bullet_multiplier, death_chance_str, survival_chance_str = ROULETTE_STATS[bullets]
 
         # # SOLO MODE
         # if players == 1:
@@ -20942,34 +20980,21 @@ async def russian(
         #     return
 
         # MULTIPLAYER MODE
-        embed = discord.Embed(
-            title="🎲 RUSSIAN ROULETTE 🎲",
-            description=f"**{user_name}** is playing with **{len(game.players)}/{players}** players!\n\n*How long can you survive?*",
-            color = discord.Color.red()
-        )
-        embed.add_field(name="🔫 Bullets", value=f"{bullets}/6", inline=True)
-        embed.add_field(name="💰 Buy-in", value=f"${bet:.2f}", inline=True)
-        embed.add_field(name="📈 Base Multiplier", value=f"{bullet_multiplier:.2f}x", inline=True)
-        embed.add_field(name="💀 Death Chance", value=f"{(bullets/6)*100:.1f}%", inline=True)
-        embed.add_field(name="✅ Survival Chance", value=f"{((6-bullets)/6)*100:.1f}%", inline=True)
+        embed = _roulette_embed(_ROULETTE_LOBBY_EMBED, (
+            ("🔫 Bullets", f"{bullets}/6"),
+            ("💰 Buy-in", f"${bet:.2f}"),
+            ("📈 Base Multiplier", f"{bullet_multiplier:.2f}x"),
+            ("💀 Death Chance", death_chance_str),
+            ("✅ Survival Chance", survival_chance_str),
+        ), description=_roulette_lobby_description(user_name, len(game.players), players))
         #embed.add_field(name="🎮 Game ID", value=f"`{game_id}`", inline=True)
-        embed.add_field(
-        name="📋 Rules",
-        value="Cash out anytime to keep your winnings, or keep playing for more!",
-        inline=False
-    )
         
         #create join button
-        view = RouletteJoinView(game_id, user_id,timeout = 300)
-
-        if players == 1:
-            embed.add_field(name="ℹ️ How to Play", value="Click **Start** to begin your solo adventure!", inline=False)
-        else:
-            embed.add_field(name="ℹ️ How to Play", value=f"Waiting for {players-1} more players to join! Host can click **Start** when ready!", inline=False)
+        view = RouletteSoloStartView(game_id, user_id, timeout=300) if players == 1 else RouletteJoinView(game_id, user_id, timeout=300)
 
         await safe_interaction_response(interaction, interaction.followup.send, embed=embed, view=view)
-    except Exception as e:
-        print(f"Error in russian command: {e}")
+    except Exception:
+        logger.exception("Error in russian command")
         await safe_interaction_response(interaction, interaction.followup.send, "❌ An error occurred. Please try again.", ephemeral=True)
 
 
@@ -21005,13 +21030,14 @@ async def gathemon(interaction: discord.Interaction, user: discord.Member, plant
             await safe_interaction_response(interaction, interaction.followup.send,
                 "❌ A GathéMon game is already in progress in this channel. Wait for it to finish!", ephemeral=False)
             return
-        if challenger_id in user_active_gathemon or opponent_id in user_active_gathemon:
+        if (_reap_orphan(user_active_gathemon, challenger_id, active_gathemon_battles)
+                or _reap_orphan(user_active_gathemon, opponent_id, active_gathemon_battles)):
             await safe_interaction_response(interaction, interaction.followup.send, "❌ You or your opponent is already in a GathéMon battle!", ephemeral=False)
             return
         if get_user_bloom_cycle_plants(challenger_id) < plants:
             await safe_interaction_response(interaction, interaction.followup.send, "❌ You don't have enough plants for this wager!", ephemeral=False)
             return
-        challenge_id = str(uuid.uuid4())[:8]
+        challenge_id = format(next(_gathemon_id_counter), 'x')
         active_gathemon_challenges[challenge_id] = {
             "challenger_id": challenger_id,
             "opponent_id": opponent_id,
@@ -21027,8 +21053,8 @@ async def gathemon(interaction: discord.Interaction, user: discord.Member, plant
         embed.set_footer(text="You have 5 minutes to accept!")
         msg = await interaction.followup.send(embed=embed, view=view, ephemeral=False)
         view.message = msg
-    except Exception as e:
-        print(f"Error in gathemon command: {e}")
+    except Exception:
+        logger.exception("Error in gathemon command")
         await safe_interaction_response(interaction, interaction.followup.send, "❌ An error occurred. Please try again.", ephemeral=False)
 
 
@@ -21070,27 +21096,30 @@ async def gathership(interaction: discord.Interaction, user: discord.Member, bet
             return
 
         bet = normalize_money(bet)
-        host_balance = get_user_balance(host_id)
-        if not can_afford_rounded(normalize_money(host_balance), bet):
-            await safe_interaction_response(interaction, interaction.followup.send, "❌ You don't have enough balance for that bet!", ephemeral=True)
-            return
 
         # One game per channel (mayflower-1 and mayflower-2 can each have one game running at once)
-        if channel_id in channel_gathership and channel_gathership[channel_id] in active_gathership_games:
+        if _reap_orphan(channel_gathership, channel_id, active_gathership_games):
             await safe_interaction_response(interaction, interaction.followup.send, "❌ There's already a Mayflower game in this channel!", ephemeral=True)
             return
-        if host_id in user_active_gathership or opponent_id in user_active_gathership:
+        if (_reap_orphan(user_active_gathership, host_id, active_gathership_games)
+                or _reap_orphan(user_active_gathership, opponent_id, active_gathership_games)):
             await safe_interaction_response(interaction, interaction.followup.send, "❌ You or your opponent is already in a Mayflower game!", ephemeral=True)
             return
 
-        game_id = str(uuid.uuid4())[:8]
+        game_id = format(next(_gathership_game_id_counter), 'x')
         game = GathershipGame(game_id, host_id, host_name, opponent_id, opponent_name, bet, ships, channel_id)
         active_gathership_games[game_id] = game
         user_active_gathership[host_id] = game_id
         channel_gathership[channel_id] = game_id
 
-        new_balance = normalize_money(host_balance - bet)
-        update_user_balance(host_id, new_balance)
+        # Take the host's bet only if affordable; release the slots claimed above if not
+        success, _ = await asyncio.to_thread(atomic_deduct_balance, host_id, bet)
+        if not success:
+            active_gathership_games.pop(game_id, None)
+            user_active_gathership.pop(host_id, None)
+            channel_gathership.pop(channel_id, None)
+            await safe_interaction_response(interaction, interaction.followup.send, "❌ You don't have enough balance for that bet!", ephemeral=True)
+            return
 
         embed = discord.Embed(
             title="⚓ MAYFLOWER ⚓",
@@ -21102,8 +21131,8 @@ async def gathership(interaction: discord.Interaction, user: discord.Member, bet
         embed.set_footer(text="You have 5 minutes to accept!")
         view = GathershipLobbyView(game_id, host_id, opponent_id, timeout=300)
         await safe_interaction_response(interaction, interaction.followup.send, content=user.mention, embed=embed, view=view)
-    except Exception as e:
-        print(f"Error in mayflower command: {e}")
+    except Exception:
+        logger.exception("Error in mayflower command")
         await safe_interaction_response(interaction, interaction.followup.send, "❌ An error occurred. Please try again.", ephemeral=True)
 
 
@@ -21113,39 +21142,54 @@ async def gathership(interaction: discord.Interaction, user: discord.Member, bet
 
 #END
 
-# Cloud Run compatibility - add simple HTTP server
-# Note: threading, time, os already imported at top
-from http.server import HTTPServer, BaseHTTPRequestHandler
-
-class HealthCheckHandler(BaseHTTPRequestHandler):
-    def do_GET(self):
-        if self.path == '/health':
-            self.send_response(200)
-            self.send_header('Content-type', 'text/plain')
-            self.end_headers()
-            self.wfile.write(b'OK')
-        else:
-            self.send_response(404)
-            self.end_headers()
-    
-    def log_message(self, format, *args):
-        # Suppress HTTP server logs
-        pass
+# Cloud Run compatibility - /health endpoint served by aiohttp on the bot's own event loop
+from aiohttp import web
+
+_health_runner: web.AppRunner | None = None
+
 
-def start_http_server():
-    """Start a simple HTTP server for Cloud Run health checks"""
+async def _health_check(request: web.Request) -> web.Response:
+    return web.Response(text="OK")
+
+
+async def start_http_server():
+    """Start the Cloud Run health check server on the running event loop (idempotent)."""
+    global _health_runner
+    if _health_runner is not None:
+        return
     try:
         port = int(os.environ.get('PORT', 8080))
-        server = HTTPServer(('0.0.0.0', port), HealthCheckHandler)
+        app = web.Application()
+        app.router.add_get('/health', _health_check)
+        runner = web.AppRunner(app, access_log=None)
+        await runner.setup()
+        await web.TCPSite(runner, '0.0.0.0', port).start()
+        _health_runner = runner
         print(f"HTTP server listening on port {port}")
-        server.serve_forever()
     except Exception as e:
         print(f"HTTP server error: {e}")
         import traceback
         traceback.print_exc()
-        # Re-raise to prevent silent failures
         raise
 
+
+@bot.event
+async def setup_hook():
+    # Runs once before the gateway connects (unlike on_ready, which fires on every reconnect)
+    if is_production:
+        await start_http_server()
+    else:
+        print("Health check server disabled in development mode")
+    # Claim escrow ownership, then refund buy-ins of roulette games whose owning process is gone.
+    # Other instances may be running games right now, so only owners that stopped heartbeating are refunded.
+    try:
+        await asyncio.to_thread(heartbeat_roulette_escrow_owner)
+        refunded_stakes = await asyncio.to_thread(refund_orphaned_roulette_escrow)
+        if refunded_stakes:
+            print(f"Refunded {refunded_stakes} roulette stake(s) left behind by stopped instances.")
+    except Exception:
+        logger.exception("Error while refunding roulette escrow on startup")
+
 # ==================== /JUMP COMMAND ====================
 
 def _jump_critical_path(guild_id: int, user_id: int, jumps_today: int, today_est: str, now: float) -> dict:
@@ -21369,20 +21413,11 @@ def start_discord_bot():
         print(f"Discord bot error: {e}")
         import traceback
         traceback.print_exc()
-        # Keep the process alive even if bot fails (so HTTP server keeps running)
-        while True:
-            time.sleep(60)
+        # Exit non-zero so the platform restarts us; the /health server lives on the bot's loop,
+        # so a process kept alive here would just sit with nothing listening on the port
+        raise SystemExit(1)
 
 if __name__ == "__main__":
     print("Starting SlashGather Discord Bot...")
-    if is_production:
-        # Start HTTP server as non-daemon so it keeps running
-        http_thread = threading.Thread(target=start_http_server, daemon=False)
-        http_thread.start()
-        # Give the HTTP server time to bind to the port
-        time.sleep(2)
-        print("HTTP health check server started and bound to port")
-    else:
-        print("Health check server disabled in development mode")
-
+    # The /health server (production only) is started from setup_hook on the bot's event loop
     start_discord_bot()
\ No newline at end of file